@@ -7,12 +7,32 @@ from baseball.fetch_game import (get_game_from_url,
                                  get_game_list_from_file_range,
                                  get_game_from_xml_strings,
                                  get_game_from_files,
-                                 get_filename_list)
+                                 get_game_from_files_iterparse,
+                                 get_filename_list,
+                                 update_manifest,
+                                 WorkerPool)
 
 from baseball.process_game_xml import MLB_TEAM_CODE_DICT
 
+from baseball.batch_render import write_svg_batch_from_file_range
+
+from baseball.live_game import (LiveGame,
+                                get_live_game_from_url,
+                                get_live_game_from_xml_strings)
+
+from baseball.serialize_game import save_game, load_game
+
+from baseball.game_cache import enable_game_cache, disable_game_cache
+
+from baseball.http_cache import enable_http_cache, disable_http_cache
+
+from baseball.version import __version__
+
+from baseball.generate_svg import ScorecardRenderCache, write_svg
+
 from baseball.baseball import (PlayerAppearance,
                                Player,
+                               PlayerRegistry,
                                Team,
                                Game,
                                Inning,
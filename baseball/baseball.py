@@ -1,16 +1,15 @@
 from collections import OrderedDict
 from textwrap import TextWrapper
-from re import search, sub, findall, escape
+from re import compile as re_compile, search, sub, findall, escape
 
 from json import dumps
 from pytz import timezone
 
-from baseball.generate_svg import get_game_svg_str
-from baseball.stats import (get_all_pitcher_stats,
-                            get_all_batter_stats,
-                            get_box_score_total,
-                            get_team_stats,
-                            get_half_inning_stats)
+from baseball.baseball_events import Substitution, Switch, RunnerAdvance
+from baseball.generate_svg import get_game_svg_str, write_svg
+from baseball.stats import (get_game_box_score,
+                            get_half_inning_box_score,
+                            get_base_state_list)
 
 
 POSITION_CODE_DICT = {'pitcher': 1,
@@ -60,6 +59,22 @@ PLAY_CODE_ORDERED_DICT = OrderedDict([
     ('choice', 'FC')
 ])
 
+PLAY_CODE_PRIORITY_LIST = list(reversed(PLAY_CODE_ORDERED_DICT.items()))
+
+JR_NAME_SUFFIX_REGEX = re_compile(r' Jr\.(?=\s+[A-Z])')
+SR_NAME_SUFFIX_REGEX = re_compile(r' Sr\.(?=\s+[A-Z])')
+JR_SUFFIX_REGEX = re_compile(r' Jr\.')
+SR_SUFFIX_REGEX = re_compile(r' Sr\.')
+II_SUFFIX_REGEX = re_compile(r' II')
+III_SUFFIX_REGEX = re_compile(r' III')
+IV_SUFFIX_REGEX = re_compile(r' IV')
+ST_ABBREVIATION_REGEX = re_compile(r' St\. ')
+JR_NAME_END_REGEX = re_compile(r' Jr$')
+SR_NAME_END_REGEX = re_compile(r' Sr$')
+II_NAME_END_REGEX = re_compile(r' II$')
+III_NAME_END_REGEX = re_compile(r' III$')
+IV_NAME_END_REGEX = re_compile(r' IV$')
+
 NO_HIT_CODE_LIST = ['K', 'ꓘ', 'BB', 'IBB']
 
 INCREMENT_BASE_DICT = {'1st': '2nd',
@@ -125,21 +140,67 @@ def strip_this_suffix(pattern, suffix, input_str):
 
     return input_str.strip()
 
+def get_play_code(description_str):
+    code = None
+    for keyword, this_code in PLAY_CODE_PRIORITY_LIST:
+        if keyword in description_str:
+            code = this_code
+            break
+
+    return code
+
+def replace_name_suffix(name_suffix_regex, input_str):
+    match = name_suffix_regex.search(input_str)
+    while match:
+        start = match.start()
+        input_str = input_str[:start] + '.' + input_str[match.end():]
+        match = name_suffix_regex.search(
+            input_str, max(start - len(match.group()) + 1, 0)
+        )
+
+    return input_str
+
 def strip_suffixes(input_str):
-    input_str = strip_this_suffix(r' Jr\.\s+[A-Z]', r' Jr\.', input_str)
-    input_str = strip_this_suffix(r' Sr\.\s+[A-Z]', r' Sr\.', input_str)
-    input_str = sub(r' II', '', input_str)
-    input_str = sub(r' III', '', input_str)
-    input_str = sub(r' IV', '', input_str)
-    input_str = sub(r' St\. ', ' St ', input_str)
+    input_str = JR_SUFFIX_REGEX.sub(
+        '', replace_name_suffix(JR_NAME_SUFFIX_REGEX, input_str)
+    ).strip()
+
+    input_str = SR_SUFFIX_REGEX.sub(
+        '', replace_name_suffix(SR_NAME_SUFFIX_REGEX, input_str)
+    ).strip()
+
+    input_str = II_SUFFIX_REGEX.sub('', input_str)
+    input_str = III_SUFFIX_REGEX.sub('', input_str)
+    input_str = IV_SUFFIX_REGEX.sub('', input_str)
+    input_str = ST_ABBREVIATION_REGEX.sub(' St ', input_str)
 
     return input_str
 
+def get_initial_plus_last_name(player_name):
+    player_name = JR_NAME_END_REGEX.sub('', player_name.strip(' .'))
+    player_name = SR_NAME_END_REGEX.sub('', player_name.strip(' .'))
+    player_name = II_NAME_END_REGEX.sub('', player_name.strip())
+    player_name = III_NAME_END_REGEX.sub('', player_name.strip())
+    player_name = IV_NAME_END_REGEX.sub('', player_name.strip())
+    player_name = strip_suffixes(player_name.strip())
+
+    return player_name[0] + player_name.split()[-1]
+
 
 class PlayerAppearance(object):
+    __slots__ = ('player_obj', 'player_stats', 'position', 'start_inning_num',
+                 'start_inning_half', 'start_inning_batter_num',
+                 'end_inning_num', 'end_inning_half', 'end_inning_batter_num',
+                 'pitcher_credit_code')
+
     def __init__(self, player_obj, position, start_inning_num,
-                 start_inning_half, start_inning_batter_num):
+                 start_inning_half, start_inning_batter_num,
+                 player_stats=None):
+        if player_stats is None:
+            player_stats = player_obj
+
         self.player_obj = player_obj
+        self.player_stats = player_stats
         self.position = position
         self.start_inning_num = start_inning_num
         self.start_inning_half = start_inning_half
@@ -151,8 +212,11 @@ class PlayerAppearance(object):
         self.pitcher_credit_code = None
 
     def _asdict(self):
+        player_dict = self.player_obj._asdict()
+        player_dict.update(self.player_stats.stats_dict())
+
         return (
-            {'player_obj': self.player_obj._asdict(),
+            {'player_obj': player_dict,
              'position': self.position,
              'start_inning_num': self.start_inning_num,
              'start_inning_half': self.start_inning_half,
@@ -167,17 +231,19 @@ class PlayerAppearance(object):
         start_inning_str = '{}-{}'.format(self.start_inning_num,
                                           self.start_inning_half,)
 
-        return_str = '{}\n'.format(str(self.player_obj))
+        return_str = '{}\n'.format(
+            self.player_obj.get_display_str(self.player_stats)
+        )
 
-        if self.player_obj.era is not None:
-            return_str += '    {}\n'.format(self.player_obj.pitching_stats())
+        if self.player_stats.era is not None:
+            return_str += '    {}\n'.format(self.player_stats.pitching_stats())
 
         return_str += (
             '    {}\n'
             '    Entered:     {:12} before batter #{}'
             '    (position {})\n'
         ).format(
-            self.player_obj.hitting_stats(),
+            self.player_stats.hitting_stats(),
             start_inning_str,
             self.start_inning_batter_num,
             self.position
@@ -197,17 +263,38 @@ class PlayerAppearance(object):
         return return_str
 
 
-class Player(object):
-    def __init__(self, last_name, first_name, mlb_id, obp, slg, number):
-        self.last_name = last_name
-        self.first_name = first_name
-        self.mlb_id = mlb_id
+class PlayerStats(object):
+    def __init__(self, obp, slg, number=None):
         self.obp = obp
         self.slg = slg
         self.number = number
 
         self.era = None
 
+    def stats_dict(self):
+        return {'obp': self.obp, 'slg': self.slg, 'number': self.number,
+                'era': self.era}
+
+    def hitting_stats(self):
+        if self.obp and self.slg:
+            return_str = 'OBP: {}   SLG: {}'.format('%.3f' % self.obp,
+                                                    '%.3f' % self.slg)
+        else:
+            return_str = ''
+
+        return return_str
+
+    def pitching_stats(self):
+        return 'ERA: {}'.format('%.2f' % self.era)
+
+
+class Player(PlayerStats):
+    def __init__(self, last_name, first_name, mlb_id, obp, slg, number):
+        PlayerStats.__init__(self, obp, slg, number)
+        self.last_name = last_name
+        self.first_name = first_name
+        self.mlb_id = mlb_id
+
     def _asdict(self):
         return (
             {'last_name': self.last_name,
@@ -222,22 +309,13 @@ class Player(object):
     def full_name(self):
         return '{} {}'.format(self.first_name, self.last_name)
 
-    def hitting_stats(self):
-        if self.obp and self.slg:
-            return_str = 'OBP: {}   SLG: {}'.format('%.3f' % self.obp,
-                                                    '%.3f' % self.slg)
-        else:
-            return_str = ''
-
-        return return_str
+    def get_display_str(self, player_stats=None):
+        if player_stats is None:
+            player_stats = self
 
-    def pitching_stats(self):
-        return 'ERA: {}'.format('%.2f' % self.era)
-
-    def __repr__(self):
         return_str = ''
-        if self.number is not None:
-            return_str += '{:2} '.format(self.number)
+        if player_stats.number is not None:
+            return_str += '{:2} '.format(player_stats.number)
         else:
             return_str += '   '
 
@@ -245,6 +323,25 @@ class Player(object):
 
         return return_str
 
+    def __repr__(self):
+        return self.get_display_str()
+
+
+class PlayerRegistry(object):
+    def __init__(self):
+        self.player_dict = {}
+
+    def __len__(self):
+        return len(self.player_dict)
+
+    def get_player(self, last_name, first_name, mlb_id):
+        player_key = (mlb_id, last_name, first_name)
+        if player_key not in self.player_dict:
+            self.player_dict[player_key] = Player(last_name, first_name,
+                                                  mlb_id, None, None, None)
+
+        return self.player_dict[player_key]
+
 
 class Team(object):
     def __init__(self, name, abbreviation):
@@ -256,6 +353,8 @@ class Team(object):
         self.player_id_dict = {}
         self.player_name_dict = {}
         self.player_last_name_dict = {}
+        self.player_query_dict = {}
+        self.player_stats_dict = {}
 
     def _asdict(self):
         return (
@@ -275,19 +374,14 @@ class Team(object):
             player_name = player_key
             if player_name in self.player_name_dict:
                 player = self.player_name_dict[player_name]
+            elif player_name in self.player_query_dict:
+                player = self.player_query_dict[player_name]
             else:
-                player_name = sub(r' Jr$', '', player_name.strip(' .'))
-                player_name = sub(r' Sr$', '', player_name.strip(' .'))
-                player_name = sub(r' II$', '', player_name.strip())
-                player_name = sub(r' III$', '', player_name.strip())
-                player_name = sub(r' IV$', '', player_name.strip())
-
-                player_name = strip_suffixes(player_name.strip())
-                first_name_initial = player_name[0]
-                last_name = player_name.split()[-1]
-
-                initial_plus_last_name = first_name_initial + last_name
-                player = self.player_last_name_dict.get(initial_plus_last_name)
+                player = self.player_last_name_dict.get(
+                    get_initial_plus_last_name(player_name)
+                )
+
+                self.player_query_dict[player_name] = player
         else:
             raise ValueError(
                 'Player key: {player_key} must be either int or str'.format(
@@ -297,22 +391,31 @@ class Team(object):
 
         return player
 
-    def append(self, player):
-        last_name = sub(
-            r' Jr$', '', player.last_name.strip('. ').replace(',', '')
+    def get_player_stats(self, player):
+        return self.player_stats_dict.get(player, player)
+
+    def append(self, player, player_stats=None):
+        last_name = JR_NAME_END_REGEX.sub(
+            '', player.last_name.strip('. ').replace(',', '')
+        )
+
+        last_name = SR_NAME_END_REGEX.sub(
+            '', last_name.strip('. ').replace(',', '')
         )
 
-        last_name = sub(r' Sr$', '', last_name.strip('. ').replace(',', ''))
-        last_name = sub(r' II$', '', last_name.strip())
-        last_name = sub(r' III$', '', last_name.strip())
-        last_name = sub(r' IV$', '', last_name.strip())
-        last_name = sub(r' St\. ', ' St ', last_name.strip())
+        last_name = II_NAME_END_REGEX.sub('', last_name.strip())
+        last_name = III_NAME_END_REGEX.sub('', last_name.strip())
+        last_name = IV_NAME_END_REGEX.sub('', last_name.strip())
+        last_name = ST_ABBREVIATION_REGEX.sub(' St ', last_name.strip())
         if ' ' in last_name:
             last_name = last_name.split()[1]
 
         self.player_id_dict[player.mlb_id] = player
         self.player_name_dict[player.full_name()] = player
         self.player_last_name_dict[player.first_name[0] + last_name] = player
+        self.player_query_dict.clear()
+        if player_stats is not None:
+            self.player_stats_dict[player] = player_stats
 
     def __contains__(self, player_key):
         return bool(self.find_player(player_key))
@@ -366,12 +469,7 @@ class Game(object):
         self.end_datetime = end_datetime
         self.inning_list = inning_list or []
 
-        self.away_batter_box_score_dict = None
-        self.home_batter_box_score_dict = None
-        self.away_pitcher_box_score_dict = None
-        self.home_pitcher_box_score_dict = None
-        self.away_team_stats = None
-        self.home_team_stats = None
+        self.game_box_score = None
         self.start_str = ''
         self.end_str = ''
 
@@ -420,8 +518,11 @@ class Game(object):
              'end_str': self.end_str}
         )
 
-    def get_svg_str(self):
-        return get_game_svg_str(self)
+    def get_svg_str(self, render_cache=None):
+        return get_game_svg_str(self, render_cache)
+
+    def write_svg(self, filehandle, render_cache=None):
+        write_svg(self, filehandle, render_cache)
 
     def set_gametimes(self):
         if self.inning_list[0].top_half_appearance_list:
@@ -467,45 +568,47 @@ class Game(object):
         else:
             self.end_str = ''
 
-    def set_pitching_box_score_dict(self):
-        self.away_pitcher_box_score_dict = OrderedDict([])
-        self.home_pitcher_box_score_dict = OrderedDict([])
-
-        tuple_list = [
-            (self.away_pitcher_box_score_dict, self.away_team, 'bottom'),
-            (self.home_pitcher_box_score_dict, self.home_team, 'top'),
-        ]
-
-        for box_score_dict, team, inning_half_str in tuple_list:
-            for pitcher_appearance in team.pitcher_list:
-                pitcher = pitcher_appearance.player_obj
-                box_score_dict[pitcher] = (
-                    get_all_pitcher_stats(self, team, pitcher, inning_half_str)
-                )
+    def get_game_box_score(self):
+        if self.game_box_score is None:
+            self.game_box_score = get_game_box_score(self)
 
-    def set_batting_box_score_dict(self):
-        self.away_batter_box_score_dict = OrderedDict([])
-        self.home_batter_box_score_dict = OrderedDict([])
+        return self.game_box_score
+
+    @property
+    def away_batter_box_score_dict(self):
+        return self.get_game_box_score().away_batter_box_score_dict
+
+    @property
+    def home_batter_box_score_dict(self):
+        return self.get_game_box_score().home_batter_box_score_dict
+
+    @property
+    def away_pitcher_box_score_dict(self):
+        return self.get_game_box_score().away_pitcher_box_score_dict
 
-        tuple_list = [
-            (self.away_batter_box_score_dict, self.away_team, 'top'),
-            (self.home_batter_box_score_dict, self.home_team, 'bottom'),
-        ]
+    @property
+    def home_pitcher_box_score_dict(self):
+        return self.get_game_box_score().home_pitcher_box_score_dict
 
-        for box_score_dict, team, inning_half_str in tuple_list:
-            for batting_order_list in team.batting_order_list_list:
-                for batter_appearance in batting_order_list:
-                    batter = batter_appearance.player_obj
-                    if batter not in box_score_dict:
-                        box_score_dict[batter] = (
-                            get_all_batter_stats(self, batter, inning_half_str)
-                        )
+    @property
+    def away_team_stats(self):
+        return self.get_game_box_score().away_team_stats
 
-            box_score_dict['TOTAL'] = get_box_score_total(box_score_dict)
+    @property
+    def home_team_stats(self):
+        return self.get_game_box_score().home_team_stats
+
+    def set_box_scores(self):
+        self.game_box_score = None
+
+    def set_pitching_box_score_dict(self):
+        self.set_box_scores()
+
+    def set_batting_box_score_dict(self):
+        self.set_box_scores()
 
     def set_team_stats(self):
-        self.away_team_stats = get_team_stats(self, 'top')
-        self.home_team_stats = get_team_stats(self, 'bottom')
+        self.set_box_scores()
 
     def __repr__(self):
         return_str = '{}\n'.format(self.location)
@@ -514,13 +617,16 @@ class Game(object):
         else:
             return_str += '{}\n\n'.format(self.game_date_str)
 
-        dict_list = [self.away_batter_box_score_dict,
-                     self.away_pitcher_box_score_dict,
-                     self.home_batter_box_score_dict,
-                     self.home_pitcher_box_score_dict]
+        dict_team_list = [(self.away_batter_box_score_dict, self.away_team),
+                          (self.away_pitcher_box_score_dict, self.away_team),
+                          (self.home_batter_box_score_dict, self.home_team),
+                          (self.home_pitcher_box_score_dict, self.home_team)]
 
-        for this_dict in dict_list:
+        for this_dict, team in dict_team_list:
             for name, tup in this_dict.items():
+                if isinstance(name, Player):
+                    name = name.get_display_str(team.get_player_stats(name))
+
                 return_str += '{!s:20s} {}\n'.format(name, str(tup))
 
             return_str += '\n'
@@ -551,15 +657,64 @@ class Game(object):
         return return_str
 
 
+class SlotCachedProperty(object):
+    def __init__(self, function):
+        self.function = function
+        self.slot = None
+
+    def __set_name__(self, owner, name):
+        self.slot = owner.__dict__['_' + name]
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        try:
+            value = self.slot.__get__(instance, owner)
+        except AttributeError:
+            value = self.function(instance)
+            self.slot.__set__(instance, value)
+
+        return value
+
+    def __set__(self, instance, value):
+        self.slot.__set__(instance, value)
+
+
 class Inning(object):
+    __slots__ = ('top_half_appearance_list', 'bottom_half_appearance_list',
+                 '_top_half_base_state_list', '_bottom_half_base_state_list',
+                 '_top_half_box_score', '_bottom_half_box_score')
+
     def __init__(self, top_half_appearance_list, bottom_half_appearance_list):
         self.top_half_appearance_list = top_half_appearance_list
         self.bottom_half_appearance_list = bottom_half_appearance_list
-        (self.top_half_inning_stats,
-         self.bottom_half_inning_stats) = (
-             get_half_inning_stats(top_half_appearance_list,
-                                   bottom_half_appearance_list)
-         )
+
+    @SlotCachedProperty
+    def top_half_base_state_list(self):
+        return get_base_state_list(self.top_half_appearance_list)
+
+    @SlotCachedProperty
+    def bottom_half_base_state_list(self):
+        return get_base_state_list(self.bottom_half_appearance_list)
+
+    @SlotCachedProperty
+    def top_half_box_score(self):
+        return get_half_inning_box_score(self.top_half_appearance_list,
+                                         self.top_half_base_state_list)
+
+    @SlotCachedProperty
+    def bottom_half_box_score(self):
+        return get_half_inning_box_score(self.bottom_half_appearance_list,
+                                         self.bottom_half_base_state_list)
+
+    @property
+    def top_half_inning_stats(self):
+        return self.top_half_box_score.inning_stats
+
+    @property
+    def bottom_half_inning_stats(self):
+        return self.bottom_half_box_score.inning_stats
 
     def _asdict(self):
         if self.bottom_half_appearance_list:
@@ -593,13 +748,22 @@ class Inning(object):
 
 
 class PlateAppearance(object):
+    __slots__ = ('start_datetime', 'end_datetime', 'batting_team',
+                 'event_list', 'plate_appearance_description',
+                 'plate_appearance_summary', 'pitcher', 'batter',
+                 'inning_outs', 'scoring_runners_list',
+                 'runners_batted_in_list', '_out_runners_list',
+                 '_got_on_base', '_scorecard_summary', '_throws_str_tuple',
+                 '_hit_location', '_play_str', '_error_str', 'fielding_team')
+
     def __init__(self, start_datetime, end_datetime, batting_team,
                  plate_appearance_description, plate_appearance_summary,
                  pitcher, batter, inning_outs, scoring_runners_list,
-                 runners_batted_in_list, event_list):
+                 runners_batted_in_list, event_list, fielding_team=None):
         self.start_datetime = start_datetime
         self.end_datetime = end_datetime
         self.batting_team = batting_team
+        self.fielding_team = fielding_team
         self.event_list = event_list or []
         self.plate_appearance_description = plate_appearance_description
         self.plate_appearance_summary = plate_appearance_summary
@@ -608,16 +772,26 @@ class PlateAppearance(object):
         self.inning_outs = inning_outs
         self.scoring_runners_list = scoring_runners_list
         self.runners_batted_in_list = runners_batted_in_list
-        self.out_runners_list = self.get_out_runners_list(
-            self.plate_appearance_description,
-            self.batting_team
-        )
 
-        self.hit_location = self.get_hit_location()
-        self.error_str = self.get_error_str()
-        (self.got_on_base,
+    @SlotCachedProperty
+    def out_runners_list(self):
+        return self.get_out_runners_list(self.plate_appearance_description,
+                                         self.batting_team)
+
+    @SlotCachedProperty
+    def got_on_base(self):
+        (got_on_base,
          self.scorecard_summary) = self.get_on_base_and_summary()
 
+        return got_on_base
+
+    @SlotCachedProperty
+    def scorecard_summary(self):
+        (self.got_on_base,
+         scorecard_summary) = self.get_on_base_and_summary()
+
+        return scorecard_summary
+
     def _asdict(self):
         return (
             {'start_datetime': str(self.start_datetime),
@@ -756,7 +930,8 @@ class PlateAppearance(object):
 
         return runner_tuple_list
 
-    def get_throws_str(self):
+    @SlotCachedProperty
+    def throws_str_tuple(self):
         description_str = strip_suffixes(self.plate_appearance_description)
         suffix_str = ''
 
@@ -778,6 +953,9 @@ class PlateAppearance(object):
 
         return defense_str, defense_suffix
 
+    def get_throws_str(self):
+        return self.throws_str_tuple
+
     def get_hit_location(self):
         play_str = self.get_play_str()
         throws_str, _ = self.get_throws_str()
@@ -789,16 +967,15 @@ class PlateAppearance(object):
 
         return hit_location
 
-    def get_play_str(self):
+    hit_location = SlotCachedProperty(get_hit_location)
+
+    @SlotCachedProperty
+    def play_str(self):
         description_str = strip_suffixes(self.plate_appearance_description)
         if '. ' in description_str:
             description_str = description_str.split('. ')[0]
 
-        code = None
-        for keyword, this_code in PLAY_CODE_ORDERED_DICT.items():
-            if keyword in description_str:
-                code = this_code
-
+        code = get_play_code(description_str)
         if self.plate_appearance_summary == 'Fan interference':
             code = 'FI'
 
@@ -821,6 +998,9 @@ class PlateAppearance(object):
 
         return code
 
+    def get_play_str(self):
+        return self.play_str
+
     def get_error_str(self):
         error_str = None
         if 'error' in self.plate_appearance_description:
@@ -834,6 +1014,8 @@ class PlateAppearance(object):
 
         return error_str
 
+    error_str = SlotCachedProperty(get_error_str)
+
     def get_on_base_and_summary(self):
         throws_str, suffix_str = self.get_throws_str()
         if self.plate_appearance_summary in ON_BASE_SUMMARY_DICT:
@@ -850,6 +1032,13 @@ class PlateAppearance(object):
 
         return on_base, scorecard_summary
 
+    def get_player_display_str(self, player):
+        player_stats = self.batting_team.get_player_stats(player)
+        if player_stats is player and self.fielding_team:
+            player_stats = self.fielding_team.get_player_stats(player)
+
+        return player.get_display_str(player_stats)
+
     def __repr__(self):
         wrapper = TextWrapper(width=80, subsequent_indent=' '*17)
 
@@ -857,6 +1046,25 @@ class PlateAppearance(object):
             self.plate_appearance_description
         )
 
+        batter_str = self.get_player_display_str(self.batter)
+
+        pitcher_str = self.get_player_display_str(self.pitcher)
+
+        out_runners_str = '[{}]'.format(', '.join(
+            '({}, {!r})'.format(self.get_player_display_str(runner), base)
+            for runner, base in self.out_runners_list
+        ))
+
+        scoring_runners_str = '[{}]'.format(', '.join(
+            self.get_player_display_str(runner)
+            for runner in self.scoring_runners_list
+        ))
+
+        runners_batted_in_str = '[{}]'.format(', '.join(
+            self.get_player_display_str(runner)
+            for runner in self.runners_batted_in_list
+        ))
+
         return_str = ('\n'
                       ' Scorecard:      {}\n'
                       ' Hit location:   {}\n'
@@ -872,18 +1080,23 @@ class PlateAppearance(object):
                       '{}\n'
                       ' Events:\n').format(self.scorecard_summary,
                                            self.hit_location,
-                                           self.pitcher,
-                                           self.batter,
+                                           pitcher_str,
+                                           batter_str,
                                            self.got_on_base,
                                            self.error_str,
-                                           self.out_runners_list,
-                                           self.scoring_runners_list,
-                                           self.runners_batted_in_list,
+                                           out_runners_str,
+                                           scoring_runners_str,
+                                           runners_batted_in_str,
                                            self.inning_outs,
                                            self.plate_appearance_summary,
                                            wrapper.fill(description_str))
 
         for event in self.event_list:
-            return_str += '     {}\n'.format(event)
+            if isinstance(event, (Substitution, Switch, RunnerAdvance)):
+                event_str = event.get_display_str(self.get_player_display_str)
+            else:
+                event_str = str(event)
+
+            return_str += '     {}\n'.format(event_str)
 
         return return_str
@@ -2,6 +2,9 @@ AUTOMATIC_BALL_POSITION = (1.0, 1.0)
 
 
 class Substitution(object):
+    __slots__ = ('substitution_datetime', 'incoming_player', 'outgoing_player',
+                 'batting_order', 'position')
+
     def __init__(self, substitution_datetime, incoming_player, outgoing_player,
                  batting_order, position):
         self.substitution_datetime = substitution_datetime
@@ -19,8 +22,8 @@ class Substitution(object):
              'position': self.position}
         )
 
-    def __repr__(self):
-        incoming_player_name = str(self.incoming_player)
+    def get_display_str(self, player_str_function=str):
+        incoming_player_name = player_str_function(self.incoming_player)
 
         if self.batting_order:
             batting_str = 'Batting {}'.format(self.batting_order)
@@ -45,13 +48,19 @@ class Substitution(object):
         if summary_str:
             return_str = '{:48}  {}'.format(
                 return_str,
-                'OUT: ' + str(self.outgoing_player)
+                'OUT: ' + player_str_function(self.outgoing_player)
             )
 
         return return_str
 
+    def __repr__(self):
+        return self.get_display_str()
+
 
 class Switch(object):
+    __slots__ = ('switch_datetime', 'player', 'old_position_num',
+                 'new_position_num', 'new_batting_order')
+
     def __init__(self, switch_datetime, player, old_position_num,
                  new_position_num, new_batting_order):
         self.switch_datetime = switch_datetime
@@ -69,7 +78,7 @@ class Switch(object):
              'new_batting_order': self.new_batting_order}
         )
 
-    def __repr__(self):
+    def get_display_str(self, player_str_function=str):
         position_str = (
             '(from position {} to position {}'
         ).format(
@@ -85,14 +94,20 @@ class Switch(object):
         return_str = (
             '- SWITCH: {:31} {:>32}'
         ).format(
-            str(self.player),
+            player_str_function(self.player),
             position_str
         )
 
         return return_str
 
+    def __repr__(self):
+        return self.get_display_str()
+
 
 class Pitch(object):
+    __slots__ = ('pitch_datetime', 'pitch_description', 'pitch_type',
+                 'pitch_speed', 'pitch_position')
+
     def __init__(self, pitch_datetime, pitch_description, pitch_type,
                  pitch_speed, pitch_position):
         self.pitch_datetime = pitch_datetime
@@ -131,6 +146,9 @@ class Pitch(object):
 
 
 class Pickoff(object):
+    __slots__ = ('pickoff_description', 'pickoff_base',
+                 'pickoff_was_successful')
+
     def __init__(self, pickoff_description, pickoff_base,
                  pickoff_was_successful):
         self.pickoff_description = pickoff_description
@@ -138,7 +156,11 @@ class Pickoff(object):
         self.pickoff_was_successful = pickoff_was_successful
 
     def _asdict(self):
-        return self.__dict__
+        return (
+            {'pickoff_description': self.pickoff_description,
+             'pickoff_base': self.pickoff_base,
+             'pickoff_was_successful': self.pickoff_was_successful}
+        )
 
     def __repr__(self):
         if self.pickoff_was_successful:
@@ -157,6 +179,9 @@ class Pickoff(object):
 
 
 class RunnerAdvance(object):
+    __slots__ = ('run_description', 'runner', 'start_base', 'end_base',
+                 'runner_scored', 'run_earned', 'is_rbi')
+
     def __init__(self, run_description, runner, start_base, end_base,
                  runner_scored, run_earned, is_rbi):
         self.run_description = run_description
@@ -177,7 +202,7 @@ class RunnerAdvance(object):
              'run_earned': self.run_earned,
              'is_rbi': self.is_rbi}
         )
-    def __repr__(self):
+    def get_display_str(self, player_str_function=str):
         score_str = ''
         if self.runner_scored:
             score_str += '(Scored'
@@ -192,7 +217,7 @@ class RunnerAdvance(object):
             score_str += ')'
 
         return_str = '- {:21} {:19} {:2}--->{:2} {:>21}'.format(
-            str(self.runner) + ':',
+            player_str_function(self.runner) + ':',
             self.run_description,
             self.start_base,
             self.end_base,
@@ -200,3 +225,6 @@ class RunnerAdvance(object):
         )
 
         return return_str
+
+    def __repr__(self):
+        return self.get_display_str()
@@ -0,0 +1,404 @@
+from collections import namedtuple
+from json import dump, dumps, load
+from os import makedirs, replace, stat
+from os.path import abspath, exists, isfile, join
+from time import perf_counter
+from traceback import format_exc
+from xml.etree.ElementTree import fromstring
+
+from baseball.cache_dir import get_source_version
+from baseball.fetch_game import (DEFAULT_COMPRESSLEVEL,
+                                 SVG_FORMAT_LIST,
+                                 WorkerPool,
+                                 get_archive_filename_list,
+                                 get_archive_handle,
+                                 get_filename_list,
+                                 is_archive,
+                                 write_svg_fragments_and_html)
+from baseball.generate_svg import get_game_svg_generator
+from baseball.process_game_xml import finalize_game, process_game_obj
+
+
+STAGE_LIST = ['read', 'parse', 'stats', 'render', 'write']
+ERROR_LOG_FILENAME = 'render_errors.jsonl'
+RENDER_CHUNKS_PER_PROCESS = 4
+RENDER_MANIFEST_FILENAME = 'render_manifest.json'
+RENDER_MANIFEST_VERSION = 1
+RENDER_MANIFEST_SAVE_INTERVAL = 64
+RENDERER_MODULE_LIST = ['baseball', 'baseball_events', 'fetch_game',
+                        'generate_svg', 'process_game_xml', 'stats']
+
+GAME_WRITTEN = 'written'
+GAME_MISSING = 'missing'
+GAME_FAILED = 'failed'
+
+RenderResult = namedtuple(
+    'RenderResult',
+    'game_id status stage_seconds_dict error_tuple'
+)
+
+RenderSummary = namedtuple(
+    'RenderSummary',
+    'game_count written_count skipped_count missing_count failed_count '
+    'stage_count_dict stage_error_count_dict stage_seconds_dict '
+    'elapsed_seconds error_log_path'
+)
+
+
+class RenderManifest(object):
+    def __init__(self, output_path, svg_format, compresslevel,
+                 renderer_version=None):
+        if renderer_version is None:
+            renderer_version = get_renderer_version()
+
+        self.output_path = output_path
+        self.manifest_path = join(output_path, RENDER_MANIFEST_FILENAME)
+        self.render_key = [renderer_version, svg_format, compresslevel]
+        self.svg_format = svg_format
+        self.game_dict = {}
+        self.unsaved_count = 0
+        if isfile(self.manifest_path):
+            with open(self.manifest_path, 'r', encoding='utf-8') as filehandle:
+                manifest = load(filehandle)
+
+            if manifest.get('version') == RENDER_MANIFEST_VERSION:
+                self.game_dict = manifest['game_dict']
+
+    def __len__(self):
+        return len(self.game_dict)
+
+    def is_current(self, game_id, source_fingerprint):
+        game_entry = self.game_dict.get(game_id)
+
+        return bool(
+            game_entry and
+            game_entry['source'] == source_fingerprint and
+            game_entry['render_key'] == self.render_key and
+            all(isfile(join(self.output_path, x))
+                for x in game_entry['output_list'])
+        )
+
+    def update(self, game_id, source_fingerprint):
+        self.game_dict[game_id] = {
+            'source': source_fingerprint,
+            'render_key': self.render_key,
+            'output_list': get_output_filename_list(game_id, self.svg_format)
+        }
+
+        self.unsaved_count += 1
+        if self.unsaved_count >= RENDER_MANIFEST_SAVE_INTERVAL:
+            self.save()
+
+    def save(self):
+        temp_path = self.manifest_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as filehandle:
+            dump({'version': RENDER_MANIFEST_VERSION,
+                  'game_dict': self.game_dict},
+                 filehandle)
+
+        replace(temp_path, self.manifest_path)
+        self.unsaved_count = 0
+
+
+def get_renderer_version():
+    return get_source_version(RENDERER_MODULE_LIST)
+
+def get_output_filename_list(game_id, svg_format):
+    if svg_format == 'svgz':
+        output_filename_list = [game_id + '.svgz', game_id + '.html']
+    elif svg_format == 'svg.gz':
+        output_filename_list = [game_id + '.svg', game_id + '.svg.gz',
+                                game_id + '.html', game_id + '.html.gz']
+    else:
+        output_filename_list = [game_id + '.svg', game_id + '.html']
+
+    return output_filename_list
+
+def get_source_fingerprint_from_filename_tuple(filename_tuple):
+    source_fingerprint = []
+    for filename in filename_tuple[1:]:
+        try:
+            file_stat = stat(filename)
+        except OSError:
+            source_fingerprint.append(None)
+        else:
+            source_fingerprint.append([file_stat.st_size,
+                                       file_stat.st_mtime_ns])
+
+    return source_fingerprint
+
+def get_source_fingerprint_from_archive_tuple(archive_tuple):
+    archive = get_archive_handle(archive_tuple[1])
+    source_fingerprint = []
+    for member_name in archive_tuple[2:]:
+        if member_name:
+            member_info = archive.getinfo(member_name)
+            source_fingerprint.append([member_info.file_size,
+                                       member_info.CRC])
+        else:
+            source_fingerprint.append(None)
+
+    return source_fingerprint
+
+def read_files_from_filename_tuple(filename_tuple):
+    _, boxscore_file, player_file, inning_file = filename_tuple
+    raw_xml_list = None
+    if isfile(boxscore_file) and isfile(player_file) and isfile(inning_file):
+        raw_xml_list = []
+        for filename in [boxscore_file, player_file, inning_file]:
+            with open(filename, 'rb') as filehandle:
+                raw_xml_list.append(filehandle.read())
+
+    return raw_xml_list
+
+def read_files_from_archive_tuple(archive_tuple):
+    _, archive_path, boxscore_member, player_member, inning_member = (
+        archive_tuple
+    )
+
+    raw_xml_list = None
+    if boxscore_member and player_member and inning_member:
+        archive = get_archive_handle(archive_path)
+        raw_xml_list = [archive.read(x)
+                        for x in [boxscore_member, player_member,
+                                  inning_member]]
+
+    return raw_xml_list
+
+def parse_raw_xml_list(raw_xml_list):
+    boxscore_raw_xml, players_raw_xml, inning_raw_xml = raw_xml_list
+
+    return process_game_obj(fromstring(boxscore_raw_xml),
+                            fromstring(players_raw_xml),
+                            fromstring(inning_raw_xml))
+
+def run_stage(stage_seconds_dict, stage, function, *args):
+    start_time = perf_counter()
+    result = function(*args)
+    stage_seconds_dict[stage] = perf_counter() - start_time
+
+    return result
+
+def compute_game_stats(game, away_pitcher_status_dict,
+                       home_pitcher_status_dict):
+    finalize_game(game, away_pitcher_status_dict, home_pitcher_status_dict)
+    game.get_game_box_score()
+    for inning in game.inning_list:
+        inning.top_half_base_state_list
+        inning.bottom_half_base_state_list
+        inning.top_half_box_score
+        inning.bottom_half_box_score
+        for plate_appearance in (inning.top_half_appearance_list +
+                                 inning.bottom_half_appearance_list):
+            plate_appearance.out_runners_list
+            plate_appearance.scorecard_summary
+            plate_appearance.hit_location
+            plate_appearance.error_str
+
+def get_timed_svg_generator(stage_seconds_dict, svg_fragment_iterable,
+                            failed_stage_list):
+    svg_fragment_iterator = iter(svg_fragment_iterable)
+    while True:
+        start_time = perf_counter()
+        try:
+            svg_fragment = next(svg_fragment_iterator)
+        except StopIteration:
+            break
+        except Exception:
+            failed_stage_list.append('render')
+            del stage_seconds_dict['render']
+            raise
+        finally:
+            if 'render' in stage_seconds_dict:
+                stage_seconds_dict['render'] += perf_counter() - start_time
+
+        yield svg_fragment
+
+def render_game(render_task_tuple):
+    (read_function,
+     input_tuple,
+     output_path,
+     svg_format,
+     compresslevel) = render_task_tuple
+
+    game_id = input_tuple[0]
+    stage_seconds_dict = {}
+    failed_stage_list = []
+    error_tuple = None
+    stage = 'read'
+    try:
+        raw_xml_list = run_stage(stage_seconds_dict, stage, read_function,
+                                 input_tuple)
+
+        if raw_xml_list is None:
+            status = GAME_MISSING
+        else:
+            stage = 'parse'
+            (game,
+             away_pitcher_status_dict,
+             home_pitcher_status_dict) = run_stage(stage_seconds_dict,
+                                                   stage,
+                                                   parse_raw_xml_list,
+                                                   raw_xml_list)
+
+            stage = 'stats'
+            run_stage(stage_seconds_dict, stage, compute_game_stats, game,
+                      away_pitcher_status_dict, home_pitcher_status_dict)
+
+            stage = 'write'
+            stage_seconds_dict['render'] = 0.0
+            svg_generator = get_timed_svg_generator(
+                stage_seconds_dict, get_game_svg_generator(game),
+                failed_stage_list
+            )
+
+            run_stage(stage_seconds_dict, stage,
+                      write_svg_fragments_and_html, game_id, svg_generator,
+                      output_path, svg_format, compresslevel)
+
+            stage_seconds_dict['write'] -= stage_seconds_dict['render']
+
+            status = GAME_WRITTEN
+    except Exception as exc:
+        status = GAME_FAILED
+        failed_stage_list.append(stage)
+        error_tuple = (failed_stage_list[0],
+                       type(exc).__name__,
+                       str(exc),
+                       format_exc())
+
+    return RenderResult(game_id, status, stage_seconds_dict, error_tuple)
+
+def get_error_record(render_result):
+    stage, exception_type, exception_str, traceback_str = (
+        render_result.error_tuple
+    )
+
+    return {'game_id': render_result.game_id,
+            'stage': stage,
+            'exception_type': exception_type,
+            'exception': exception_str,
+            'traceback': traceback_str}
+
+def get_render_result_iterable(worker_pool, render_task_tuple_list):
+    chunksize = max(1, len(render_task_tuple_list) //
+                    (worker_pool.num_processes * RENDER_CHUNKS_PER_PROCESS))
+
+    return worker_pool.imap_unordered(render_game, render_task_tuple_list,
+                                      chunksize)
+
+def get_render_summary(render_result_iterable, error_filehandle, start_time,
+                       render_manifest, source_fingerprint_dict,
+                       skipped_count):
+    status_count_dict = {x: 0 for x in [GAME_WRITTEN, GAME_MISSING,
+                                        GAME_FAILED]}
+
+    stage_count_dict = {x: 0 for x in STAGE_LIST}
+    stage_error_count_dict = {x: 0 for x in STAGE_LIST}
+    stage_seconds_dict = {x: 0.0 for x in STAGE_LIST}
+    for render_result in render_result_iterable:
+        status_count_dict[render_result.status] += 1
+        if render_result.status == GAME_WRITTEN:
+            render_manifest.update(
+                render_result.game_id,
+                source_fingerprint_dict[render_result.game_id]
+            )
+        for stage, stage_seconds in render_result.stage_seconds_dict.items():
+            stage_count_dict[stage] += 1
+            stage_seconds_dict[stage] += stage_seconds
+
+        if render_result.error_tuple:
+            stage_error_count_dict[render_result.error_tuple[0]] += 1
+            error_filehandle.write(
+                dumps(get_error_record(render_result)) + '\n'
+            )
+
+            error_filehandle.flush()
+
+    return RenderSummary(sum(status_count_dict.values()) + skipped_count,
+                         status_count_dict[GAME_WRITTEN],
+                         skipped_count,
+                         status_count_dict[GAME_MISSING],
+                         status_count_dict[GAME_FAILED],
+                         stage_count_dict,
+                         stage_error_count_dict,
+                         stage_seconds_dict,
+                         perf_counter() - start_time,
+                         error_filehandle.name)
+
+def write_svg_batch_from_file_range(start_date_str, end_date_str, input_dir,
+                                    output_dir, svg_format='svg',
+                                    compresslevel=DEFAULT_COMPRESSLEVEL,
+                                    error_log_path=None, worker_pool=None,
+                                    force=False, team=None):
+    start_time = perf_counter()
+    if svg_format not in SVG_FORMAT_LIST:
+        raise ValueError('Invalid svg format: {}'.format(svg_format))
+
+    if not exists(output_dir):
+        makedirs(output_dir)
+
+    output_path = abspath(output_dir)
+    if error_log_path is None:
+        error_log_path = join(output_path, ERROR_LOG_FILENAME)
+
+    if is_archive(input_dir):
+        input_tuple_list = get_archive_filename_list(start_date_str,
+                                                     end_date_str,
+                                                     input_dir,
+                                                     team)
+
+        read_function = read_files_from_archive_tuple
+        fingerprint_function = get_source_fingerprint_from_archive_tuple
+    else:
+        input_tuple_list = get_filename_list(start_date_str,
+                                             end_date_str,
+                                             input_dir,
+                                             team)
+
+        read_function = read_files_from_filename_tuple
+        fingerprint_function = get_source_fingerprint_from_filename_tuple
+
+    render_manifest = RenderManifest(output_path, svg_format, compresslevel)
+    source_fingerprint_dict = {}
+    render_task_tuple_list = []
+    for input_tuple in input_tuple_list:
+        game_id = input_tuple[0]
+        source_fingerprint_dict[game_id] = fingerprint_function(input_tuple)
+        if force or not render_manifest.is_current(
+                game_id, source_fingerprint_dict[game_id]
+        ):
+            render_task_tuple_list.append((read_function,
+                                           input_tuple,
+                                           output_path,
+                                           svg_format,
+                                           compresslevel))
+
+    skipped_count = len(input_tuple_list) - len(render_task_tuple_list)
+    try:
+        with open(error_log_path, 'w', encoding='utf-8') as error_filehandle:
+            if worker_pool is None:
+                with WorkerPool() as worker_pool:
+                    render_summary = get_render_summary(
+                        get_render_result_iterable(worker_pool,
+                                                   render_task_tuple_list),
+                        error_filehandle,
+                        start_time,
+                        render_manifest,
+                        source_fingerprint_dict,
+                        skipped_count
+                    )
+            else:
+                render_summary = get_render_summary(
+                    get_render_result_iterable(worker_pool,
+                                               render_task_tuple_list),
+                    error_filehandle,
+                    start_time,
+                    render_manifest,
+                    source_fingerprint_dict,
+                    skipped_count
+                )
+    finally:
+        render_manifest.save()
+
+    return render_summary
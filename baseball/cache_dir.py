@@ -0,0 +1,105 @@
+from hashlib import sha256
+from os import environ, getpid, remove, replace, scandir, stat
+from os.path import abspath, dirname, join
+from threading import get_ident
+from time import time
+
+from baseball.version import __version__
+
+
+TEMP_FILE_SUFFIX = '.tmp'
+STALE_TEMP_FILE_SECONDS = 60 * 60
+EVICT_TO_FRACTION = 0.9
+
+CACHE_BYTES_DICT = {}
+SOURCE_VERSION_DICT = {}
+
+
+def get_cache_settings(variable_list):
+    return {variable: environ.get(variable) for variable in variable_list}
+
+def set_cache_settings(cache_settings_dict):
+    for variable, value in cache_settings_dict.items():
+        if value is None:
+            environ.pop(variable, None)
+        else:
+            environ[variable] = value
+
+def get_source_version(module_name_list):
+    module_dir = dirname(abspath(__file__))
+    source_version_key = (module_dir, tuple(module_name_list))
+    if source_version_key not in SOURCE_VERSION_DICT:
+        source_hash = sha256(__version__.encode('utf-8'))
+        for module_name in module_name_list:
+            with open(join(module_dir, module_name + '.py'),
+                      'rb') as filehandle:
+                source_hash.update(filehandle.read())
+
+        SOURCE_VERSION_DICT[source_version_key] = source_hash.hexdigest()
+
+    return SOURCE_VERSION_DICT[source_version_key]
+
+def evict_cache_dir(cache_dir, max_bytes, suffix):
+    stale_time = time() - STALE_TEMP_FILE_SECONDS
+    entry_list = []
+    total_bytes = 0
+    for entry in scandir(cache_dir):
+        try:
+            entry_stat = entry.stat()
+        except OSError:
+            continue
+
+        if entry.name.endswith(suffix):
+            entry_list.append((entry_stat.st_mtime, entry.path,
+                               entry_stat.st_size))
+
+            total_bytes += entry_stat.st_size
+        elif (entry.name.endswith(TEMP_FILE_SUFFIX) and
+                suffix + '.' in entry.name and
+                entry_stat.st_mtime < stale_time):
+            try:
+                remove(entry.path)
+            except OSError:
+                pass
+
+    if total_bytes > max_bytes:
+        target_bytes = int(max_bytes * EVICT_TO_FRACTION)
+        entry_list.sort()
+        for _, entry_path, entry_size in entry_list:
+            if total_bytes <= target_bytes:
+                break
+
+            try:
+                remove(entry_path)
+            except OSError:
+                pass
+
+            total_bytes -= entry_size
+
+    return total_bytes
+
+def store_cache_file(cache_dir, cache_path, data_bytes, max_bytes, suffix):
+    try:
+        old_size = stat(cache_path).st_size
+    except OSError:
+        old_size = 0
+
+    temp_path = '{}.{}.{}{}'.format(cache_path, getpid(), get_ident(),
+                                    TEMP_FILE_SUFFIX)
+
+    with open(temp_path, 'wb') as filehandle:
+        filehandle.write(data_bytes)
+
+    replace(temp_path, cache_path)
+
+    cache_bytes_key = (cache_dir, suffix)
+    if cache_bytes_key in CACHE_BYTES_DICT:
+        total_bytes = (CACHE_BYTES_DICT[cache_bytes_key] + len(data_bytes) -
+                       old_size)
+    else:
+        total_bytes = None
+
+    if total_bytes is None or total_bytes > max_bytes:
+        total_bytes = evict_cache_dir(cache_dir, max_bytes, suffix)
+
+    CACHE_BYTES_DICT[cache_bytes_key] = total_bytes
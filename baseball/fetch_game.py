@@ -1,23 +1,60 @@
+from collections import deque
 from datetime import timedelta
-from multiprocessing import Pool
-from os import listdir, makedirs
-from os.path import isdir, isfile, exists, abspath, join
+from functools import partial
+from gzip import GzipFile
+from io import TextIOWrapper
+from json import dump, load
+from multiprocessing import Pool, cpu_count
+from os import getpid, listdir, makedirs, replace
+from os.path import isdir, isfile, exists, abspath, join, getmtime, getsize
+from queue import Queue
+from re import search
 from xml.etree.ElementTree import fromstring
+from zipfile import ZipFile, is_zipfile
 
 from dateutil.parser import parse
-from requests import get
 
-from baseball.process_game_xml import MLB_TEAM_CODE_DICT, get_game_obj
+from baseball.cache_dir import get_cache_settings, set_cache_settings
+from baseball.game_cache import (GAME_CACHE_VARIABLE_LIST,
+                                 get_game_through_cache)
+from baseball.generate_svg import get_game_svg_generator
+from baseball.http_cache import (HTTP_CACHE_VARIABLE_LIST,
+                                 get_url_text,
+                                 is_final_boxscore)
+from baseball.process_game_xml import (MLB_TEAM_CODE_DICT,
+                                       get_game_obj,
+                                       get_game_obj_from_files)
 
 
-NUM_PROCESS_SUBLISTS = 16
+CHUNKS_IN_FLIGHT_PER_PROCESS = 2
 BOXSCORE_SUFFIX = 'boxscore.xml'
 PLAYERS_SUFFIX = 'players.xml'
 INNING_SUFFIX = 'inning/inning_all.xml'
 
-MLB_URL_PATTERN = ('http://gd2.mlb.com/components/game/mlb/year_{year}/'
-                   'month_{month}/day_{day}/gid_{year}_{month}_{day}_'
-                   '{away_mlb_code}mlb_{home_mlb_code}mlb_{game_number}/')
+ARCHIVE_MEMBER_PATTERN = (r'(?:^|/)(\d{4})/month_(\d{2})/day_(\d{2})/'
+                          r'(gid_[^/]+)/(boxscore\.xml|players\.xml|'
+                          r'inning/inning_all\.xml)$')
+
+ARCHIVE_INDEX_DICT = {}
+ARCHIVE_HANDLE_DICT = {}
+
+SVG_FORMAT_LIST = ['svg', 'svgz', 'svg.gz']
+DEFAULT_COMPRESSLEVEL = 9
+
+MANIFEST_FILENAME = 'manifest.json'
+MANIFEST_VERSION = 2
+
+CACHE_VARIABLE_LIST = GAME_CACHE_VARIABLE_LIST + HTTP_CACHE_VARIABLE_LIST
+
+MLB_CODE_TEAM_DICT = {value: key for key, value in MLB_TEAM_CODE_DICT.items()}
+
+MLB_URL_BASE = 'http://gd2.mlb.com/'
+MLB_URL_PATH_PATTERN = ('components/game/mlb/year_{year}/month_{month}/'
+                        'day_{day}/gid_{year}_{month}_{day}_'
+                        '{away_mlb_code}mlb_{home_mlb_code}mlb_{game_number}/')
+
+MLB_URL_PATTERN = MLB_URL_BASE + MLB_URL_PATH_PATTERN
+NOT_FOUND_TEXT = 'GameDay - 404 Not Found'
 
 HTML_WRAPPER = (
     '<html>'
@@ -44,6 +81,63 @@ HTML_WRAPPER = (
 )
 
 
+def call_with_cache_settings(cache_settings_dict, function, *args):
+    set_cache_settings(cache_settings_dict)
+
+    return function(*args)
+
+
+class WorkerPool(object):
+    def __init__(self, num_processes=None, initializer=None, initargs=()):
+        if num_processes is None:
+            num_processes = cpu_count()
+
+        if num_processes < 1:
+            raise ValueError('num_processes must be positive.')
+
+        self.num_processes = num_processes
+        self.process_pool = Pool(num_processes, initializer, initargs)
+
+    @staticmethod
+    def get_task_function(function):
+        return partial(call_with_cache_settings,
+                       get_cache_settings(CACHE_VARIABLE_LIST),
+                       function)
+
+    def map(self, function, iterable, chunksize=None):
+        return self.process_pool.map(self.get_task_function(function),
+                                     iterable, chunksize)
+
+    def apply_async(self, function, args=(), callback=None,
+                    error_callback=None):
+        return self.process_pool.apply_async(self.get_task_function(function),
+                                             args,
+                                             callback=callback,
+                                             error_callback=error_callback)
+
+    def imap_unordered(self, function, iterable, chunksize=1):
+        return self.process_pool.imap_unordered(
+            self.get_task_function(function), iterable, chunksize
+        )
+
+    def close(self):
+        self.process_pool.close()
+        self.process_pool.join()
+
+    def terminate(self):
+        self.process_pool.terminate()
+        self.process_pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
+
+
 def get_formatted_date_str(input_date_str):
     this_date = parse(input_date_str)
     this_date_str = '{}-{}-{}'.format(str(this_date.year),
@@ -52,54 +146,242 @@ def get_formatted_date_str(input_date_str):
 
     return this_date_str
 
-def write_game_svg_and_html(game_id, game, output_path):
-    svg_filename = game_id + '.svg'
+def open_gzip_text_file(filename, compresslevel=DEFAULT_COMPRESSLEVEL):
+    return TextIOWrapper(
+        GzipFile(filename, 'wb', compresslevel=compresslevel, mtime=0),
+        encoding='utf-8'
+    )
+
+def write_game_svg_and_html(game_id, game, output_path, svg_format='svg',
+                            compresslevel=DEFAULT_COMPRESSLEVEL):
+    write_svg_fragments_and_html(game_id, get_game_svg_generator(game),
+                                 output_path, svg_format, compresslevel)
+
+def write_svg_fragments_and_html(game_id, svg_fragment_iterable, output_path,
+                                 svg_format='svg',
+                                 compresslevel=DEFAULT_COMPRESSLEVEL):
+    if svg_format not in SVG_FORMAT_LIST:
+        raise ValueError('Invalid svg format: {}'.format(svg_format))
+
+    if svg_format == 'svgz':
+        svg_filename = game_id + '.svgz'
+    else:
+        svg_filename = game_id + '.svg'
+
     html_filename = game_id + '.html'
 
-    svg_text = game.get_svg_str()
     html_text = HTML_WRAPPER.format(title=game_id, filename=svg_filename)
 
     output_svg_path = join(output_path, svg_filename)
     output_html_path = join(output_path, html_filename)
 
-    with open(output_svg_path, 'w') as filehandle:
-        filehandle.write(svg_text)
+    if svg_format == 'svgz':
+        with open_gzip_text_file(output_svg_path,
+                                 compresslevel) as filehandle:
+            for svg_fragment in svg_fragment_iterable:
+                filehandle.write(svg_fragment)
+    elif svg_format == 'svg.gz':
+        with open(output_svg_path, 'w') as filehandle, \
+                open_gzip_text_file(output_svg_path + '.gz',
+                                    compresslevel) as gzip_filehandle:
+            for svg_fragment in svg_fragment_iterable:
+                filehandle.write(svg_fragment)
+                gzip_filehandle.write(svg_fragment)
+    else:
+        with open(output_svg_path, 'w') as filehandle:
+            for svg_fragment in svg_fragment_iterable:
+                filehandle.write(svg_fragment)
 
     with open(output_html_path, 'w') as filehandle:
         filehandle.write(html_text)
 
-def get_game_from_files(boxscore_file, player_file, inning_file):
+    if svg_format == 'svg.gz':
+        with open_gzip_text_file(output_html_path + '.gz',
+                                 compresslevel) as filehandle:
+            filehandle.write(html_text)
+
+def parse_game_from_files(boxscore_file, player_file, inning_file,
+                          player_registry=None):
+    boxscore_raw = open(boxscore_file, 'r', encoding='utf-8').read()
+    boxscore_xml = fromstring(boxscore_raw)
+    player_raw = open(player_file, 'r', encoding='utf-8').read()
+    player_xml = fromstring(player_raw)
+    inning_raw = open(inning_file, 'r', encoding='utf-8').read()
+    inning_xml = fromstring(inning_raw)
+
+    return get_game_obj(boxscore_xml, player_xml, inning_xml,
+                        player_registry)
+
+def get_game_from_files(boxscore_file, player_file, inning_file,
+                        player_registry=None):
     this_game = None
     if (isfile(boxscore_file) and isfile(player_file) and isfile(inning_file)):
-        boxscore_raw = open(boxscore_file, 'r', encoding='utf-8').read()
-        boxscore_xml = fromstring(boxscore_raw)
-        player_raw = open(player_file, 'r', encoding='utf-8').read()
-        player_xml = fromstring(player_raw)
-        inning_raw = open(inning_file, 'r', encoding='utf-8').read()
-        inning_xml = fromstring(inning_raw)
-        this_game = get_game_obj(boxscore_xml, player_xml, inning_xml)
+        this_game = get_game_through_cache(
+            [boxscore_file, player_file, inning_file],
+            parse_game_from_files,
+            player_registry
+        )
 
     return this_game
 
-def get_game_from_filename_tuple(filename_tuple):
+def get_game_from_files_iterparse(boxscore_file, player_file, inning_file,
+                                  player_registry=None):
+    this_game = None
+    if (isfile(boxscore_file) and isfile(player_file) and isfile(inning_file)):
+        this_game = get_game_obj_from_files(boxscore_file,
+                                            player_file,
+                                            inning_file,
+                                            player_registry)
+
+    return this_game
+
+def get_archive_handle(archive_path):
+    handle_key = (archive_path, getpid())
+    if handle_key not in ARCHIVE_HANDLE_DICT:
+        ARCHIVE_HANDLE_DICT[handle_key] = ZipFile(archive_path)
+
+    return ARCHIVE_HANDLE_DICT[handle_key]
+
+def get_game_from_archive(archive_path, boxscore_member, player_member,
+                          inning_member, player_registry=None):
+    this_game = None
+    if boxscore_member and player_member and inning_member:
+        archive = get_archive_handle(archive_path)
+        with archive.open(boxscore_member) as boxscore_file, \
+                archive.open(player_member) as player_file, \
+                archive.open(inning_member) as inning_file:
+            this_game = get_game_obj_from_files(boxscore_file,
+                                                player_file,
+                                                inning_file,
+                                                player_registry)
+
+    return this_game
+
+def get_game_from_filename_tuple(filename_tuple, player_registry=None):
     game_id, boxscore_file, player_file, inning_file = filename_tuple
-    game = get_game_from_files(boxscore_file, player_file, inning_file)
+    game = get_game_from_files(boxscore_file, player_file, inning_file,
+                               player_registry)
 
     return game_id, game
 
-def get_game_generator(filename_list):
+def get_game_from_archive_tuple(archive_tuple, player_registry=None):
+    (game_id,
+     archive_path,
+     boxscore_member,
+     player_member,
+     inning_member) = archive_tuple
+
+    game = get_game_from_archive(archive_path, boxscore_member, player_member,
+                                 inning_member, player_registry)
+
+    return game_id, game
+
+def get_game_generator(filename_list,
+                       load_function=get_game_from_filename_tuple):
     for filename_tuple in filename_list:
-        game_id, this_game = get_game_from_filename_tuple(filename_tuple)
+        game_id, this_game = load_function(filename_tuple)
         if this_game:
             yield game_id, this_game
 
-def write_game_svg_html_from_filename_tuple(filename_output_path_tuple):
+def get_game_chunk(load_function_chunk_tuple):
+    load_function, filename_chunk = load_function_chunk_tuple
+    game_tuple_list = []
+    for filename_tuple in filename_chunk:
+        game_id, this_game = load_function(filename_tuple)
+        if this_game:
+            game_tuple_list.append((game_id, this_game))
+
+    return game_tuple_list
+
+def get_pool_game_generator(worker_pool, filename_list, load_function,
+                            chunksize, window, ordered):
+    chunk_list = [
+        (load_function, filename_list[i:i + chunksize])
+        for i in range(0, len(filename_list), chunksize)
+    ]
+
+    result_queue = Queue()
+    if ordered:
+        result_callback = None
+    else:
+        result_callback = result_queue.put
+
+    pending_result_queue = deque()
+    for chunk in chunk_list:
+        pending_result_queue.append(
+            worker_pool.apply_async(get_game_chunk,
+                                    (chunk,),
+                                    callback=result_callback,
+                                    error_callback=result_callback)
+        )
+
+        while len(pending_result_queue) >= window:
+            yield from get_next_game_chunk(pending_result_queue,
+                                           result_queue,
+                                           ordered)
+
+    while pending_result_queue:
+        yield from get_next_game_chunk(pending_result_queue,
+                                       result_queue,
+                                       ordered)
+
+def get_parallel_game_generator(filename_list,
+                                load_function=get_game_from_filename_tuple,
+                                num_processes=None,
+                                chunksize=1, window=None, ordered=True,
+                                worker_pool=None):
+    if worker_pool is not None:
+        num_processes = worker_pool.num_processes
+    elif num_processes is None:
+        num_processes = cpu_count()
+
+    if window is None:
+        window = num_processes * CHUNKS_IN_FLIGHT_PER_PROCESS
+
+    if chunksize < 1 or window < 1:
+        raise ValueError('chunksize and window must be positive.')
+
+    if worker_pool is None:
+        with WorkerPool(num_processes) as worker_pool:
+            yield from get_pool_game_generator(worker_pool, filename_list,
+                                               load_function, chunksize,
+                                               window, ordered)
+    else:
+        yield from get_pool_game_generator(worker_pool, filename_list,
+                                           load_function, chunksize, window,
+                                           ordered)
+
+def get_next_game_chunk(pending_result_queue, result_queue, ordered):
+    if ordered:
+        game_tuple_list = pending_result_queue.popleft().get()
+    else:
+        game_tuple_list = result_queue.get()
+        pending_result_queue.pop()
+        if isinstance(game_tuple_list, BaseException):
+            raise game_tuple_list
+
+    return game_tuple_list
+
+def write_game_svg_html_from_filename_tuple(
+        filename_output_path_tuple, svg_format='svg',
+        compresslevel=DEFAULT_COMPRESSLEVEL):
     filename_tuple, output_path = filename_output_path_tuple
     game_id, game = get_game_from_filename_tuple(filename_tuple)
     if game:
-        write_game_svg_and_html(game_id, game, output_path)
+        write_game_svg_and_html(game_id, game, output_path, svg_format,
+                                compresslevel)
+
+def write_game_svg_html_from_archive_tuple(
+        archive_output_path_tuple, svg_format='svg',
+        compresslevel=DEFAULT_COMPRESSLEVEL):
+    archive_tuple, output_path = archive_output_path_tuple
+    game_id, game = get_game_from_archive_tuple(archive_tuple)
+    if game:
+        write_game_svg_and_html(game_id, game, output_path, svg_format,
+                                compresslevel)
 
-def get_game_from_xml_strings(boxscore_raw_xml, players_raw_xml, inning_raw_xml):
+def get_game_from_xml_strings(boxscore_raw_xml, players_raw_xml, inning_raw_xml,
+                              player_registry=None):
     if boxscore_raw_xml and players_raw_xml and inning_raw_xml:
         boxscore_xml_obj = fromstring(boxscore_raw_xml)
         players_xml_obj = fromstring(players_raw_xml)
@@ -111,29 +393,97 @@ def get_game_from_xml_strings(boxscore_raw_xml, players_raw_xml, inning_raw_xml)
         else:
             this_game = get_game_obj(boxscore_xml_obj,
                                      players_xml_obj,
-                                     inning_xml_obj)
+                                     inning_xml_obj,
+                                     player_registry)
     else:
         this_game = None
 
     return this_game
 
-def write_svg_from_file_range(start_date_str, end_date_str, input_dir, output_dir):
+def map_with_worker_pool(function, iterable, worker_pool=None):
+    if worker_pool is None:
+        with WorkerPool() as worker_pool:
+            result_list = worker_pool.map(function, iterable)
+    else:
+        result_list = worker_pool.map(function, iterable)
+
+    return result_list
+
+def write_svg_from_file_range(start_date_str, end_date_str, input_dir, output_dir,
+                              svg_format='svg',
+                              compresslevel=DEFAULT_COMPRESSLEVEL,
+                              worker_pool=None, team=None):
+    if svg_format not in SVG_FORMAT_LIST:
+        raise ValueError('Invalid svg format: {}'.format(svg_format))
+
     if not exists(output_dir):
         makedirs(output_dir)
 
     output_path = abspath(output_dir)
+    if is_archive(input_dir):
+        filename_list = get_archive_filename_list(start_date_str,
+                                                  end_date_str,
+                                                  input_dir,
+                                                  team)
+
+        write_function = write_game_svg_html_from_archive_tuple
+    else:
+        filename_list = get_filename_list(start_date_str,
+                                          end_date_str,
+                                          input_dir,
+                                          team)
+
+        write_function = write_game_svg_html_from_filename_tuple
+
     filename_output_path_tuple_list = [
-        (filename_tuple, output_path)
-        for filename_tuple in get_filename_list(start_date_str,
-                                                end_date_str,
-                                                input_dir)
+        (filename_tuple, output_path) for filename_tuple in filename_list
     ]
 
-    process_pool = Pool(NUM_PROCESS_SUBLISTS)
-    process_pool.map(write_game_svg_html_from_filename_tuple,
-                     filename_output_path_tuple_list)
+    write_function = partial(write_function,
+                             svg_format=svg_format,
+                             compresslevel=compresslevel)
+
+    map_with_worker_pool(write_function, filename_output_path_tuple_list,
+                         worker_pool)
+
+def is_archive(input_path):
+    return isfile(input_path) and is_zipfile(input_path)
+
+def get_archive_index(archive_path):
+    if archive_path not in ARCHIVE_INDEX_DICT:
+        archive_index = {}
+        with ZipFile(archive_path) as archive:
+            for member_name in archive.namelist():
+                member_match = search(ARCHIVE_MEMBER_PATTERN, member_name)
+                if member_match:
+                    (year,
+                     month,
+                     day,
+                     game_dir_name,
+                     suffix) = member_match.groups()
+
+                    game_dict = archive_index.setdefault(
+                        (year, month, day), {}
+                    ).setdefault(game_dir_name, {})
+
+                    game_dict[suffix] = member_name
+
+        ARCHIVE_INDEX_DICT[archive_path] = archive_index
+
+    return ARCHIVE_INDEX_DICT[archive_path]
+
+def get_game_id(year, month, day, game_dir_name):
+    away_code, home_code, game_num = game_dir_name.split('_')[-3:]
+    away_team = MLB_CODE_TEAM_DICT.get(away_code[:-3])
+    home_team = MLB_CODE_TEAM_DICT.get(home_code[:-3])
+    if away_team and home_team:
+        game_id = '-'.join([year, month, day, away_team, home_team, game_num])
+    else:
+        game_id = None
+
+    return game_id
 
-def get_filename_list(start_date_str, end_date_str, input_dir):
+def get_directory_filename_list(start_date_str, end_date_str, input_dir):
     filename_list = []
     input_path = abspath(input_dir)
     start_date = parse(start_date_str)
@@ -150,21 +500,8 @@ def get_filename_list(start_date_str, end_date_str, input_dir):
             if file_list:
                 for subfile in file_list:
                     if subfile.startswith('gid_'):
-                        away_code, home_code, game_num = subfile.split('_')[-3:]
-                        away_code = away_code[:-3]
-                        home_code = home_code[:-3]
-                        away_team, home_team = None, None
-                        for key, value in MLB_TEAM_CODE_DICT.items():
-                            if value == away_code:
-                                away_team = key
-
-                            if value == home_code:
-                                home_team = key
-
-                        if away_team and home_team:
-                            output_name = '-'.join([year, month, day, away_team,
-                                                    home_team, game_num])
-
+                        output_name = get_game_id(year, month, day, subfile)
+                        if output_name:
                             subfolder_name = filename + subfile + '/'
                             if listdir(subfolder_name):
                                 player_filename = subfolder_name + 'players.xml'
@@ -183,30 +520,299 @@ def get_filename_list(start_date_str, end_date_str, input_dir):
 
     return filename_list
 
-def get_game_list_from_file_range(start_date_str, end_date_str, input_dir):
-    filename_list = get_filename_list(start_date_str, end_date_str, input_dir)
-    process_pool = Pool(NUM_PROCESS_SUBLISTS)
-    game_tuple_list = process_pool.map(get_game_from_filename_tuple,
-                                       filename_list)
+def get_manifest_path(input_dir):
+    return join(abspath(input_dir), MANIFEST_FILENAME)
+
+def load_manifest(input_dir):
+    manifest = None
+    manifest_path = get_manifest_path(input_dir)
+    if isfile(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as filehandle:
+            manifest = load(filehandle)
+
+        if manifest.get('version') != MANIFEST_VERSION:
+            manifest = None
+
+    return manifest
+
+def get_day_manifest_entry(input_path, year, month, day):
+    day_dir = '{}/month_{}/day_{}/'.format(year, month, day)
+    day_path = input_path + '/' + day_dir
+    day_entry = {'mtime': getmtime(day_path), 'game_dict': {},
+                 'empty_dict': {}}
+    for subfile in sorted(listdir(day_path)):
+        if subfile.startswith('gid_'):
+            game_id = get_game_id(year, month, day, subfile)
+            subfolder_name = day_path + subfile + '/'
+            if game_id and not listdir(subfolder_name):
+                day_entry['empty_dict'][day_dir + subfile + '/'] = getmtime(
+                    subfolder_name
+                )
+            elif game_id:
+                size_dict = {}
+                for suffix in (BOXSCORE_SUFFIX, PLAYERS_SUFFIX, INNING_SUFFIX):
+                    if isfile(subfolder_name + suffix):
+                        size_dict[suffix] = getsize(subfolder_name + suffix)
+                    else:
+                        size_dict[suffix] = None
+
+                day_entry['game_dict'][game_id] = {
+                    'path': day_dir + subfile + '/',
+                    'size_dict': size_dict
+                }
+
+    return day_entry
+
+def is_day_entry_current(input_path, day_entry):
+    for path, mtime in day_entry['empty_dict'].items():
+        if getmtime(input_path + '/' + path) != mtime:
+            return False
+
+    for game_entry in day_entry['game_dict'].values():
+        for suffix, size in game_entry['size_dict'].items():
+            if size is None and isfile(input_path + '/' + game_entry['path'] +
+                                       suffix):
+                return False
+
+    return True
+
+def update_manifest(input_dir):
+    input_path = abspath(input_dir)
+    manifest = load_manifest(input_dir)
+    if manifest:
+        old_day_dict = manifest['day_dict']
+    else:
+        old_day_dict = {}
+
+    day_dict = {}
+    for year in sorted(listdir(input_path)):
+        year_path = join(input_path, year)
+        if year.isdigit() and isdir(year_path):
+            for month_dir in sorted(listdir(year_path)):
+                month_path = join(year_path, month_dir)
+                if month_dir.startswith('month_') and isdir(month_path):
+                    for day_dir in sorted(listdir(month_path)):
+                        day_path = join(month_path, day_dir)
+                        if day_dir.startswith('day_') and isdir(day_path):
+                            month = month_dir[len('month_'):]
+                            day = day_dir[len('day_'):]
+                            date_str = '-'.join([year, month, day])
+                            day_entry = old_day_dict.get(date_str)
+                            if (not day_entry or
+                                    day_entry['mtime'] != getmtime(day_path) or
+                                    not is_day_entry_current(input_path,
+                                                             day_entry)):
+                                day_entry = get_day_manifest_entry(input_path,
+                                                                   year,
+                                                                   month,
+                                                                   day)
+
+                            day_dict[date_str] = day_entry
+
+    manifest = {'version': MANIFEST_VERSION, 'day_dict': day_dict}
+    manifest_path = get_manifest_path(input_dir)
+    with open(manifest_path + '.tmp', 'w', encoding='utf-8') as filehandle:
+        dump(manifest, filehandle)
+
+    replace(manifest_path + '.tmp', manifest_path)
+
+    return manifest
+
+def get_manifest_filename_list(start_date_str, end_date_str, input_dir,
+                               manifest):
+    filename_list = []
+    input_path = abspath(input_dir)
+    start_date = parse(start_date_str)
+    end_date = parse(end_date_str)
+    day_delta = timedelta(days=1)
+    this_date = start_date
+    while this_date < end_date + day_delta:
+        date_str = '-'.join([str(this_date.year),
+                             str(this_date.month).zfill(2),
+                             str(this_date.day).zfill(2)])
+
+        day_entry = manifest['day_dict'].get(date_str)
+        if day_entry:
+            for game_id, game_entry in sorted(day_entry['game_dict'].items()):
+                subfolder_name = input_path + '/' + game_entry['path']
+                filename_list.append((game_id,
+                                      subfolder_name + BOXSCORE_SUFFIX,
+                                      subfolder_name + PLAYERS_SUFFIX,
+                                      subfolder_name + INNING_SUFFIX))
+
+        this_date += day_delta
+
+    return filename_list
+
+def is_manifest_current(start_date_str, end_date_str, input_dir, manifest):
+    input_path = abspath(input_dir)
+    start_date = parse(start_date_str)
+    end_date = parse(end_date_str)
+    day_delta = timedelta(days=1)
+    this_date = start_date
+    while this_date < end_date + day_delta:
+        year = str(this_date.year)
+        month = str(this_date.month).zfill(2)
+        day = str(this_date.day).zfill(2)
+        day_path = '{}/{}/month_{}/day_{}/'.format(input_path, year, month,
+                                                   day)
+
+        day_entry = manifest['day_dict'].get('-'.join([year, month, day]))
+        if isdir(day_path):
+            if (not day_entry or
+                    day_entry['mtime'] != getmtime(day_path) or
+                    not is_day_entry_current(input_path, day_entry)):
+                return False
+        elif day_entry:
+            return False
+
+        this_date += day_delta
+
+    return True
+
+def get_team_filename_list(filename_list, team):
+    if team:
+        filename_list = [
+            filename_tuple for filename_tuple in filename_list
+            if team in filename_tuple[0].split('-')[3:5]
+        ]
+
+    return filename_list
+
+def get_filename_list(start_date_str, end_date_str, input_dir, team=None):
+    manifest = load_manifest(input_dir)
+    if isfile(get_manifest_path(input_dir)) and (
+            not manifest or
+            not is_manifest_current(start_date_str, end_date_str, input_dir,
+                                    manifest)
+    ):
+        try:
+            manifest = update_manifest(input_dir)
+        except OSError:
+            manifest = None
+
+    if manifest:
+        filename_list = get_manifest_filename_list(start_date_str,
+                                                   end_date_str,
+                                                   input_dir,
+                                                   manifest)
+    else:
+        filename_list = get_directory_filename_list(start_date_str,
+                                                    end_date_str,
+                                                    input_dir)
+
+    return get_team_filename_list(filename_list, team)
+
+def get_archive_filename_list(start_date_str, end_date_str, archive_path,
+                              team=None):
+    archive_tuple_list = []
+    archive_path = abspath(archive_path)
+    archive_index = get_archive_index(archive_path)
+    start_date = parse(start_date_str)
+    end_date = parse(end_date_str)
+    day_delta = timedelta(days=1)
+    this_date = start_date
+    while this_date < end_date + day_delta:
+        year = str(this_date.year)
+        month = str(this_date.month).zfill(2)
+        day = str(this_date.day).zfill(2)
+        day_dict = archive_index.get((year, month, day), {})
+        for game_dir_name, game_dict in sorted(day_dict.items()):
+            output_name = get_game_id(year, month, day, game_dir_name)
+            if output_name:
+                archive_tuple_list.append((output_name,
+                                           archive_path,
+                                           game_dict.get(BOXSCORE_SUFFIX),
+                                           game_dict.get(PLAYERS_SUFFIX),
+                                           game_dict.get(INNING_SUFFIX)))
+
+        this_date += day_delta
+
+    return get_team_filename_list(archive_tuple_list, team)
+
+def get_filename_list_and_load_function(start_date_str, end_date_str,
+                                        input_dir, team=None):
+    if is_archive(input_dir):
+        filename_list = get_archive_filename_list(start_date_str,
+                                                  end_date_str,
+                                                  input_dir,
+                                                  team)
+
+        load_function = get_game_from_archive_tuple
+    else:
+        filename_list = get_filename_list(start_date_str,
+                                          end_date_str,
+                                          input_dir,
+                                          team)
+
+        load_function = get_game_from_filename_tuple
+
+    return filename_list, load_function
+
+def get_game_list_from_file_range(start_date_str, end_date_str, input_dir,
+                                  worker_pool=None, team=None):
+    (filename_list,
+     load_function) = get_filename_list_and_load_function(start_date_str,
+                                                          end_date_str,
+                                                          input_dir,
+                                                          team)
+
+    game_tuple_list = map_with_worker_pool(load_function, filename_list,
+                                           worker_pool)
 
     return game_tuple_list
 
-def get_game_generator_from_file_range(start_date_str, end_date_str, input_dir):
-    filename_list = get_filename_list(start_date_str, end_date_str, input_dir)
+def get_game_generator_from_file_range(start_date_str, end_date_str, input_dir,
+                                       num_processes=None, chunksize=1,
+                                       window=None, ordered=True,
+                                       player_registry=None, worker_pool=None,
+                                       team=None):
+    (filename_list,
+     load_function) = get_filename_list_and_load_function(start_date_str,
+                                                          end_date_str,
+                                                          input_dir,
+                                                          team)
+
+    if player_registry is not None:
+        if num_processes or worker_pool is not None:
+            raise ValueError(
+                'A player registry cannot be shared across processes.'
+            )
+
+        load_function = partial(load_function,
+                                player_registry=player_registry)
+
+    if num_processes or worker_pool is not None:
+        game_generator = get_parallel_game_generator(filename_list,
+                                                     load_function,
+                                                     num_processes,
+                                                     chunksize,
+                                                     window,
+                                                     ordered,
+                                                     worker_pool)
+    else:
+        game_generator = get_game_generator(filename_list, load_function)
 
-    return get_game_generator(filename_list)
+    return game_generator
 
-def write_svg_from_url(date_str, away_code, home_code, game_number, output_dir):
+def write_svg_from_url(date_str, away_code, home_code, game_number, output_dir,
+                       svg_format='svg', compresslevel=DEFAULT_COMPRESSLEVEL,
+                       url_pattern=MLB_URL_PATTERN):
     if not exists(output_dir):
         makedirs(output_dir)
 
     output_path = abspath(output_dir)
     game_id, game = get_game_from_url(date_str, away_code, home_code,
-                                      game_number)
+                                      game_number, url_pattern)
+
+    write_game_svg_and_html(game_id, game, output_path, svg_format,
+                            compresslevel)
 
-    write_game_svg_and_html(game_id, game, output_path)
+def get_url_pattern(url_base):
+    return url_base.rstrip('/') + '/' + MLB_URL_PATH_PATTERN
 
-def get_game_xml_from_url(date_str, away_code, home_code, game_number):
+def get_game_id_and_url_base(date_str, away_code, home_code, game_number,
+                             url_pattern=MLB_URL_PATTERN):
     formatted_date_str = get_formatted_date_str(date_str)
     date = parse(formatted_date_str)
 
@@ -214,7 +820,7 @@ def get_game_xml_from_url(date_str, away_code, home_code, game_number):
         [formatted_date_str, away_code, home_code, str(game_number)]
     )
 
-    request_url_base = MLB_URL_PATTERN.format(
+    request_url_base = url_pattern.format(
         year=date.year,
         month=str(date.month).zfill(2),
         day=str(date.day).zfill(2),
@@ -223,24 +829,42 @@ def get_game_xml_from_url(date_str, away_code, home_code, game_number):
         game_number=game_number
     )
 
-    boxscore_request_text = get(request_url_base + BOXSCORE_SUFFIX).text
-    if boxscore_request_text == 'GameDay - 404 Not Found':
+    return game_id, request_url_base
+
+def get_game_xml_from_url(date_str, away_code, home_code, game_number,
+                          url_pattern=MLB_URL_PATTERN):
+    game_id, request_url_base = get_game_id_and_url_base(date_str,
+                                                         away_code,
+                                                         home_code,
+                                                         game_number,
+                                                         url_pattern)
+
+    boxscore_request_text = get_url_text(request_url_base + BOXSCORE_SUFFIX,
+                                         final_function=is_final_boxscore)
+
+    if boxscore_request_text == NOT_FOUND_TEXT:
         boxscore_raw_xml, players_raw_xml, inning_raw_xml = None, None, None
     else:
         boxscore_raw_xml = boxscore_request_text
-        players_raw_xml = get(request_url_base + PLAYERS_SUFFIX).text
-        inning_raw_xml = get(request_url_base + INNING_SUFFIX).text
+        game_is_final = is_final_boxscore(boxscore_raw_xml)
+        players_raw_xml = get_url_text(request_url_base + PLAYERS_SUFFIX,
+                                       game_is_final)
+
+        inning_raw_xml = get_url_text(request_url_base + INNING_SUFFIX,
+                                      game_is_final)
 
     return game_id, boxscore_raw_xml, players_raw_xml, inning_raw_xml
 
-def get_game_from_url(date_str, away_code, home_code, game_number):
+def get_game_from_url(date_str, away_code, home_code, game_number,
+                      url_pattern=MLB_URL_PATTERN):
     (game_id,
      boxscore_raw_xml,
      players_raw_xml,
      inning_raw_xml) = get_game_xml_from_url(date_str,
                                              away_code,
                                              home_code,
-                                             game_number)
+                                             game_number,
+                                             url_pattern)
 
     this_game = get_game_from_xml_strings(boxscore_raw_xml,
                                           players_raw_xml,
@@ -0,0 +1,147 @@
+from asyncio import Semaphore, gather, get_running_loop, run
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from urllib.parse import urlparse
+from weakref import WeakKeyDictionary
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from baseball.fetch_game import (BOXSCORE_SUFFIX,
+                                 INNING_SUFFIX,
+                                 MLB_URL_PATTERN,
+                                 NOT_FOUND_TEXT,
+                                 PLAYERS_SUFFIX,
+                                 get_game_from_xml_strings,
+                                 get_game_id_and_url_base)
+from baseball.http_cache import get_url_status_and_text, is_final_boxscore
+
+
+MAX_HOST_CONNECTIONS = 8
+
+
+class GamedayFetcher(object):
+    def __init__(self, max_connections_per_host=MAX_HOST_CONNECTIONS,
+                 url_pattern=MLB_URL_PATTERN):
+        if max_connections_per_host < 1:
+            raise ValueError('max_connections_per_host must be positive.')
+
+        self.max_connections_per_host = max_connections_per_host
+        self.url_pattern = url_pattern
+        self.loop_semaphore_dict = WeakKeyDictionary()
+        self.session = Session()
+        adapter = HTTPAdapter(pool_connections=max_connections_per_host,
+                              pool_maxsize=max_connections_per_host)
+
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.executor = ThreadPoolExecutor(max_connections_per_host)
+
+    def close(self):
+        self.executor.shutdown()
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_host_semaphore(self, url):
+        host = urlparse(url).netloc
+        host_semaphore_dict = self.loop_semaphore_dict.setdefault(
+            get_running_loop(), {}
+        )
+
+        if host not in host_semaphore_dict:
+            host_semaphore_dict[host] = Semaphore(
+                self.max_connections_per_host
+            )
+
+        return host_semaphore_dict[host]
+
+    async def fetch_text(self, url, final=False, final_function=None):
+        async with self.get_host_semaphore(url):
+            (status_code,
+             response_text) = await get_running_loop().run_in_executor(
+                 self.executor,
+                 partial(get_url_status_and_text, url, final, final_function,
+                         self.session)
+             )
+
+        if status_code != 200 or response_text == NOT_FOUND_TEXT:
+            response_text = None
+
+        return response_text
+
+    async def fetch_game_xml(self, date_str, away_code, home_code,
+                             game_number):
+        game_id, request_url_base = get_game_id_and_url_base(date_str,
+                                                             away_code,
+                                                             home_code,
+                                                             game_number,
+                                                             self.url_pattern)
+
+        boxscore_raw_xml = await self.fetch_text(
+            request_url_base + BOXSCORE_SUFFIX,
+            final_function=is_final_boxscore
+        )
+
+        if boxscore_raw_xml:
+            game_is_final = is_final_boxscore(boxscore_raw_xml)
+            players_raw_xml, inning_raw_xml = await gather(
+                self.fetch_text(request_url_base + PLAYERS_SUFFIX,
+                                game_is_final),
+                self.fetch_text(request_url_base + INNING_SUFFIX,
+                                game_is_final)
+            )
+        else:
+            players_raw_xml, inning_raw_xml = None, None
+
+        return game_id, boxscore_raw_xml, players_raw_xml, inning_raw_xml
+
+    async def fetch_game_xml_list(self, game_spec_list):
+        return await gather(
+            *[self.fetch_game_xml(*game_spec) for game_spec in game_spec_list],
+            return_exceptions=True
+        )
+
+
+def get_game_xml_list_from_urls(game_spec_list,
+                                max_connections_per_host=MAX_HOST_CONNECTIONS,
+                                url_pattern=MLB_URL_PATTERN):
+    with GamedayFetcher(max_connections_per_host, url_pattern) as fetcher:
+        game_xml_list = run(fetcher.fetch_game_xml_list(game_spec_list))
+
+    return game_xml_list
+
+def get_game_list_from_urls(game_spec_list,
+                            max_connections_per_host=MAX_HOST_CONNECTIONS,
+                            url_pattern=MLB_URL_PATTERN,
+                            player_registry=None):
+    game_xml_list = get_game_xml_list_from_urls(game_spec_list,
+                                                max_connections_per_host,
+                                                url_pattern)
+
+    game_tuple_list = []
+    for game_xml_tuple in game_xml_list:
+        if isinstance(game_xml_tuple, BaseException):
+            game_tuple_list.append(game_xml_tuple)
+        else:
+            (game_id,
+             boxscore_raw_xml,
+             players_raw_xml,
+             inning_raw_xml) = game_xml_tuple
+
+            try:
+                game_tuple_list.append(
+                    (game_id,
+                     get_game_from_xml_strings(boxscore_raw_xml,
+                                               players_raw_xml,
+                                               inning_raw_xml,
+                                               player_registry))
+                )
+            except Exception as exc:
+                game_tuple_list.append(exc)
+
+    return game_tuple_list
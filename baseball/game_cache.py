@@ -0,0 +1,98 @@
+from hashlib import sha256
+from os import environ, makedirs, remove, stat, utime
+from os.path import abspath, join
+from zlib import error as ZlibError
+
+from baseball.cache_dir import get_source_version, store_cache_file
+from baseball.serialize_game import (GAME_FORMAT_VERSION,
+                                     get_game_bytes,
+                                     get_game_from_bytes)
+from baseball.version import __version__
+
+
+GAME_CACHE_DIR_VARIABLE = 'BASEBALL_GAME_CACHE_DIR'
+GAME_CACHE_MAX_BYTES_VARIABLE = 'BASEBALL_GAME_CACHE_MAX_BYTES'
+DEFAULT_GAME_CACHE_MAX_BYTES = 4 * 1024 ** 3
+GAME_CACHE_SUFFIX = '.bbgm'
+GAME_CACHE_VARIABLE_LIST = [GAME_CACHE_DIR_VARIABLE,
+                            GAME_CACHE_MAX_BYTES_VARIABLE]
+
+PARSER_MODULE_LIST = ['baseball', 'baseball_events', 'process_game_xml',
+                      'serialize_game', 'stats']
+
+
+def enable_game_cache(cache_dir,
+                      max_cache_bytes=DEFAULT_GAME_CACHE_MAX_BYTES):
+    cache_dir = abspath(cache_dir)
+    makedirs(cache_dir, exist_ok=True)
+    environ[GAME_CACHE_DIR_VARIABLE] = cache_dir
+    environ[GAME_CACHE_MAX_BYTES_VARIABLE] = str(max_cache_bytes)
+
+def disable_game_cache():
+    environ.pop(GAME_CACHE_DIR_VARIABLE, None)
+    environ.pop(GAME_CACHE_MAX_BYTES_VARIABLE, None)
+
+def get_game_cache_dir():
+    return environ.get(GAME_CACHE_DIR_VARIABLE)
+
+def get_game_cache_max_bytes():
+    return int(environ.get(GAME_CACHE_MAX_BYTES_VARIABLE,
+                           DEFAULT_GAME_CACHE_MAX_BYTES))
+
+def get_parser_version():
+    return get_source_version(PARSER_MODULE_LIST)
+
+def get_game_cache_key(filename_list):
+    key_list = [__version__, str(GAME_FORMAT_VERSION), get_parser_version()]
+    for filename in filename_list:
+        file_stat = stat(filename)
+        key_list += [abspath(filename),
+                     str(file_stat.st_size),
+                     str(file_stat.st_mtime_ns)]
+
+    return sha256('\0'.join(key_list).encode('utf-8')).hexdigest()
+
+def get_game_cache_path(cache_dir, cache_key):
+    return join(cache_dir, cache_key + GAME_CACHE_SUFFIX)
+
+def get_cached_game(cache_dir, cache_key, player_registry=None):
+    cache_path = get_game_cache_path(cache_dir, cache_key)
+    try:
+        with open(cache_path, 'rb') as filehandle:
+            game_bytes = filehandle.read()
+
+        utime(cache_path)
+    except OSError:
+        game = None
+    else:
+        try:
+            game = get_game_from_bytes(game_bytes, player_registry)
+        except (ValueError, TypeError, IndexError, EOFError, ZlibError):
+            game = None
+            try:
+                remove(cache_path)
+            except OSError:
+                pass
+
+    return game
+
+def store_cached_game(cache_dir, cache_key, game, max_cache_bytes):
+    store_cache_file(cache_dir, get_game_cache_path(cache_dir, cache_key),
+                     get_game_bytes(game), max_cache_bytes,
+                     GAME_CACHE_SUFFIX)
+
+def get_game_through_cache(filename_list, load_function,
+                           player_registry=None):
+    cache_dir = get_game_cache_dir()
+    if cache_dir:
+        cache_key = get_game_cache_key(filename_list)
+        game = get_cached_game(cache_dir, cache_key, player_registry)
+        if not game:
+            game = load_function(*filename_list, player_registry)
+            if game:
+                store_cached_game(cache_dir, cache_key, game,
+                                  get_game_cache_max_bytes())
+    else:
+        game = load_function(*filename_list, player_registry)
+
+    return game
@@ -0,0 +1,149 @@
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from os import stat
+from os.path import abspath, isdir, isfile, join
+from random import Random
+from re import escape, match
+from threading import Lock, Thread
+from time import sleep
+
+from baseball.fetch_game import (BOXSCORE_SUFFIX,
+                                 INNING_SUFFIX,
+                                 NOT_FOUND_TEXT,
+                                 PLAYERS_SUFFIX,
+                                 get_url_pattern)
+
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_ERROR_STATUS = 500
+XML_CONTENT_TYPE = 'text/xml; charset=utf-8'
+HTML_CONTENT_TYPE = 'text/html; charset=utf-8'
+GAMEDAY_PATH_PATTERN = (
+    r'/components/game/mlb/year_(\d{4})/'
+    r'(month_\d{2}/day_\d{2}/gid_\w+/(?:' +
+    '|'.join(escape(x) for x in [BOXSCORE_SUFFIX, PLAYERS_SUFFIX,
+                                 INNING_SUFFIX]) +
+    r'))$'
+)
+
+
+def get_mirror_filename(root_path, request_path):
+    path_match = match(GAMEDAY_PATH_PATTERN, request_path.split('?')[0])
+    filename = None
+    if path_match:
+        year, game_path = path_match.groups()
+        for year_dir_name in ['year_' + year, year]:
+            if isdir(join(root_path, year_dir_name)):
+                filename = join(root_path, year_dir_name, game_path)
+                break
+
+    return filename
+
+def get_entity_tag(file_stat):
+    return '"{:x}-{:x}"'.format(file_stat.st_size, file_stat.st_mtime_ns)
+
+
+class GamedayRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, status, content_type, body, header_dict=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for header_name, header_value in (header_dict or {}).items():
+            self.send_header(header_name, header_value)
+
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.server.wait_for_latency()
+        filename = get_mirror_filename(self.server.root_path, self.path)
+        if self.server.is_injected_error():
+            self.send_body(self.server.error_status, HTML_CONTENT_TYPE, b'')
+        elif filename and isfile(filename):
+            file_stat = stat(filename)
+            header_dict = {
+                'ETag': get_entity_tag(file_stat),
+                'Last-Modified': formatdate(file_stat.st_mtime, usegmt=True)
+            }
+
+            if self.headers.get('If-None-Match') == header_dict['ETag']:
+                self.send_body(304, XML_CONTENT_TYPE, b'', header_dict)
+            else:
+                with open(filename, 'rb') as filehandle:
+                    body = filehandle.read()
+
+                self.send_body(200, XML_CONTENT_TYPE, body, header_dict)
+        else:
+            self.send_body(404, HTML_CONTENT_TYPE,
+                           NOT_FOUND_TEXT.encode('utf-8'))
+
+
+class GamedayServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, root_dir, host=DEFAULT_HOST, port=0, latency=0.0,
+                 latency_jitter=0.0, error_rate=0.0,
+                 error_status=DEFAULT_ERROR_STATUS, seed=None):
+        if latency < 0 or latency_jitter < 0:
+            raise ValueError('latency and latency_jitter must not be '
+                             'negative.')
+
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError('error_rate must be between 0 and 1.')
+
+        ThreadingHTTPServer.__init__(self, (host, port), GamedayRequestHandler)
+        self.root_path = abspath(root_dir)
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.random = Random(seed)
+        self.lock = Lock()
+        self.request_count = 0
+        self.error_count = 0
+        self.thread = None
+        self.url_base = 'http://{}:{}/'.format(*self.server_address[:2])
+        self.url_pattern = get_url_pattern(self.url_base)
+
+    def wait_for_latency(self):
+        with self.lock:
+            self.request_count += 1
+            delay = self.latency + self.latency_jitter * self.random.random()
+
+        if delay:
+            sleep(delay)
+
+    def is_injected_error(self):
+        with self.lock:
+            injected_error = bool(self.error_rate and
+                                  self.random.random() < self.error_rate)
+
+            if injected_error:
+                self.error_count += 1
+
+        return injected_error
+
+    def start(self):
+        if self.thread is None:
+            self.thread = Thread(target=self.serve_forever, daemon=True)
+            self.thread.start()
+
+    def close(self):
+        if self.thread is not None:
+            self.shutdown()
+            self.thread.join()
+            self.thread = None
+
+        self.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -653,6 +653,33 @@ SVG_HIT_FLY_TEMPLATE = (
 )
 
 
+class ScorecardRenderCache(object):
+    def __init__(self):
+        self.svg_content_dict = {}
+
+    def __len__(self):
+        return len(self.svg_content_dict)
+
+    def clear(self):
+        self.svg_content_dict.clear()
+
+    def get_svg_content_list(self, inning_num, inning_half_str,
+                             plate_appearance_list):
+        cache_key = (inning_num, inning_half_str)
+        cached_tuple = self.svg_content_dict.get(cache_key)
+        if cached_tuple and cached_tuple[0] is plate_appearance_list:
+            svg_content_list = cached_tuple[1]
+        else:
+            svg_content_list = list(
+                get_half_inning_svg_content_generator(plate_appearance_list)
+            )
+
+            self.svg_content_dict[cache_key] = (plate_appearance_list,
+                                                svg_content_list)
+
+        return svg_content_list
+
+
 def get_game_width(game):
     inning_length = max(len(game.inning_list), NUM_MINIMUM_INNINGS)
     game_width = BOX_WIDTH * (inning_length + EXTRA_COLUMNS)
@@ -888,7 +915,11 @@ def get_runners_svg(plate_appearance):
             title_flag_str = get_runner_title_str(event)
 
             title = '{}: {}{}'.format(
-                str(event.runner),
+                event.runner.get_display_str(
+                    plate_appearance.batting_team.get_player_stats(
+                        event.runner
+                    )
+                ),
                 event.run_description,
                 title_flag_str
             )
@@ -934,7 +965,9 @@ def get_outs_svg(plate_appearance, prev_plate_appearance):
     return outs_svg
 
 def get_components(plate_appearance):
-    number = plate_appearance.batter.number
+    number = plate_appearance.batting_team.get_player_stats(
+        plate_appearance.batter
+    ).number
 
     if plate_appearance.scorecard_summary:
         summary = plate_appearance.scorecard_summary.split()[0]
@@ -1241,43 +1274,55 @@ def get_inning_half_stats_tuple_list(game):
 
     return inning_half_stats_tuple_list
 
-def get_svg_content_list(game):
-    content_list = []
+def get_half_inning_svg_content_generator(plate_appearance_list):
+    prev_plate_appearance = None
+    for plate_appearance in plate_appearance_list:
+        plate_appearance_svg = '{}{}{}{}{}{}'.format(
+            get_summary_svg(plate_appearance),
+            get_pitch_svg(plate_appearance),
+            get_runners_svg(plate_appearance),
+            get_count_svg(plate_appearance),
+            get_hit_svg(plate_appearance),
+            get_outs_svg(plate_appearance, prev_plate_appearance)
+        )
+
+        if player_got_on_base(plate_appearance):
+            plate_appearance_svg += get_base_svg(plate_appearance,
+                                                 plate_appearance_list)
+
+        yield plate_appearance_svg
+
+        prev_plate_appearance = plate_appearance
+
+def get_svg_content_generator(game, render_cache=None):
     for inning_index, inning in enumerate(game.inning_list):
         tuple_list = [(inning.top_half_appearance_list, 'top'),
                       (inning.bottom_half_appearance_list, 'bottom')]
 
         for plate_appearance_list, inning_half_str in tuple_list:
             if plate_appearance_list:
-                prev_plate_appearance = None
-                for plate_appearance_tuple in enumerate(plate_appearance_list):
-                    pa_index, plate_appearance = plate_appearance_tuple
-
-                    plate_appearance_svg = '{}{}{}{}{}{}'.format(
-                        get_summary_svg(plate_appearance),
-                        get_pitch_svg(plate_appearance),
-                        get_runners_svg(plate_appearance),
-                        get_count_svg(plate_appearance),
-                        get_hit_svg(plate_appearance),
-                        get_outs_svg(plate_appearance, prev_plate_appearance)
+                if render_cache is None:
+                    svg_content_iter = get_half_inning_svg_content_generator(
+                        plate_appearance_list
                     )
-
-                    if player_got_on_base(plate_appearance):
-                        plate_appearance_svg += get_base_svg(
-                            plate_appearance,
-                            plate_appearance_list
-                        )
-
-                    id_tuple = (inning_index + 1, inning_half_str, pa_index + 1)
-                    content_list.append(
-                        (id_tuple,
-                         plate_appearance_svg,
-                         plate_appearance.plate_appearance_summary)
+                else:
+                    svg_content_iter = render_cache.get_svg_content_list(
+                        inning_index + 1,
+                        inning_half_str,
+                        plate_appearance_list
                     )
 
-                    prev_plate_appearance = plate_appearance
+                for pa_index, (plate_appearance, plate_appearance_svg) in (
+                        enumerate(zip(plate_appearance_list,
+                                      svg_content_iter))
+                ):
+                    id_tuple = (inning_index + 1, inning_half_str, pa_index + 1)
+                    yield (id_tuple,
+                           plate_appearance_svg,
+                           plate_appearance.plate_appearance_summary)
 
-    return content_list
+def get_svg_content_list(game):
+    return list(get_svg_content_generator(game))
 
 def get_batter_spacing_values(batter_list):
     if len(batter_list) <= 5:
@@ -1310,13 +1355,12 @@ def get_batter_spacing_values(batter_list):
             stats_y_offset,
             box_score_line_template)
 
-def get_team_batter_box_score_list(game, team, box_score_dict, offset):
-    box_score_svg = ''
+def get_team_batter_box_score_generator(game, team, box_score_dict, offset):
     num_innings = max(len(game.inning_list), NUM_MINIMUM_INNINGS)
     box_score_x_offset = BOX_WIDTH * (num_innings + 1)
 
     for batter_list in team.batting_order_list_list:
-        box_score_svg += BATTER_SVG_HEADER.format(
+        yield BATTER_SVG_HEADER.format(
             x_pos=box_score_x_offset,
             y_pos=offset + (BOX_HEIGHT // 2)
         )
@@ -1336,7 +1380,7 @@ def get_team_batter_box_score_list(game, team, box_score_dict, offset):
                     box_score_dict[batter_appearance.player_obj]
                 )
 
-            box_score_svg += BOX_SCORE_LINE_TEMPLATE.format(
+            yield BOX_SCORE_LINE_TEMPLATE.format(
                 name_y_pos=batter_y_pos,
                 box_score_line=box_score_line_str,
                 batter_font_size=batter_font_size
@@ -1345,15 +1389,17 @@ def get_team_batter_box_score_list(game, team, box_score_dict, offset):
             batter_y_pos += batter_space_increment
             last_batter = batter_appearance.player_obj
 
-        box_score_svg += SVG_FOOTER
+        yield SVG_FOOTER
         offset += BOX_HEIGHT
 
-    return box_score_svg
+def get_team_batter_box_score_list(game, team, box_score_dict, offset):
+    return ''.join(
+        get_team_batter_box_score_generator(game, team, box_score_dict, offset)
+    )
 
-def get_team_batter_list(team, offset):
-    batter_svg = ''
+def get_team_batter_list_generator(team, offset):
     for batter_list in team.batting_order_list_list:
-        batter_svg += BATTER_SVG_HEADER.format(
+        yield BATTER_SVG_HEADER.format(
             x_pos=0,
             y_pos=offset + (BOX_HEIGHT // 2)
         )
@@ -1369,12 +1415,14 @@ def get_team_batter_list(team, offset):
                 batter_str = ''
                 stats_str = ''
             else:
-                batter_str = '{}'.format(batter_appearance.player_obj)
-                if (batter_appearance.player_obj.obp and
-                        batter_appearance.player_obj.slg):
+                batter_str = batter_appearance.player_obj.get_display_str(
+                    batter_appearance.player_stats
+                )
+                if (batter_appearance.player_stats.obp and
+                        batter_appearance.player_stats.slg):
                     stats_str = 'OBP: {:.3f}, SLG: {:.3f}'.format(
-                        batter_appearance.player_obj.obp,
-                        batter_appearance.player_obj.slg
+                        batter_appearance.player_stats.obp,
+                        batter_appearance.player_stats.slg
                     )
                 else:
                     stats_str = ''
@@ -1382,7 +1430,7 @@ def get_team_batter_list(team, offset):
             appears_str = '({}, {})'.format(batter_appearance.start_inning_num,
                                             batter_appearance.position)
 
-            batter_svg += BATTER_NAME_TEMPLATE.format(
+            yield BATTER_NAME_TEMPLATE.format(
                 batter_id=batter_appearance.player_obj.mlb_id,
                 name_y_pos=batter_y_pos,
                 stats_y_pos=batter_y_pos + stats_y_offset,
@@ -1396,26 +1444,25 @@ def get_team_batter_list(team, offset):
             batter_y_pos += batter_space_increment
             last_batter = batter_appearance.player_obj
 
-        batter_svg += SVG_FOOTER
+        yield SVG_FOOTER
         offset += BOX_HEIGHT
 
-    return batter_svg
-
-def get_batter_list_and_stats(game):
-    both_teams_batters_svg = ''
+def get_team_batter_list(team, offset):
+    return ''.join(get_team_batter_list_generator(team, offset))
 
+def get_batter_list_and_stats_generator(game):
     tuple_list = [
         (game.away_team, game.away_batter_box_score_dict, 0),
         (game.home_team, game.home_batter_box_score_dict, HEIGHT // 2)
     ]
 
     for team, box_score_dict, offset in tuple_list:
-        both_teams_batters_svg += '{}{}'.format(
-            get_team_batter_list(team, offset),
-            get_team_batter_box_score_list(game, team, box_score_dict, offset)
-        )
+        yield from get_team_batter_list_generator(team, offset)
+        yield from get_team_batter_box_score_generator(game, team,
+                                                       box_score_dict, offset)
 
-    return both_teams_batters_svg
+def get_batter_list_and_stats(game):
+    return ''.join(get_batter_list_and_stats_generator(game))
 
 def get_team_stats_box(box_x, box_y, stats_tuple):
     box_1_x = box_x
@@ -1700,8 +1747,8 @@ def get_box_score_whip_era(box_score_tuple):
 
     return era_str, whip_str
 
-def get_pitcher_box_score_lines(pitcher_app_list, chunk_size, box_score_dict):
-    pitcher_rows_svg = ''
+def get_pitcher_box_score_line_generator(pitcher_app_list, chunk_size,
+                                         box_score_dict):
     row_increment = 0
 
     if chunk_size == SMALL_CHUNK_SIZE:
@@ -1721,15 +1768,17 @@ def get_pitcher_box_score_lines(pitcher_app_list, chunk_size, box_score_dict):
         initial_y = PITCHER_BOX_SCORE_SMALL_Y
         box_score_tuple = box_score_dict[pitcher_app.player_obj]
         era_str, whip_str = get_box_score_whip_era(box_score_tuple)
-        initial_era_stat_str = 'ERA: ' + str(pitcher_app.player_obj.era)
+        initial_era_stat_str = 'ERA: ' + str(pitcher_app.player_stats.era)
         appears_str = '({}, {})'.format(pitcher_app.start_inning_num,
                                         pitcher_app.position)
 
-        pitcher_rows_svg += PITCHER_STATS_LINE_TEMPLATE.format(
+        yield PITCHER_STATS_LINE_TEMPLATE.format(
             pitcher_id=pitcher_app.player_obj.mlb_id,
             name_y_pos=initial_y + row_increment,
             stats_y_pos=stats_offset + row_increment,
-            pitcher=pitcher_app.player_obj,
+            pitcher=pitcher_app.player_obj.get_display_str(
+                pitcher_app.player_stats
+            ),
             box_score_1=box_score_tuple.IP, box_score_2=box_score_tuple.WLS,
             box_score_3=box_score_tuple.BF, box_score_4=box_score_tuple.H,
             box_score_5=box_score_tuple.R, box_score_6=box_score_tuple.ER,
@@ -1747,29 +1796,32 @@ def get_pitcher_box_score_lines(pitcher_app_list, chunk_size, box_score_dict):
 
         row_increment += defined_text_increment
 
-    return pitcher_rows_svg
+def get_pitcher_box_score_lines(pitcher_app_list, chunk_size, box_score_dict):
+    return ''.join(get_pitcher_box_score_line_generator(pitcher_app_list,
+                                                        chunk_size,
+                                                        box_score_dict))
 
 def chunks(this_list, num_elements):
     for i in range(0, len(this_list), num_elements):
         yield this_list[i:i + num_elements]
 
-def create_pitcher_stats_svg(chunk_tuple_list, chunk_size, box_score_dict):
-    pitcher_stats_svg = ''
+def get_pitcher_stats_svg_generator(chunk_tuple_list, chunk_size,
+                                    box_score_dict):
     for location, pitcher_chunk in chunk_tuple_list:
         x_box, y_box = location
-        pitcher_stats_svg += PITCHER_STATS_HEADER.format(x_box=x_box,
-                                                         y_box=y_box)
-
-        pitcher_stats_svg += '{}{}'.format(
-            get_pitcher_box_score_lines(pitcher_chunk,
-                                        chunk_size,
-                                        box_score_dict),
-            SVG_FOOTER
-        )
+        yield PITCHER_STATS_HEADER.format(x_box=x_box, y_box=y_box)
+        yield from get_pitcher_box_score_line_generator(pitcher_chunk,
+                                                        chunk_size,
+                                                        box_score_dict)
 
-    return pitcher_stats_svg
+        yield SVG_FOOTER
 
-def add_team_pitcher_box_score(team, box_score_dict, offset):
+def create_pitcher_stats_svg(chunk_tuple_list, chunk_size, box_score_dict):
+    return ''.join(get_pitcher_stats_svg_generator(chunk_tuple_list,
+                                                   chunk_size,
+                                                   box_score_dict))
+
+def get_team_pitcher_box_score_generator(team, box_score_dict, offset):
     pitcher_app_list = team.pitcher_list
     if len(pitcher_app_list) <= 10:
         chunk_size = SMALL_CHUNK_SIZE
@@ -1791,15 +1843,16 @@ def add_team_pitcher_box_score(team, box_score_dict, offset):
 
         chunk_tuple_list.append((location_tuple, pitcher_chunk))
 
-    pitcher_stats_svg = create_pitcher_stats_svg(chunk_tuple_list,
-                                                 chunk_size,
-                                                 box_score_dict)
+    yield from get_pitcher_stats_svg_generator(chunk_tuple_list,
+                                               chunk_size,
+                                               box_score_dict)
 
-    return pitcher_stats_svg
-
-def add_all_pitcher_box_scores(game):
-    all_pitcher_box_svg = ''
+def add_team_pitcher_box_score(team, box_score_dict, offset):
+    return ''.join(get_team_pitcher_box_score_generator(team,
+                                                        box_score_dict,
+                                                        offset))
 
+def get_all_pitcher_box_score_generator(game):
     tuple_list = [
         (game.home_team,
          game.home_pitcher_box_score_dict,
@@ -1811,11 +1864,12 @@ def add_all_pitcher_box_scores(game):
 
     for this_tuple in tuple_list:
         team, box_score_dict, offset = this_tuple
-        all_pitcher_box_svg += add_team_pitcher_box_score(team,
-                                                          box_score_dict,
-                                                          offset)
+        yield from get_team_pitcher_box_score_generator(team,
+                                                        box_score_dict,
+                                                        offset)
 
-    return all_pitcher_box_svg
+def add_all_pitcher_box_scores(game):
+    return ''.join(get_all_pitcher_box_score_generator(game))
 
 def get_team_stats_svg(game):
     team_stats_svg = ''
@@ -1881,8 +1935,7 @@ def is_bat_around(this_inning_tuple_list, inning_pa_num):
                            LEN_BATTING_LIST))
     )
 
-def assemble_stats_svg(game):
-    stats_svg = ''
+def get_stats_svg_generator(game):
     inning_half_stats_list = get_inning_half_stats_tuple_list(game)
     for inning_num, inning_half_str, stats_tuple in inning_half_stats_list:
         if stats_tuple:
@@ -1898,9 +1951,10 @@ def assemble_stats_svg(game):
             else:
                 raise ValueError('Invalid inning half str')
 
-            stats_svg += get_inning_stats_box(box_x, box_y, stats_tuple)
+            yield get_inning_stats_box(box_x, box_y, stats_tuple)
 
-    return stats_svg
+def assemble_stats_svg(game):
+    return ''.join(get_stats_svg_generator(game))
 
 def get_signature(game):
     signature_svg = ''
@@ -1946,44 +2000,65 @@ def write_individual_pa_svg(svg_content, inning_pa_num, this_inning_tuple_list,
 
     return this_svg
 
-def assemble_box_content_dict(game):
-    content_list_svg = ''
-    svg_content_list = get_svg_content_list(game)
+def get_box_layout_generator(game):
     top_pa_index = 0
     bottom_pa_index = 0
-    for id_tuple, svg_content, summary in svg_content_list:
-        inning_num, inning_half_str, inning_pa_num = id_tuple
-        top_offset = top_pa_index % LEN_BATTING_LIST
-        bottom_offset = bottom_pa_index % LEN_BATTING_LIST
+    for inning_index, inning in enumerate(game.inning_list):
+        inning_num = inning_index + 1
         this_x_pos = inning_num * BOX_WIDTH
-        if inning_half_str == 'bottom':
-            if summary != 'Runner Out':
-                bottom_pa_index += 1
-
-            this_y_pos = (HEIGHT // 2 +
-                          bottom_offset * BOX_HEIGHT +
-                          BOX_HEIGHT // 2)
-        elif inning_half_str == 'top':
-            if summary != 'Runner Out':
-                top_pa_index += 1
-
-            this_y_pos = (top_offset * BOX_HEIGHT +
-                          BOX_HEIGHT // 2)
-        else:
-            raise ValueError('Invalid inning half str')
-
-        this_inning_tuple_list = [
-            id_tuple for (id_tuple, _, _) in svg_content_list
-            if id_tuple[0] == inning_num and id_tuple[1] == inning_half_str
-        ]
+        tuple_list = [(inning.top_half_appearance_list, 'top'),
+                      (inning.bottom_half_appearance_list, 'bottom')]
 
-        content_list_svg += write_individual_pa_svg(svg_content,
-                                                    inning_pa_num,
-                                                    this_inning_tuple_list,
-                                                    this_x_pos,
-                                                    this_y_pos)
+        for plate_appearance_list, inning_half_str in tuple_list:
+            if plate_appearance_list:
+                this_inning_tuple_list = [
+                    (inning_num, inning_half_str, pa_index + 1)
+                    for pa_index in range(len(plate_appearance_list))
+                ]
+
+                for id_tuple, plate_appearance in zip(this_inning_tuple_list,
+                                                      plate_appearance_list):
+                    summary = plate_appearance.plate_appearance_summary
+                    if inning_half_str == 'bottom':
+                        bottom_offset = bottom_pa_index % LEN_BATTING_LIST
+                        if summary != 'Runner Out':
+                            bottom_pa_index += 1
+
+                        this_y_pos = (HEIGHT // 2 +
+                                      bottom_offset * BOX_HEIGHT +
+                                      BOX_HEIGHT // 2)
+                    else:
+                        top_offset = top_pa_index % LEN_BATTING_LIST
+                        if summary != 'Runner Out':
+                            top_pa_index += 1
+
+                        this_y_pos = (top_offset * BOX_HEIGHT +
+                                      BOX_HEIGHT // 2)
+
+                    yield (id_tuple[2],
+                           this_inning_tuple_list,
+                           this_x_pos,
+                           this_y_pos)
+
+def get_box_content_svg_generator(game, render_cache=None):
+    for layout_tuple, content_tuple in zip(
+            get_box_layout_generator(game),
+            get_svg_content_generator(game, render_cache)
+    ):
+        (inning_pa_num,
+         this_inning_tuple_list,
+         this_x_pos,
+         this_y_pos) = layout_tuple
+
+        _, svg_content, _ = content_tuple
+        yield write_individual_pa_svg(svg_content,
+                                      inning_pa_num,
+                                      this_inning_tuple_list,
+                                      this_x_pos,
+                                      this_y_pos)
 
-    return content_list_svg
+def assemble_box_content_dict(game):
+    return ''.join(get_box_content_svg_generator(game))
 
 def get_game_title_str(game):
     game_teams_str = '{} @ {}'.format(game.away_team.name,
@@ -2030,24 +2105,27 @@ def get_footer_box(game):
 
     return footer_box_svg
 
-def get_game_svg_str(game):
-    big_svg_text = '{}{}{}{}{}{}{}{}{}{}{}{}{}{}{}{}'.format(
-        get_big_svg_header(game),
-        get_batter_list_and_stats(game),
-        assemble_stats_svg(game),
-        assemble_box_content_dict(game),
-        get_team_stats_svg(game),
-        add_away_batter_sub_division_lines(game),
-        add_home_batter_sub_division_lines(game),
-        add_away_pitcher_sub_division_lines(game),
-        add_home_pitcher_sub_division_lines(game),
-        add_all_pitcher_box_scores(game),
-        assemble_game_title_svg(game),
-        get_signature(game),
-        get_box_score_totals(game),
-        get_big_rectangles(game),
-        get_footer_box(game),
-        SVG_FOOTER
-    )
-
-    return big_svg_text
+def get_game_svg_generator(game, render_cache=None):
+    yield get_big_svg_header(game)
+    yield from get_batter_list_and_stats_generator(game)
+    yield from get_stats_svg_generator(game)
+    yield from get_box_content_svg_generator(game, render_cache)
+    yield get_team_stats_svg(game)
+    yield add_away_batter_sub_division_lines(game)
+    yield add_home_batter_sub_division_lines(game)
+    yield add_away_pitcher_sub_division_lines(game)
+    yield add_home_pitcher_sub_division_lines(game)
+    yield from get_all_pitcher_box_score_generator(game)
+    yield assemble_game_title_svg(game)
+    yield get_signature(game)
+    yield get_box_score_totals(game)
+    yield get_big_rectangles(game)
+    yield get_footer_box(game)
+    yield SVG_FOOTER
+
+def write_svg(game, filehandle, render_cache=None):
+    for svg_fragment in get_game_svg_generator(game, render_cache):
+        filehandle.write(svg_fragment)
+
+def get_game_svg_str(game, render_cache=None):
+    return ''.join(get_game_svg_generator(game, render_cache))
@@ -0,0 +1,148 @@
+from hashlib import sha256
+from json import dumps, loads
+from os import environ, makedirs, utime
+from os.path import abspath, join
+from re import search
+
+from requests import get
+
+from baseball.cache_dir import store_cache_file
+
+
+HTTP_CACHE_DIR_VARIABLE = 'BASEBALL_HTTP_CACHE_DIR'
+HTTP_CACHE_MAX_BYTES_VARIABLE = 'BASEBALL_HTTP_CACHE_MAX_BYTES'
+DEFAULT_HTTP_CACHE_MAX_BYTES = 1024 ** 3
+HTTP_CACHE_SUFFIX = '.http'
+HTTP_CACHE_VARIABLE_LIST = [HTTP_CACHE_DIR_VARIABLE,
+                            HTTP_CACHE_MAX_BYTES_VARIABLE]
+FINAL_STATUS_LIST = ['F', 'FR', 'FT']
+
+
+def enable_http_cache(cache_dir, max_cache_bytes=DEFAULT_HTTP_CACHE_MAX_BYTES):
+    cache_dir = abspath(cache_dir)
+    makedirs(cache_dir, exist_ok=True)
+    environ[HTTP_CACHE_DIR_VARIABLE] = cache_dir
+    environ[HTTP_CACHE_MAX_BYTES_VARIABLE] = str(max_cache_bytes)
+
+def disable_http_cache():
+    environ.pop(HTTP_CACHE_DIR_VARIABLE, None)
+    environ.pop(HTTP_CACHE_MAX_BYTES_VARIABLE, None)
+
+def get_http_cache_dir():
+    return environ.get(HTTP_CACHE_DIR_VARIABLE)
+
+def get_http_cache_max_bytes():
+    return int(environ.get(HTTP_CACHE_MAX_BYTES_VARIABLE,
+                           DEFAULT_HTTP_CACHE_MAX_BYTES))
+
+def get_http_cache_path(cache_dir, url):
+    return join(cache_dir,
+                sha256(url.encode('utf-8')).hexdigest() + HTTP_CACHE_SUFFIX)
+
+def is_final_boxscore(boxscore_text):
+    status_match = search(r'<boxscore\s[^>]*\bstatus_ind="([^"]*)"',
+                          boxscore_text or '')
+
+    return bool(status_match and status_match.group(1) in FINAL_STATUS_LIST)
+
+def load_http_cache_entry(cache_path):
+    try:
+        with open(cache_path, 'rb') as filehandle:
+            header_line = filehandle.readline()
+            body_bytes = filehandle.read()
+
+        utime(cache_path)
+        http_cache_entry = loads(header_line.decode('utf-8'))
+        http_cache_entry['text'] = body_bytes.decode('utf-8')
+    except (OSError, ValueError):
+        http_cache_entry = None
+
+    return http_cache_entry
+
+def store_http_cache_entry(cache_dir, cache_path, http_cache_entry,
+                           max_cache_bytes):
+    header_dict = {key: value for key, value in http_cache_entry.items()
+                   if key != 'text'}
+
+    store_cache_file(cache_dir, cache_path,
+                     (dumps(header_dict).encode('utf-8') + b'\n' +
+                      http_cache_entry['text'].encode('utf-8')),
+                     max_cache_bytes, HTTP_CACHE_SUFFIX)
+
+def get_conditional_header_dict(http_cache_entry):
+    header_dict = {}
+    if http_cache_entry:
+        if http_cache_entry['etag']:
+            header_dict['If-None-Match'] = http_cache_entry['etag']
+
+        if http_cache_entry['last_modified']:
+            header_dict['If-Modified-Since'] = (
+                http_cache_entry['last_modified']
+            )
+
+    return header_dict
+
+def is_final_text(response_text, final, final_function):
+    return bool(final or (final_function and final_function(response_text)))
+
+def get_cached_url_status_and_text(cache_dir, url, final, final_function,
+                                   get_function):
+    cache_path = get_http_cache_path(cache_dir, url)
+    http_cache_entry = load_http_cache_entry(cache_path)
+    if http_cache_entry and http_cache_entry['final']:
+        status_code = 200
+        response_text = http_cache_entry['text']
+    else:
+        response = get_function(
+            url,
+            headers=get_conditional_header_dict(http_cache_entry)
+        )
+
+        status_code = response.status_code
+        if response.status_code == 304 and http_cache_entry:
+            status_code = 200
+            response_text = http_cache_entry['text']
+            if is_final_text(response_text, final, final_function):
+                http_cache_entry['final'] = True
+                store_http_cache_entry(cache_dir, cache_path,
+                                       http_cache_entry,
+                                       get_http_cache_max_bytes())
+        else:
+            response_text = response.text
+            if response.status_code == 200:
+                store_http_cache_entry(
+                    cache_dir,
+                    cache_path,
+                    {'url': url,
+                     'etag': response.headers.get('ETag'),
+                     'last_modified': response.headers.get('Last-Modified'),
+                     'final': is_final_text(response_text, final,
+                                            final_function),
+                     'text': response_text},
+                    get_http_cache_max_bytes()
+                )
+
+    return status_code, response_text
+
+def get_url_status_and_text(url, final=False, final_function=None,
+                            session=None):
+    if session is None:
+        get_function = get
+    else:
+        get_function = session.get
+
+    cache_dir = get_http_cache_dir()
+    if cache_dir:
+        status_code, response_text = get_cached_url_status_and_text(
+            cache_dir, url, final, final_function, get_function
+        )
+    else:
+        response = get_function(url)
+        status_code, response_text = response.status_code, response.text
+
+    return status_code, response_text
+
+def get_url_text(url, final=False, final_function=None):
+    _, response_text = get_url_status_and_text(url, final, final_function)
+
+    return response_text
@@ -0,0 +1,195 @@
+from xml.etree.ElementTree import fromstring
+
+from baseball.baseball import Inning
+from baseball.fetch_game import MLB_URL_PATTERN, get_game_xml_from_url
+from baseball.generate_svg import ScorecardRenderCache
+from baseball.process_game_xml import (get_pitcher_status_dict,
+                                       initialize_game,
+                                       process_half_inning,
+                                       set_pitcher_wls_codes)
+
+
+HALF_INNING_STR_LIST = ['top', 'bottom']
+
+
+def get_half_inning_fingerprint(half_inning_xml):
+    return hash(tuple((x.tag, tuple(x.attrib.items()), x.text)
+                      for x in half_inning_xml.iter()))
+
+def get_appearance_list_state(team):
+    appearance_list_list = [team.pitcher_list] + [
+        x for x in team.batting_order_list_list if x
+    ]
+
+    return [(appearance_list,
+             len(appearance_list),
+             appearance_list[-1],
+             (appearance_list[-1].end_inning_num,
+              appearance_list[-1].end_inning_half,
+              appearance_list[-1].end_inning_batter_num))
+            for appearance_list in appearance_list_list if appearance_list]
+
+def get_game_state(game):
+    return (get_appearance_list_state(game.away_team) +
+            get_appearance_list_state(game.home_team))
+
+def restore_game_state(game_state):
+    for (appearance_list,
+         list_length,
+         final_appearance,
+         (end_inning_num,
+          end_inning_half,
+          end_inning_batter_num)) in game_state:
+        del appearance_list[list_length:]
+        final_appearance.end_inning_num = end_inning_num
+        final_appearance.end_inning_half = end_inning_half
+        final_appearance.end_inning_batter_num = end_inning_batter_num
+
+
+class LiveGame(object):
+    def __init__(self, boxscore_xml, team_xml, player_registry=None):
+        (self.game,
+         self.away_pitcher_status_dict,
+         self.home_pitcher_status_dict) = initialize_game(boxscore_xml,
+                                                          team_xml,
+                                                          player_registry)
+
+        self.half_inning_record_list = []
+        self.inning_half_count_list = []
+        self.render_cache = ScorecardRenderCache()
+
+    def get_svg_str(self):
+        return self.game.get_svg_str(self.render_cache)
+
+    def write_svg(self, filehandle):
+        self.game.write_svg(filehandle, self.render_cache)
+
+    def update_boxscore(self, boxscore_xml):
+        for item in boxscore_xml:
+            if item.tag == 'pitching':
+                if item.get('team_flag') == 'away':
+                    self.away_pitcher_status_dict, _ = (
+                        get_pitcher_status_dict(item)
+                    )
+                elif item.get('team_flag') == 'home':
+                    self.home_pitcher_status_dict, _ = (
+                        get_pitcher_status_dict(item)
+                    )
+
+    def get_first_changed_index(self, half_inning_xml_list):
+        for i, (fingerprint, _, _) in enumerate(self.half_inning_record_list):
+            if (i >= len(half_inning_xml_list) or
+                    fingerprint != get_half_inning_fingerprint(
+                        half_inning_xml_list[i]
+                    )):
+                return i
+
+        return len(self.half_inning_record_list)
+
+    def update(self, game_xml, boxscore_xml=None):
+        if boxscore_xml is not None:
+            self.update_boxscore(boxscore_xml)
+
+        half_inning_xml_list = []
+        inning_half_count_list = []
+        for inning_xml in game_xml:
+            this_half_inning_xml_list = list(inning_xml)[:2]
+            half_inning_xml_list += this_half_inning_xml_list
+            inning_half_count_list.append(len(this_half_inning_xml_list))
+
+        first_changed_index = self.get_first_changed_index(
+            half_inning_xml_list
+        )
+
+        if first_changed_index < len(self.half_inning_record_list):
+            restore_game_state(
+                self.half_inning_record_list[first_changed_index][1]
+            )
+
+            del self.half_inning_record_list[first_changed_index:]
+
+        reused_inning_count = 0
+        half_inning_index = 0
+        for old_half_count, new_half_count in zip(self.inning_half_count_list,
+                                                  inning_half_count_list):
+            if (old_half_count != new_half_count or
+                    half_inning_index + new_half_count >
+                    first_changed_index):
+                break
+
+            reused_inning_count += 1
+            half_inning_index += new_half_count
+
+        del self.game.inning_list[reused_inning_count:]
+        for half_count in inning_half_count_list[reused_inning_count:]:
+            appearance_list_list = [None, None]
+            for i in range(half_count):
+                if half_inning_index < len(self.half_inning_record_list):
+                    appearance_list_list[i] = self.half_inning_record_list[
+                        half_inning_index
+                    ][2]
+                else:
+                    half_inning_xml = half_inning_xml_list[half_inning_index]
+                    game_state = get_game_state(self.game)
+                    appearance_list_list[i] = process_half_inning(
+                        half_inning_xml, HALF_INNING_STR_LIST[i], self.game
+                    )
+
+                    self.half_inning_record_list.append(
+                        (get_half_inning_fingerprint(half_inning_xml),
+                         game_state,
+                         appearance_list_list[i])
+                    )
+
+                half_inning_index += 1
+
+            self.game.inning_list.append(Inning(*appearance_list_list))
+
+        self.inning_half_count_list = inning_half_count_list
+
+        set_pitcher_wls_codes(self.game,
+                              self.away_pitcher_status_dict,
+                              self.home_pitcher_status_dict)
+
+        self.game.set_box_scores()
+        if self.game.inning_list:
+            self.game.set_gametimes()
+
+        return self.game
+
+
+def get_live_game_from_xml_strings(boxscore_raw_xml, players_raw_xml,
+                                   inning_raw_xml, live_game=None,
+                                   player_registry=None):
+    if boxscore_raw_xml and players_raw_xml and inning_raw_xml:
+        boxscore_xml_obj = fromstring(boxscore_raw_xml)
+        players_xml_obj = fromstring(players_raw_xml)
+        inning_xml_obj = fromstring(inning_raw_xml)
+        if (boxscore_xml_obj.tag != 'Error' and
+                players_xml_obj.tag != 'Error' and
+                inning_xml_obj.tag != 'Error'):
+            if live_game is None:
+                live_game = LiveGame(boxscore_xml_obj, players_xml_obj,
+                                     player_registry)
+
+            live_game.update(inning_xml_obj, boxscore_xml_obj)
+
+    return live_game
+
+def get_live_game_from_url(date_str, away_code, home_code, game_number,
+                           live_game=None, url_pattern=MLB_URL_PATTERN,
+                           player_registry=None):
+    (game_id,
+     boxscore_raw_xml,
+     players_raw_xml,
+     inning_raw_xml) = get_game_xml_from_url(date_str,
+                                             away_code,
+                                             home_code,
+                                             game_number,
+                                             url_pattern)
+
+    return game_id, get_live_game_from_xml_strings(boxscore_raw_xml,
+                                                   players_raw_xml,
+                                                   inning_raw_xml,
+                                                   live_game,
+                                                   player_registry)
@@ -0,0 +1,199 @@
+from json import dump, load
+from os import makedirs
+from os.path import join
+
+import numpy
+
+from baseball.baseball_events import Pitch
+from baseball.fetch_game import get_game_generator_from_file_range
+
+
+PITCH_TABLE_VERSION = 1
+PITCH_TABLE_CATEGORY_FILENAME = 'categories.json'
+
+PITCH_TABLE_COLUMN_LIST = [
+    ('game_id_code', 'int32'),
+    ('inning', 'int16'),
+    ('half', 'int8'),
+    ('plate_appearance_index', 'int16'),
+    ('pitcher_id', 'int32'),
+    ('batter_id', 'int32'),
+    ('pitch_description_code', 'int16'),
+    ('pitch_type_code', 'int16'),
+    ('pitch_speed', 'float32'),
+    ('pitch_x', 'float32'),
+    ('pitch_y', 'float32'),
+    ('pitch_datetime', 'datetime64[s]')
+]
+
+PITCH_TABLE_CATEGORY_LIST = ['game_id', 'pitch_description', 'pitch_type']
+
+TOP_HALF_CODE = 0
+BOTTOM_HALF_CODE = 1
+MISSING_CATEGORY_CODE = -1
+
+
+class PitchTable(object):
+    def __init__(self, column_dict, category_dict):
+        self.column_dict = column_dict
+        self.category_dict = category_dict
+        self.category_code_dict = {
+            category_name: {value: i for i, value in enumerate(value_list)}
+            for category_name, value_list in category_dict.items()
+        }
+
+    def __len__(self):
+        return len(self.column_dict['game_id_code'])
+
+    def __getitem__(self, column_name):
+        return self.column_dict[column_name]
+
+    def get_code(self, category_name, value):
+        return self.category_code_dict[category_name].get(
+            value, MISSING_CATEGORY_CODE
+        )
+
+    def get_value_array(self, category_name):
+        value_array = numpy.array(self.category_dict[category_name] + [None],
+                                  dtype=object)
+
+        return value_array[self.column_dict[category_name + '_code']]
+
+    def filter(self, mask):
+        return PitchTable(
+            {column_name: column_array[mask]
+             for column_name, column_array in self.column_dict.items()},
+            self.category_dict
+        )
+
+    def save(self, output_dir):
+        makedirs(output_dir, exist_ok=True)
+        for column_name, _ in PITCH_TABLE_COLUMN_LIST:
+            numpy.save(join(output_dir, column_name + '.npy'),
+                       self.column_dict[column_name])
+
+        category_filename = join(output_dir, PITCH_TABLE_CATEGORY_FILENAME)
+        with open(category_filename, 'w', encoding='utf-8') as filehandle:
+            dump({'version': PITCH_TABLE_VERSION,
+                  'category_dict': self.category_dict},
+                 filehandle)
+
+    @classmethod
+    def load(cls, input_dir, mmap=True):
+        category_filename = join(input_dir, PITCH_TABLE_CATEGORY_FILENAME)
+        with open(category_filename, 'r', encoding='utf-8') as filehandle:
+            category_json = load(filehandle)
+
+        if category_json.get('version') != PITCH_TABLE_VERSION:
+            raise ValueError(
+                'Unsupported pitch table version: {}'.format(
+                    category_json.get('version')
+                )
+            )
+
+        if mmap:
+            mmap_mode = 'r'
+        else:
+            mmap_mode = None
+
+        column_dict = {
+            column_name: numpy.load(join(input_dir, column_name + '.npy'),
+                                    mmap_mode=mmap_mode)
+            for column_name, _ in PITCH_TABLE_COLUMN_LIST
+        }
+
+        return cls(column_dict, category_json['category_dict'])
+
+
+def get_category_code(category_code_dict, category_list, value):
+    if value is None:
+        category_code = MISSING_CATEGORY_CODE
+    else:
+        if value not in category_code_dict:
+            category_code_dict[value] = len(category_list)
+            category_list.append(value)
+
+        category_code = category_code_dict[value]
+
+    return category_code
+
+def get_game_pitch_generator(game):
+    for inning_index, inning in enumerate(game.inning_list):
+        for half_code, appearance_list in (
+                (TOP_HALF_CODE, inning.top_half_appearance_list),
+                (BOTTOM_HALF_CODE, inning.bottom_half_appearance_list)
+        ):
+            for appearance_index, appearance in enumerate(
+                    appearance_list or []
+            ):
+                for event in appearance.event_list:
+                    if isinstance(event, Pitch):
+                        yield (inning_index + 1,
+                               half_code,
+                               appearance_index,
+                               appearance,
+                               event)
+
+def get_pitch_table(game_tuple_iterable):
+    column_list_dict = {column_name: []
+                        for column_name, _ in PITCH_TABLE_COLUMN_LIST}
+
+    category_dict = {x: [] for x in PITCH_TABLE_CATEGORY_LIST}
+    category_code_dict = {x: {} for x in PITCH_TABLE_CATEGORY_LIST}
+    for game_id, game in game_tuple_iterable:
+        game_id_code = get_category_code(category_code_dict['game_id'],
+                                         category_dict['game_id'],
+                                         game_id)
+
+        for (inning_num,
+             half_code,
+             appearance_index,
+             appearance,
+             pitch) in get_game_pitch_generator(game):
+            column_list_dict['game_id_code'].append(game_id_code)
+            column_list_dict['inning'].append(inning_num)
+            column_list_dict['half'].append(half_code)
+            column_list_dict['plate_appearance_index'].append(appearance_index)
+            column_list_dict['pitcher_id'].append(appearance.pitcher.mlb_id)
+            column_list_dict['batter_id'].append(appearance.batter.mlb_id)
+            column_list_dict['pitch_description_code'].append(
+                get_category_code(category_code_dict['pitch_description'],
+                                  category_dict['pitch_description'],
+                                  pitch.pitch_description)
+            )
+
+            column_list_dict['pitch_type_code'].append(
+                get_category_code(category_code_dict['pitch_type'],
+                                  category_dict['pitch_type'],
+                                  pitch.pitch_type)
+            )
+
+            if pitch.pitch_speed is None:
+                column_list_dict['pitch_speed'].append(numpy.nan)
+            else:
+                column_list_dict['pitch_speed'].append(pitch.pitch_speed)
+
+            column_list_dict['pitch_x'].append(pitch.pitch_position[0])
+            column_list_dict['pitch_y'].append(pitch.pitch_position[1])
+            if pitch.pitch_datetime is None:
+                column_list_dict['pitch_datetime'].append('NaT')
+            else:
+                column_list_dict['pitch_datetime'].append(
+                    pitch.pitch_datetime.replace(tzinfo=None)
+                )
+
+    column_dict = {
+        column_name: numpy.array(column_list_dict[column_name], dtype=dtype)
+        for column_name, dtype in PITCH_TABLE_COLUMN_LIST
+    }
+
+    return PitchTable(column_dict, category_dict)
+
+def get_pitch_table_from_file_range(start_date_str, end_date_str, input_dir,
+                                    team=None):
+    return get_pitch_table(
+        get_game_generator_from_file_range(start_date_str,
+                                           end_date_str,
+                                           input_dir,
+                                           team=team)
+    )
@@ -1,5 +1,6 @@
 from datetime import datetime
 from re import search, sub
+from xml.etree.ElementTree import iterparse, parse
 
 from pytz import UTC
 
@@ -7,6 +8,7 @@ from baseball.baseball import (POSITION_CODE_DICT,
                                PlateAppearance,
                                Player,
                                PlayerAppearance,
+                               PlayerStats,
                                Inning,
                                Team,
                                Game)
@@ -364,9 +366,11 @@ def process_at_bat(plate_appearance, event_list, game_obj, steal_description):
     if batter_id in game_obj.home_team:
         batter = game_obj.home_team[batter_id]
         batting_team = game_obj.home_team
+        fielding_team = game_obj.away_team
     elif batter_id in game_obj.away_team:
         batter = game_obj.away_team[batter_id]
         batting_team = game_obj.away_team
+        fielding_team = game_obj.home_team
     else:
         raise ValueError('Batter ID not in player_dict')
 
@@ -383,7 +387,8 @@ def process_at_bat(plate_appearance, event_list, game_obj, steal_description):
                                            inning_outs,
                                            scoring_runners_list,
                                            runners_batted_in_list,
-                                           event_list)
+                                           event_list,
+                                           fielding_team)
 
     if out_runner_supplemental_list:
         plate_appearance_obj.out_runners_list += out_runner_supplemental_list
@@ -397,7 +402,8 @@ def process_substitution(substitution_obj, inning_num, inning_half_str,
         substitution_obj.position,
         inning_num,
         inning_half_str,
-        next_batter_num
+        next_batter_num,
+        substituting_team.get_player_stats(substitution_obj.incoming_player)
     )
 
     batting_list_list = substituting_team.batting_order_list_list
@@ -443,7 +449,8 @@ def process_switch(switch_obj, inning_num, inning_half_str,
         switch_obj.new_position_num,
         inning_num,
         inning_half_str,
-        next_batter_num
+        next_batter_num,
+        switching_team.get_player_stats(switch_obj.player)
     )
 
     batting_list_list = switching_team.batting_order_list_list
@@ -621,7 +628,18 @@ def set_player_position_from_list(player_appearance_obj, appearance_list):
     if not player_appearance_obj.position:
         raise ValueError('Invalid substitution: no position')
 
-def create_player(player_xml):
+def get_player(last_name, first_name, mlb_id, obp, slg, number,
+               player_registry=None):
+    if player_registry is None:
+        player = Player(last_name, first_name, mlb_id, obp, slg, number)
+        player_stats = None
+    else:
+        player = player_registry.get_player(last_name, first_name, mlb_id)
+        player_stats = PlayerStats(obp, slg, number)
+
+    return player, player_stats
+
+def create_player(player_xml, player_registry=None):
     if (player_xml.get('num') and
             player_xml.get('num') != '--' and
             player_xml.get('num') != '-' and
@@ -630,15 +648,16 @@ def create_player(player_xml):
     else:
         player_num = None
 
-    return Player(player_xml.get('last'),
-                  player_xml.get('first'),
-                  int(player_xml.get('id')),
-                  None,
-                  None,
-                  player_num)
+    return get_player(player_xml.get('last'),
+                      player_xml.get('first'),
+                      int(player_xml.get('id')),
+                      None,
+                      None,
+                      player_num,
+                      player_registry)
 
-def init_player_list(player_obj, position):
-    return [PlayerAppearance(player_obj, position, 1, 'top', 1)]
+def init_player_list(player_obj, position, player_stats=None):
+    return [PlayerAppearance(player_obj, position, 1, 'top', 1, player_stats)]
 
 def parse_name(batter):
     batter_name = batter.get('name_display_first_last')
@@ -649,7 +668,8 @@ def parse_name(batter):
 
     return player_first_name, player_last_name
 
-def initialize_team(team_name, team_code, batter_xml_list):
+def initialize_team(team_name, team_code, batter_xml_list,
+                    player_registry=None):
     this_team = Team(team_name, team_code)
     for batter in batter_xml_list:
         if batter.tag == 'batter':
@@ -672,16 +692,18 @@ def initialize_team(team_name, team_code, batter_xml_list):
             else:
                 player_order = None
 
-            this_player = Player(player_last_name,
-                                 player_first_name,
-                                 player_id,
-                                 player_obp,
-                                 player_slg,
-                                 None)
+            this_player, this_player_stats = get_player(player_last_name,
+                                                        player_first_name,
+                                                        player_id,
+                                                        player_obp,
+                                                        player_slg,
+                                                        None,
+                                                        player_registry)
 
-            this_team.append(this_player)
+            this_team.append(this_player, this_player_stats)
             this_player_appearance_list = init_player_list(this_player,
-                                                           player_position_num)
+                                                           player_position_num,
+                                                           this_player_stats)
 
             if player_order:
                 if not this_team.batting_order_list_list[player_order - 1]:
@@ -710,7 +732,7 @@ def process_inning_xml(baseball_inning, game_obj):
 
     return this_inning_obj
 
-def process_team_xml(game_obj, team_xml):
+def process_team_xml(game_obj, team_xml, player_registry=None):
     away_team_xml, home_team_xml = [x for x in team_xml if x.tag == 'team']
 
     team_tuple_list = [(game_obj.away_team, away_team_xml),
@@ -723,28 +745,52 @@ def process_team_xml(game_obj, team_xml):
 
                 if player_id in this_team:
                     this_player = this_team[player_id]
+                    this_player_stats = this_team.get_player_stats(
+                        this_player
+                    )
 
                     if (player_xml.get('num') and
                             player_xml.get('num') != '--' and
                             player_xml.get('num') != 'null' and
                             player_xml.get('num') != ' '):
-                        this_player.number = int(player_xml.get('num'))
+                        this_player_stats.number = int(player_xml.get('num'))
                     else:
-                        this_player.number = ''
+                        this_player_stats.number = ''
 
                     if (player_xml.get('era') is not None and
                             '-' not in player_xml.get('era')):
-                        this_player.era = float(player_xml.get('era'))
+                        this_player_stats.era = float(player_xml.get('era'))
                     else:
-                        this_player.era = None
+                        this_player_stats.era = None
                 else:
                     if (player_xml.get('id') and
                             player_xml.get('last') and
                             player_xml.get('first')):
-                        this_player = create_player(player_xml)
-                        this_team.append(this_player)
+                        this_player, this_player_stats = create_player(
+                            player_xml, player_registry
+                        )
+
+                        this_team.append(this_player, this_player_stats)
+
+def get_pitcher_status_dict(pitcher_xml_list):
+    pitcher_status_dict = {}
+    starting_pitcher_id = None
+    for pitcher_xml in pitcher_xml_list:
+        pitcher_id = int(pitcher_xml.get('id'))
+        if not starting_pitcher_id:
+            starting_pitcher_id = pitcher_id
 
-def initialize_game_object(boxscore_xml):
+        note = pitcher_xml.get('note')
+        if note:
+            pitcher_status_dict[pitcher_id] = (
+                note.split('(')[1].split(',')[0]
+            )
+        else:
+            pitcher_status_dict[pitcher_id] = ''
+
+    return pitcher_status_dict, starting_pitcher_id
+
+def initialize_game_object(boxscore_xml, player_registry=None):
     game_venue = boxscore_xml.get('venue_name')
     home_code = get_team_abbreviation(boxscore_xml.get('home_team_code'))
     home_name = boxscore_xml.get('home_fname')
@@ -760,38 +806,20 @@ def initialize_game_object(boxscore_xml):
     for item in boxscore_xml:
         if item.tag == 'batting':
             if item.get('team_flag') == 'away':
-                away_team = initialize_team(away_name, away_code, item)
+                away_team = initialize_team(away_name, away_code, item,
+                                            player_registry)
             elif item.get('team_flag') == 'home':
-                home_team = initialize_team(home_name, home_code, item)
+                home_team = initialize_team(home_name, home_code, item,
+                                            player_registry)
             else:
                 raise ValueError('Invalid team flag')
         elif item.tag == 'pitching':
             if item.get('team_flag') == 'away':
-                for pitcher_xml in item:
-                    pitcher_id = int(pitcher_xml.get('id'))
-                    if not away_starting_pitcher_id:
-                        away_starting_pitcher_id = pitcher_id
-
-                    note = pitcher_xml.get('note')
-                    if note:
-                        away_pitcher_status_dict[pitcher_id] = (
-                            note.split('(')[1].split(',')[0]
-                        )
-                    else:
-                        away_pitcher_status_dict[pitcher_id] = ''
+                (away_pitcher_status_dict,
+                 away_starting_pitcher_id) = get_pitcher_status_dict(item)
             elif item.get('team_flag') == 'home':
-                for pitcher_xml in item:
-                    pitcher_id = int(pitcher_xml.get('id'))
-                    if not home_starting_pitcher_id:
-                        home_starting_pitcher_id = pitcher_id
-
-                    note = pitcher_xml.get('note')
-                    if note:
-                        home_pitcher_status_dict[pitcher_id] = (
-                            note.split('(')[1].split(',')[0]
-                        )
-                    else:
-                        home_pitcher_status_dict[pitcher_id] = ''
+                (home_pitcher_status_dict,
+                 home_starting_pitcher_id) = get_pitcher_status_dict(item)
 
     game_obj = Game(home_team, away_team, game_venue, boxscore_date)
 
@@ -817,45 +845,127 @@ def set_pitcher_wls_codes(game, away_pitcher_status_dict,
 
 def set_starting_pitchers(game, away_starting_pitcher_id,
                           home_starting_pitcher_id):
+    away_starting_pitcher = game.away_team[away_starting_pitcher_id]
     game.away_team.pitcher_list.append(
         PlayerAppearance(
-            game.away_team[away_starting_pitcher_id],
-            1, 1, 'top', 1
+            away_starting_pitcher,
+            1, 1, 'top', 1,
+            game.away_team.get_player_stats(away_starting_pitcher)
         )
     )
 
+    home_starting_pitcher = game.home_team[home_starting_pitcher_id]
     game.home_team.pitcher_list.append(
         PlayerAppearance(
-            game.home_team[home_starting_pitcher_id],
-            1, 1, 'top', 1
+            home_starting_pitcher,
+            1, 1, 'top', 1,
+            game.home_team.get_player_stats(home_starting_pitcher)
         )
     )
 
-def get_game_obj(boxscore_xml, team_xml, game_xml):
+def initialize_game(boxscore_xml, team_xml, player_registry=None):
     (game,
      away_pitcher_status_dict,
      home_pitcher_status_dict,
      away_starting_pitcher_id,
-     home_starting_pitcher_id) = initialize_game_object(boxscore_xml)
+     home_starting_pitcher_id) = initialize_game_object(boxscore_xml,
+                                                        player_registry)
 
-    process_team_xml(game, team_xml)
+    process_team_xml(game, team_xml, player_registry)
 
     set_starting_pitchers(game,
                           away_starting_pitcher_id,
                           home_starting_pitcher_id)
 
-    for inning_xml in game_xml:
-        game.inning_list.append(
-            process_inning_xml(inning_xml, game)
-        )
+    return game, away_pitcher_status_dict, home_pitcher_status_dict
 
+def finalize_game(game, away_pitcher_status_dict, home_pitcher_status_dict):
     set_pitcher_wls_codes(game,
                           away_pitcher_status_dict,
                           home_pitcher_status_dict)
 
-    game.set_batting_box_score_dict()
-    game.set_pitching_box_score_dict()
-    game.set_team_stats()
+    game.set_box_scores()
     game.set_gametimes()
 
+def process_game_obj(boxscore_xml, team_xml, game_xml, player_registry=None):
+    (game,
+     away_pitcher_status_dict,
+     home_pitcher_status_dict) = initialize_game(boxscore_xml, team_xml,
+                                                 player_registry)
+
+    for inning_xml in game_xml:
+        game.inning_list.append(
+            process_inning_xml(inning_xml, game)
+        )
+
+    return game, away_pitcher_status_dict, home_pitcher_status_dict
+
+def get_game_obj(boxscore_xml, team_xml, game_xml, player_registry=None):
+    (game,
+     away_pitcher_status_dict,
+     home_pitcher_status_dict) = process_game_obj(boxscore_xml, team_xml,
+                                                  game_xml, player_registry)
+
+    finalize_game(game, away_pitcher_status_dict, home_pitcher_status_dict)
+
+    return game
+
+def iter_event_containers(inning_event_iter, half_inning_xml):
+    for event, element in inning_event_iter:
+        if event == 'end':
+            if element is half_inning_xml:
+                break
+            elif element.tag == 'atbat' or element.tag == 'action':
+                yield element
+                element.clear()
+
+    half_inning_xml.clear()
+
+def process_inning_events(inning_event_iter, game_obj):
+    game_xml = None
+    half_inning_list = []
+
+    for event, element in inning_event_iter:
+        if event == 'start':
+            if game_xml is None:
+                game_xml = element
+            elif element.tag == 'inning':
+                half_inning_list = []
+            elif element.tag == 'top' or element.tag == 'bottom':
+                half_inning_list.append(
+                    process_half_inning(
+                        iter_event_containers(inning_event_iter, element),
+                        element.tag,
+                        game_obj
+                    )
+                )
+        elif element.tag == 'inning':
+            if len(half_inning_list) > 1:
+                bottom_half_appearance_list = half_inning_list[1]
+            else:
+                bottom_half_appearance_list = None
+
+            game_obj.inning_list.append(
+                Inning(half_inning_list[0], bottom_half_appearance_list)
+            )
+
+            game_xml.clear()
+
+def get_game_obj_from_files(boxscore_file, player_file, inning_file,
+                            player_registry=None):
+    boxscore_xml = parse(boxscore_file).getroot()
+    team_xml = parse(player_file).getroot()
+
+    (game,
+     away_pitcher_status_dict,
+     home_pitcher_status_dict) = initialize_game(boxscore_xml, team_xml,
+                                                 player_registry)
+
+    del boxscore_xml, team_xml
+
+    process_inning_events(iterparse(inning_file, events=('start', 'end')),
+                          game)
+
+    finalize_game(game, away_pitcher_status_dict, home_pitcher_status_dict)
+
     return game
@@ -0,0 +1,491 @@
+from calendar import timegm
+from datetime import datetime, timedelta
+from json import dumps, loads
+from zlib import compress, decompress
+
+from pytz import UTC
+
+from baseball.baseball import (PlateAppearance,
+                               Player,
+                               PlayerAppearance,
+                               PlayerStats,
+                               Inning,
+                               Team,
+                               Game)
+
+from baseball.baseball_events import (Pitch,
+                                      Pickoff,
+                                      RunnerAdvance,
+                                      Substitution,
+                                      Switch)
+
+
+GAME_FORMAT_MAGIC = b'BBGM'
+GAME_FORMAT_VERSION = 2
+GAME_FORMAT_HEADER_LENGTH = len(GAME_FORMAT_MAGIC) + 1
+
+PITCH_RECORD = 0
+PICKOFF_RECORD = 1
+RUNNER_ADVANCE_RECORD = 2
+SUBSTITUTION_RECORD = 3
+SWITCH_RECORD = 4
+
+EPOCH_DATETIME = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def get_timestamp(event_datetime):
+    if event_datetime:
+        timestamp = timegm(event_datetime.utctimetuple())
+    else:
+        timestamp = None
+
+    return timestamp
+
+def get_datetime_from_timestamp(timestamp):
+    if timestamp is not None:
+        event_datetime = EPOCH_DATETIME + timedelta(seconds=timestamp)
+    else:
+        event_datetime = None
+
+    return event_datetime
+
+
+class GameEncoder(object):
+    def __init__(self):
+        self.player_record_list = []
+        self.player_index_dict = {}
+        self.appearance_record_list = []
+        self.appearance_index_dict = {}
+
+    def get_player_index(self, player, player_stats=None):
+        if player_stats is None:
+            player_stats = player
+
+        if player.mlb_id not in self.player_index_dict:
+            self.player_index_dict[player.mlb_id] = len(
+                self.player_record_list
+            )
+
+            self.player_record_list.append((player.last_name,
+                                            player.first_name,
+                                            player.mlb_id,
+                                            player_stats.obp,
+                                            player_stats.slg,
+                                            player_stats.number,
+                                            player_stats.era))
+
+        return self.player_index_dict[player.mlb_id]
+
+    def get_appearance_index(self, appearance):
+        if id(appearance) not in self.appearance_index_dict:
+            self.appearance_index_dict[id(appearance)] = len(
+                self.appearance_record_list
+            )
+
+            self.appearance_record_list.append(
+                (self.get_player_index(appearance.player_obj),
+                 appearance.position,
+                 appearance.start_inning_num,
+                 appearance.start_inning_half,
+                 appearance.start_inning_batter_num,
+                 appearance.end_inning_num,
+                 appearance.end_inning_half,
+                 appearance.end_inning_batter_num,
+                 appearance.pitcher_credit_code)
+            )
+
+        return self.appearance_index_dict[id(appearance)]
+
+    def get_team_record(self, team):
+        return (
+            team.name,
+            team.abbreviation,
+            [self.get_player_index(x, team.get_player_stats(x))
+             for x in team.player_id_dict.values()],
+            [self.get_appearance_index(x) for x in team.pitcher_list],
+            [[self.get_appearance_index(x) for x in y]
+             for y in team.batting_order_list_list]
+        )
+
+    def get_event_record(self, event):
+        if isinstance(event, Pitch):
+            event_record = (PITCH_RECORD,
+                            get_timestamp(event.pitch_datetime),
+                            event.pitch_description,
+                            event.pitch_type,
+                            event.pitch_speed,
+                            event.pitch_position)
+        elif isinstance(event, Pickoff):
+            event_record = (PICKOFF_RECORD,
+                            event.pickoff_description,
+                            event.pickoff_base,
+                            event.pickoff_was_successful)
+        elif isinstance(event, RunnerAdvance):
+            event_record = (RUNNER_ADVANCE_RECORD,
+                            event.run_description,
+                            self.get_player_index(event.runner),
+                            event.start_base,
+                            event.end_base,
+                            event.runner_scored,
+                            event.run_earned,
+                            event.is_rbi)
+        elif isinstance(event, Substitution):
+            event_record = (SUBSTITUTION_RECORD,
+                            get_timestamp(event.substitution_datetime),
+                            self.get_player_index(event.incoming_player),
+                            self.get_player_index(event.outgoing_player),
+                            event.batting_order,
+                            event.position)
+        elif isinstance(event, Switch):
+            event_record = (SWITCH_RECORD,
+                            get_timestamp(event.switch_datetime),
+                            self.get_player_index(event.player),
+                            event.old_position_num,
+                            event.new_position_num,
+                            event.new_batting_order)
+        else:
+            raise ValueError('Unexpected event type')
+
+        return event_record
+
+    def get_plate_appearance_record(self, plate_appearance, game):
+        return (
+            get_timestamp(plate_appearance.start_datetime),
+            get_timestamp(plate_appearance.end_datetime),
+            plate_appearance.batting_team is game.home_team,
+            plate_appearance.plate_appearance_description,
+            plate_appearance.plate_appearance_summary,
+            self.get_player_index(plate_appearance.pitcher),
+            self.get_player_index(plate_appearance.batter),
+            plate_appearance.inning_outs,
+            [self.get_player_index(x)
+             for x in plate_appearance.scoring_runners_list],
+            [self.get_player_index(x)
+             for x in plate_appearance.runners_batted_in_list],
+            [(self.get_player_index(x), base)
+             for x, base in plate_appearance.out_runners_list],
+            plate_appearance.hit_location,
+            plate_appearance.error_str,
+            plate_appearance.got_on_base,
+            plate_appearance.scorecard_summary,
+            [self.get_event_record(x) for x in plate_appearance.event_list]
+        )
+
+    def get_half_inning_record(self, appearance_list, game):
+        if appearance_list is None:
+            half_inning_record = None
+        else:
+            half_inning_record = [
+                self.get_plate_appearance_record(x, game)
+                for x in appearance_list
+            ]
+
+        return half_inning_record
+
+    def get_game_record(self, game):
+        away_team_record = self.get_team_record(game.away_team)
+        home_team_record = self.get_team_record(game.home_team)
+        inning_record_list = [
+            (self.get_half_inning_record(x.top_half_appearance_list, game),
+             self.get_half_inning_record(x.bottom_half_appearance_list, game))
+            for x in game.inning_list
+        ]
+
+        return (
+            self.player_record_list,
+            self.appearance_record_list,
+            away_team_record,
+            home_team_record,
+            (game.location,
+             game.game_date_str,
+             get_timestamp(game.start_datetime),
+             get_timestamp(game.end_datetime),
+             game.start_str,
+             game.end_str),
+            inning_record_list
+        )
+
+
+class GameDecoder(object):
+    def __init__(self, player_record_list, appearance_record_list,
+                 player_registry=None):
+        self.player_list = []
+        self.player_stats_list = []
+        for (last_name,
+             first_name,
+             mlb_id,
+             obp,
+             slg,
+             number,
+             era) in player_record_list:
+            if player_registry is None:
+                player = Player(last_name, first_name, mlb_id, obp, slg,
+                                number)
+                player_stats = None
+                player.era = era
+            else:
+                player = player_registry.get_player(last_name, first_name,
+                                                    mlb_id)
+                player_stats = PlayerStats(obp, slg, number)
+                player_stats.era = era
+
+            self.player_list.append(player)
+            self.player_stats_list.append(player_stats)
+
+        self.appearance_list = []
+        for (player_index,
+             position,
+             start_inning_num,
+             start_inning_half,
+             start_inning_batter_num,
+             end_inning_num,
+             end_inning_half,
+             end_inning_batter_num,
+             pitcher_credit_code) in appearance_record_list:
+            appearance = PlayerAppearance(self.player_list[player_index],
+                                          position,
+                                          start_inning_num,
+                                          start_inning_half,
+                                          start_inning_batter_num,
+                                          self.player_stats_list[player_index])
+
+            appearance.end_inning_num = end_inning_num
+            appearance.end_inning_half = end_inning_half
+            appearance.end_inning_batter_num = end_inning_batter_num
+            appearance.pitcher_credit_code = pitcher_credit_code
+            self.appearance_list.append(appearance)
+
+    def get_team(self, team_record):
+        (name,
+         abbreviation,
+         player_index_list,
+         pitcher_index_list,
+         batting_order_index_list_list) = team_record
+
+        team = Team(name, abbreviation)
+        for player_index in player_index_list:
+            team.append(self.player_list[player_index],
+                        self.player_stats_list[player_index])
+
+        team.pitcher_list = [self.appearance_list[x]
+                             for x in pitcher_index_list]
+
+        team.batting_order_list_list = [
+            [self.appearance_list[x] for x in y]
+            for y in batting_order_index_list_list
+        ]
+
+        return team
+
+    def get_event(self, event_record):
+        record_type = event_record[0]
+        if record_type == PITCH_RECORD:
+            (_,
+             timestamp,
+             pitch_description,
+             pitch_type,
+             pitch_speed,
+             pitch_position) = event_record
+
+            event = Pitch(get_datetime_from_timestamp(timestamp),
+                          pitch_description,
+                          pitch_type,
+                          pitch_speed,
+                          tuple(pitch_position))
+        elif record_type == PICKOFF_RECORD:
+            event = Pickoff(*event_record[1:])
+        elif record_type == RUNNER_ADVANCE_RECORD:
+            (_,
+             run_description,
+             runner_index,
+             start_base,
+             end_base,
+             runner_scored,
+             run_earned,
+             is_rbi) = event_record
+
+            event = RunnerAdvance(run_description,
+                                  self.player_list[runner_index],
+                                  start_base,
+                                  end_base,
+                                  runner_scored,
+                                  run_earned,
+                                  is_rbi)
+        elif record_type == SUBSTITUTION_RECORD:
+            (_,
+             timestamp,
+             incoming_player_index,
+             outgoing_player_index,
+             batting_order,
+             position) = event_record
+
+            event = Substitution(get_datetime_from_timestamp(timestamp),
+                                 self.player_list[incoming_player_index],
+                                 self.player_list[outgoing_player_index],
+                                 batting_order,
+                                 position)
+        elif record_type == SWITCH_RECORD:
+            (_,
+             timestamp,
+             player_index,
+             old_position_num,
+             new_position_num,
+             new_batting_order) = event_record
+
+            event = Switch(get_datetime_from_timestamp(timestamp),
+                           self.player_list[player_index],
+                           old_position_num,
+                           new_position_num,
+                           new_batting_order)
+        else:
+            raise ValueError('Unexpected event record type')
+
+        return event
+
+    def get_plate_appearance(self, plate_appearance_record, game):
+        (start_timestamp,
+         end_timestamp,
+         home_team_batting,
+         plate_appearance_description,
+         plate_appearance_summary,
+         pitcher_index,
+         batter_index,
+         inning_outs,
+         scoring_runner_index_list,
+         runner_batted_in_index_list,
+         out_runner_index_list,
+         hit_location,
+         error_str,
+         got_on_base,
+         scorecard_summary,
+         event_record_list) = plate_appearance_record
+
+        plate_appearance = PlateAppearance.__new__(PlateAppearance)
+        plate_appearance.start_datetime = get_datetime_from_timestamp(
+            start_timestamp
+        )
+
+        plate_appearance.end_datetime = get_datetime_from_timestamp(
+            end_timestamp
+        )
+
+        if home_team_batting:
+            plate_appearance.batting_team = game.home_team
+            plate_appearance.fielding_team = game.away_team
+        else:
+            plate_appearance.batting_team = game.away_team
+            plate_appearance.fielding_team = game.home_team
+
+        plate_appearance.event_list = [self.get_event(x)
+                                       for x in event_record_list]
+
+        plate_appearance.plate_appearance_description = (
+            plate_appearance_description
+        )
+
+        plate_appearance.plate_appearance_summary = plate_appearance_summary
+        plate_appearance.pitcher = self.player_list[pitcher_index]
+        plate_appearance.batter = self.player_list[batter_index]
+        plate_appearance.inning_outs = inning_outs
+        plate_appearance.scoring_runners_list = [
+            self.player_list[x] for x in scoring_runner_index_list
+        ]
+
+        plate_appearance.runners_batted_in_list = [
+            self.player_list[x] for x in runner_batted_in_index_list
+        ]
+
+        plate_appearance.out_runners_list = [
+            (self.player_list[x], base) for x, base in out_runner_index_list
+        ]
+
+        plate_appearance.hit_location = hit_location
+        plate_appearance.error_str = error_str
+        plate_appearance.got_on_base = got_on_base
+        plate_appearance.scorecard_summary = scorecard_summary
+
+        return plate_appearance
+
+    def get_half_inning(self, half_inning_record, game):
+        if half_inning_record is None:
+            appearance_list = None
+        else:
+            appearance_list = [self.get_plate_appearance(x, game)
+                               for x in half_inning_record]
+
+        return appearance_list
+
+    def get_game(self, away_team_record, home_team_record, game_record,
+                 inning_record_list):
+        (location,
+         game_date_str,
+         start_timestamp,
+         end_timestamp,
+         start_str,
+         end_str) = game_record
+
+        game = Game(self.get_team(home_team_record),
+                    self.get_team(away_team_record),
+                    location,
+                    game_date_str,
+                    get_datetime_from_timestamp(start_timestamp),
+                    get_datetime_from_timestamp(end_timestamp))
+
+        for top_half_record, bottom_half_record in inning_record_list:
+            game.inning_list.append(
+                Inning(self.get_half_inning(top_half_record, game),
+                       self.get_half_inning(bottom_half_record, game))
+            )
+
+        game.set_box_scores()
+        game.start_str = start_str
+        game.end_str = end_str
+
+        return game
+
+
+def get_game_bytes(game):
+    game_record = GameEncoder().get_game_record(game)
+    game_json = dumps(game_record, separators=(',', ':'))
+
+    return (GAME_FORMAT_MAGIC +
+            bytes([GAME_FORMAT_VERSION]) +
+            compress(game_json.encode('utf-8')))
+
+def get_game_from_bytes(game_bytes, player_registry=None):
+    if game_bytes[:len(GAME_FORMAT_MAGIC)] != GAME_FORMAT_MAGIC:
+        raise ValueError('Not a serialized game.')
+
+    if game_bytes[len(GAME_FORMAT_MAGIC)] != GAME_FORMAT_VERSION:
+        raise ValueError(
+            'Unsupported game format version: {}'.format(
+                game_bytes[len(GAME_FORMAT_MAGIC)]
+            )
+        )
+
+    (player_record_list,
+     appearance_record_list,
+     away_team_record,
+     home_team_record,
+     game_record,
+     inning_record_list) = loads(
+         decompress(game_bytes[GAME_FORMAT_HEADER_LENGTH:]).decode('utf-8')
+     )
+
+    game_decoder = GameDecoder(player_record_list, appearance_record_list,
+                               player_registry)
+
+    return game_decoder.get_game(away_team_record,
+                                 home_team_record,
+                                 game_record,
+                                 inning_record_list)
+
+def save_game(game, filename):
+    with open(filename, 'wb') as filehandle:
+        filehandle.write(get_game_bytes(game))
+
+def load_game(filename, player_registry=None):
+    with open(filename, 'rb') as filehandle:
+        game = get_game_from_bytes(filehandle.read(), player_registry)
+
+    return game
@@ -1,4 +1,4 @@
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 
 from baseball.baseball_events import Pickoff, RunnerAdvance, Pitch
 
@@ -20,6 +20,36 @@ TeamBoxScore = namedtuple(
     'B1 B2 B3 HR SF SAC DP HBP WP PB SB CS PA'
 )
 
+HalfInningBoxScore = namedtuple(
+    'HalfInningBoxScore',
+    'inning_stats batter_stats_dict pitcher_stats_dict team_stats_list '
+    'leading_runner_advance_description ends_after_pitch'
+)
+
+GameBoxScore = namedtuple(
+    'GameBoxScore',
+    'away_batter_box_score_dict home_batter_box_score_dict '
+    'away_pitcher_box_score_dict home_pitcher_box_score_dict '
+    'away_team_stats home_team_stats'
+)
+
+BaseState = namedtuple(
+    'BaseState',
+    'first_base second_base third_base first_base_pitcher '
+    'second_base_pitcher third_base_pitcher outs'
+)
+
+PlateAppearanceBaseState = namedtuple(
+    'PlateAppearanceBaseState',
+    'before after pickoff_before pickoff_after'
+)
+
+EMPTY_BASE_STATE = BaseState(None, None, None, None, None, None, 0)
+
+NUM_BATTER_STATS = 7
+NUM_PITCHER_STATS = 14
+NUM_TEAM_STATS = 13
+
 
 def process_pickoffs(plate_appearance, first_base, second_base, third_base):
     for event in plate_appearance.event_list:
@@ -128,14 +158,18 @@ def get_half_inning_stats(top_half_appearance_list, bottom_half_appearance_list)
 
 def get_all_pitcher_stats(game, team, pitcher, inning_half_str):
     inning_half_list = get_inning_half_list(game, inning_half_str)
+    base_state_list_list = get_inning_half_base_state_list(game,
+                                                           inning_half_str)
 
     pitcher_box_score = PitcherBoxScore(
         get_pitcher_innings_pitched(pitcher, inning_half_list),
         get_pitcher_win_loss_save(pitcher, team),
         get_pitcher_batters_faced(pitcher, inning_half_list),
         get_pitcher_hits(pitcher, inning_half_list),
-        get_pitcher_runs(pitcher, inning_half_list),
-        get_pitcher_earned_runs(pitcher, inning_half_list),
+        get_pitcher_runs(pitcher, inning_half_list, base_state_list_list),
+        get_pitcher_earned_runs(pitcher,
+                                inning_half_list,
+                                base_state_list_list),
         get_pitcher_strikeouts(pitcher, inning_half_list),
         get_pitcher_nonintentional_walks(pitcher, inning_half_list),
         get_pitcher_intentional_walks(pitcher, inning_half_list),
@@ -145,7 +179,7 @@ def get_all_pitcher_stats(game, team, pitcher, inning_half_str):
         get_pitcher_home_runs(pitcher, inning_half_list),
         get_pitcher_strikes(pitcher, inning_half_list),
         get_pitcher_pitches(pitcher, inning_half_list),
-        get_pitcher_era(pitcher, inning_half_list),
+        get_pitcher_era(pitcher, inning_half_list, base_state_list_list),
         get_pitcher_whip(pitcher, inning_half_list)
     )
 
@@ -153,6 +187,8 @@ def get_all_pitcher_stats(game, team, pitcher, inning_half_str):
 
 def get_all_batter_stats(game, batter, inning_half_str):
     inning_half_list = get_inning_half_list(game, inning_half_str)
+    base_state_list_list = get_inning_half_base_state_list(game,
+                                                           inning_half_str)
 
     batter_box_score = BatterBoxScore(
         get_batter_at_bats(batter, inning_half_list),
@@ -161,7 +197,7 @@ def get_all_batter_stats(game, batter, inning_half_str):
         get_batter_runs_batted_in(batter, inning_half_list),
         get_batter_walks(batter, inning_half_list),
         get_batter_strikeouts(batter, inning_half_list),
-        get_batter_lob(batter, inning_half_list)
+        get_batter_lob(batter, inning_half_list, base_state_list_list)
     )
 
     return batter_box_score
@@ -280,50 +316,27 @@ def get_batter_at_bats(batter, inning_half_list):
 
     return at_bats
 
-def get_batter_lob(batter, inning_half_list):
+def get_batter_lob(batter, inning_half_list, base_state_list_list=None):
     player_lob = 0
 
-    for inning_half in inning_half_list:
-        first_base = None
-        second_base = None
-        third_base = None
-
-        for plate_appearance in inning_half:
-            (first_base,
-             second_base,
-             third_base) = process_pickoffs(plate_appearance,
-                                            first_base,
-                                            second_base,
-                                            third_base)
+    if base_state_list_list is None:
+        base_state_list_list = [get_base_state_list(inning_half)
+                                for inning_half in inning_half_list]
 
+    for inning_half, base_state_list in zip(inning_half_list,
+                                            base_state_list_list):
+        for plate_appearance, base_states in zip(inning_half,
+                                                 base_state_list):
             if (not plate_appearance_is_hit(plate_appearance) and
                     'BB' not in plate_appearance.scorecard_summary and
                     'HBP' not in plate_appearance.scorecard_summary):
-                num_lob = 0
-
-                if first_base:
-                    num_lob += 1
-
-                if second_base:
-                    num_lob += 1
-
-                if third_base:
-                    num_lob += 1
-
-                num_lob -= len(plate_appearance.scoring_runners_list)
+                num_lob = (get_num_runners(base_states.pickoff_before) -
+                           len(plate_appearance.scoring_runners_list))
 
                 if (batter == plate_appearance.batter and
                         is_at_bat(plate_appearance)):
                     player_lob += num_lob
 
-            (first_base,
-             second_base,
-             third_base) = process_baserunners(plate_appearance,
-                                               inning_half[-1],
-                                               first_base,
-                                               second_base,
-                                               third_base)
-
     return player_lob
 
 def get_ip_incr(num_innings_pitched):
@@ -380,33 +393,28 @@ def get_pitcher_hits(pitcher, inning_half_list):
 
     return num_hits
 
-def get_pitcher_runs(pitcher, inning_half_list):
+def get_pitcher_runs(pitcher, inning_half_list, base_state_list_list=None):
     num_runs = 0
 
-    for inning_half in inning_half_list:
+    if base_state_list_list is None:
+        base_state_list_list = [get_base_state_list(inning_half)
+                                for inning_half in inning_half_list]
+
+    for inning_half, base_state_list in zip(inning_half_list,
+                                            base_state_list_list):
         if inning_half:
             inning_start_pitcher = inning_half[0].pitcher
             pitcher_change_flag = False
-            first_base, second_base, third_base = None, None, None
 
-            for plate_appearance in inning_half:
+            for plate_appearance, base_states in zip(inning_half,
+                                                     base_state_list):
                 if (plate_appearance.pitcher != inning_start_pitcher and
                         not pitcher_change_flag):
                     pitcher_change_flag = True
-
-                    change_baserunner_count = sum(
-                        x is not None
-                        for x in [first_base, second_base, third_base]
+                    change_baserunner_count = get_num_runners(
+                        base_states.before
                     )
 
-                (first_base,
-                 second_base,
-                 third_base) = process_baserunners(plate_appearance,
-                                                   inning_half[-1],
-                                                   first_base,
-                                                   second_base,
-                                                   third_base)
-
                 for event in plate_appearance.event_list:
                     if (isinstance(event, RunnerAdvance) and
                             event.runner_scored):
@@ -443,33 +451,29 @@ def get_pitcher_errors(pitcher, inning_half_list):
 
     return num_errors
 
-def get_pitcher_earned_runs(pitcher, inning_half_list):
+def get_pitcher_earned_runs(pitcher, inning_half_list,
+                            base_state_list_list=None):
     num_er = 0
 
-    for inning_half in inning_half_list:
+    if base_state_list_list is None:
+        base_state_list_list = [get_base_state_list(inning_half)
+                                for inning_half in inning_half_list]
+
+    for inning_half, base_state_list in zip(inning_half_list,
+                                            base_state_list_list):
         if inning_half:
             inning_start_pitcher = inning_half[0].pitcher
             pitcher_change_flag = False
-            first_base, second_base, third_base = None, None, None
 
-            for plate_appearance in inning_half:
+            for plate_appearance, base_states in zip(inning_half,
+                                                     base_state_list):
                 if (plate_appearance.pitcher != inning_start_pitcher and
                         not pitcher_change_flag):
                     pitcher_change_flag = True
-
-                    change_baserunner_count = sum(
-                        x is not None
-                        for x in [first_base, second_base, third_base]
+                    change_baserunner_count = get_num_runners(
+                        base_states.before
                     )
 
-                (first_base,
-                 second_base,
-                 third_base) = process_baserunners(plate_appearance,
-                                                   inning_half[-1],
-                                                   first_base,
-                                                   second_base,
-                                                   third_base)
-
                 for event in plate_appearance.event_list:
                     if (isinstance(event, RunnerAdvance) and
                             event.runner_scored and
@@ -616,16 +620,9 @@ def get_innings_pitched_calc_num(pitcher, inning_half_list):
     innings_pitched = get_pitcher_innings_pitched(pitcher,
                                                   inning_half_list)
 
-    if str(innings_pitched)[-2:] == '.1':
-        innings_pitched_num = float(str(innings_pitched)[:-2]) + (1.0/3.0)
-    elif str(innings_pitched)[-2:] == '.2':
-        innings_pitched_num = float(str(innings_pitched)[:-2]) + (2.0/3.0)
-    else:
-        innings_pitched_num = innings_pitched
-
-    return innings_pitched_num
+    return get_innings_pitched_num(innings_pitched)
 
-def get_pitcher_era(pitcher, inning_half_list):
+def get_pitcher_era(pitcher, inning_half_list, base_state_list_list=None):
     if get_pitcher_innings_pitched(pitcher, inning_half_list) == 0:
         era = '&#8734;'
     else:
@@ -635,7 +632,9 @@ def get_pitcher_era(pitcher, inning_half_list):
         era = round(
             9.0 *
             (
-                float(get_pitcher_earned_runs(pitcher, inning_half_list)) /
+                float(get_pitcher_earned_runs(pitcher,
+                                              inning_half_list,
+                                              base_state_list_list)) /
                 innings_pitched_num
             ),
             3
@@ -706,28 +705,14 @@ def get_strikeouts(appearance_list):
 
     return num_strikeouts
 
-def get_lob(appearance_list):
-    first_base = None
-    second_base = None
-    third_base = None
+def get_lob(appearance_list, base_state_list=None):
+    if base_state_list is None:
+        base_state_list = get_base_state_list(appearance_list)
 
-    for plate_appearance in appearance_list:
-        (first_base,
-         second_base,
-         third_base) = process_baserunners(plate_appearance,
-                                           appearance_list[-1],
-                                           first_base,
-                                           second_base,
-                                           third_base)
-
-    num_lob = 0
-
-    if first_base:
-        num_lob += 1
-    if second_base:
-        num_lob += 1
-    if third_base:
-        num_lob += 1
+    if base_state_list:
+        num_lob = get_num_runners(base_state_list[-1].after)
+    else:
+        num_lob = 0
 
     return num_lob
 
@@ -876,3 +861,438 @@ def get_team_stats(game, inning_half_str):
     )
 
     return team_box_score
+
+def get_innings_pitched_num(innings_pitched):
+    if str(innings_pitched)[-2:] == '.1':
+        innings_pitched_num = float(str(innings_pitched)[:-2]) + (1.0/3.0)
+    elif str(innings_pitched)[-2:] == '.2':
+        innings_pitched_num = float(str(innings_pitched)[:-2]) + (2.0/3.0)
+    else:
+        innings_pitched_num = innings_pitched
+
+    return innings_pitched_num
+
+def get_innings_pitched_from_outs(num_outs):
+    innings_pitched = 0
+    for _ in range(num_outs):
+        innings_pitched += get_ip_incr(innings_pitched)
+
+    return innings_pitched / 10
+
+def get_num_runners(base_state):
+    return sum(x is not None for x in base_state[:3])
+
+def get_runner_pitcher(runner, base_state, default_pitcher):
+    if runner is None:
+        return None
+
+    for base_runner, base_pitcher in zip(base_state[:3], base_state[3:6]):
+        if base_runner is not None and base_runner == runner:
+            return base_pitcher
+
+    return default_pitcher
+
+def apply_pickoffs(base_state, plate_appearance):
+    first_base, second_base, third_base = process_pickoffs(plate_appearance,
+                                                           *base_state[:3])
+
+    pickoff_base_state = BaseState(
+        first_base,
+        second_base,
+        third_base,
+        get_runner_pitcher(first_base, base_state, None),
+        get_runner_pitcher(second_base, base_state, None),
+        get_runner_pitcher(third_base, base_state, None),
+        base_state.outs
+    )
+
+    return pickoff_base_state
+
+def advance_base_state(base_state, plate_appearance, last_plate_appearance):
+    (first_base,
+     second_base,
+     third_base) = process_baserunners(plate_appearance,
+                                       last_plate_appearance,
+                                       *base_state[:3])
+
+    pitcher = plate_appearance.pitcher
+    new_base_state = BaseState(
+        first_base,
+        second_base,
+        third_base,
+        get_runner_pitcher(first_base, base_state, pitcher),
+        get_runner_pitcher(second_base, base_state, pitcher),
+        get_runner_pitcher(third_base, base_state, pitcher),
+        plate_appearance.inning_outs
+    )
+
+    return new_base_state
+
+def get_base_state_list(appearance_list):
+    base_state_list = []
+    base_state = EMPTY_BASE_STATE
+    pickoff_base_state = EMPTY_BASE_STATE
+    appearance_list = appearance_list or []
+    if appearance_list:
+        last_plate_appearance = appearance_list[-1]
+
+    for plate_appearance in appearance_list:
+        pickoff_before = apply_pickoffs(pickoff_base_state, plate_appearance)
+        pickoff_base_state = advance_base_state(pickoff_before,
+                                                plate_appearance,
+                                                last_plate_appearance)
+
+        new_base_state = advance_base_state(base_state,
+                                            plate_appearance,
+                                            last_plate_appearance)
+
+        base_state_list.append(
+            PlateAppearanceBaseState(base_state,
+                                     new_base_state,
+                                     pickoff_before,
+                                     pickoff_base_state)
+        )
+
+        base_state = new_base_state
+
+    return base_state_list
+
+def get_inning_half_base_state_list(game, inning_half_str):
+    if inning_half_str == 'top':
+        base_state_list_list = [inning.top_half_base_state_list
+                                for inning in game.inning_list]
+    elif inning_half_str == 'bottom':
+        base_state_list_list = [inning.bottom_half_base_state_list
+                                for inning in game.inning_list
+                                if inning.bottom_half_appearance_list]
+    else:
+        raise ValueError(
+            'Invalid inning half str: {}'.format(inning_half_str)
+        )
+
+    return base_state_list_list
+
+def get_half_inning_box_score(appearance_list, base_state_list=None):
+    appearance_list = appearance_list or []
+    if base_state_list is None:
+        base_state_list = get_base_state_list(appearance_list)
+
+    batter_stats_dict = {}
+    pitcher_stats_dict = {}
+    team_stats_list = [0] * NUM_TEAM_STATS
+    leading_runner_advance_description = None
+    after_pitch = None
+
+    inning_strikes, inning_pitches, inning_walks, inning_strikeouts = 0, 0, 0, 0
+    inning_errors, inning_hits, inning_runs = 0, 0, 0
+
+    pitcher_change_flag = False
+    change_run_count, change_earned_run_count = 0, 0
+
+    if appearance_list:
+        inning_start_pitcher = appearance_list[0].pitcher
+
+    for plate_appearance, base_states in zip(appearance_list,
+                                             base_state_list):
+        batter = plate_appearance.batter
+        pitcher = plate_appearance.pitcher
+        scorecard_summary = plate_appearance.scorecard_summary
+        summary = plate_appearance.plate_appearance_summary
+
+        if batter not in batter_stats_dict:
+            batter_stats_dict[batter] = [0] * NUM_BATTER_STATS
+
+        if pitcher not in pitcher_stats_dict:
+            pitcher_stats_dict[pitcher] = [0] * NUM_PITCHER_STATS
+
+        batter_stats = batter_stats_dict[batter]
+        pitcher_stats = pitcher_stats_dict[pitcher]
+
+        if pitcher != inning_start_pitcher and not pitcher_change_flag:
+            pitcher_change_flag = True
+            change_run_count = get_num_runners(base_states.before)
+            change_earned_run_count = change_run_count
+
+        is_hit = plate_appearance_is_hit(plate_appearance)
+        at_bat_flag = is_at_bat(plate_appearance)
+        if (at_bat_flag and not is_hit and
+                'BB' not in scorecard_summary and
+                'HBP' not in scorecard_summary):
+            batter_stats[6] += (
+                get_num_runners(base_states.pickoff_before) -
+                len(plate_appearance.scoring_runners_list)
+            )
+
+        this_plate_appearance_outs = (base_states.after.outs -
+                                      base_states.before.outs)
+
+        if this_plate_appearance_outs > 0:
+            pitcher_stats[0] += this_plate_appearance_outs
+
+        batter_stats[0] += int(at_bat_flag)
+        batter_stats[2] += int(is_hit)
+        batter_stats[3] += len(plate_appearance.runners_batted_in_list)
+        batter_stats[4] += int('BB' in scorecard_summary)
+        batter_stats[5] += int('K' in scorecard_summary or
+                               'ꓘ' in scorecard_summary)
+
+        for runner in set(plate_appearance.scoring_runners_list):
+            if runner not in batter_stats_dict:
+                batter_stats_dict[runner] = [0] * NUM_BATTER_STATS
+
+            batter_stats_dict[runner][1] += 1
+
+        pitcher_stats[1] += int('CS' not in scorecard_summary and
+                                'PO' not in scorecard_summary)
+        pitcher_stats[2] += int(is_hit)
+        pitcher_stats[5] += int('Strikeout' in summary)
+        pitcher_stats[6] += int(summary == 'Walk')
+        pitcher_stats[7] += int(summary == 'Intent Walk')
+        pitcher_stats[8] += int(summary == 'Hit By Pitch')
+        pitcher_stats[11] += int(scorecard_summary == 'HR')
+
+        inning_walks += int('BB' in scorecard_summary)
+        inning_strikeouts += int('K' in scorecard_summary or
+                                 'ꓘ' in scorecard_summary)
+        inning_errors += int(bool(plate_appearance.error_str))
+        inning_hits += sum(code in scorecard_summary
+                           for code in HIT_CODE_LIST)
+        inning_runs += len(plate_appearance.scoring_runners_list)
+
+        team_stats_list[0] += int('Single' in summary)
+        team_stats_list[1] += int('Double' in summary)
+        team_stats_list[2] += int('Triple' in summary)
+        team_stats_list[3] += int('Home Run' in summary)
+        team_stats_list[4] += int('Sac Fly' in summary)
+        team_stats_list[5] += int('Sac Bunt' in summary)
+        team_stats_list[6] += (int('Double Play' in summary) +
+                               int('DP' in summary))
+        team_stats_list[7] += int('Hit By Pitch' in summary)
+        team_stats_list[12] += int(summary != 'Runner Out')
+
+        last_balk_description = None
+        last_wild_pitch_description = None
+        last_error_description = None
+        for event in plate_appearance.event_list:
+            if isinstance(event, RunnerAdvance):
+                run_description = event.run_description
+                if (run_description == 'Balk' and
+                        last_balk_description != run_description):
+                    pitcher_stats[9] += 1
+                    last_balk_description = run_description
+
+                if (run_description == 'Wild Pitch' and
+                        last_wild_pitch_description != run_description):
+                    pitcher_stats[10] += 1
+                    last_wild_pitch_description = run_description
+
+                if ('Pickoff Error' in run_description and
+                        last_error_description != run_description):
+                    inning_errors += 1
+                    last_error_description = run_description
+
+                if after_pitch is None:
+                    leading_runner_advance_description = run_description
+                elif after_pitch:
+                    team_stats_list[8] += int('Wild Pitch' in run_description)
+                    team_stats_list[9] += int('Passed Ball' in run_description)
+
+                after_pitch = False
+                team_stats_list[10] += int('Stolen Base' in run_description)
+                team_stats_list[11] += int('Caught Stealing' in
+                                           run_description)
+
+                if event.runner_scored:
+                    if pitcher_change_flag and change_run_count:
+                        change_run_count -= 1
+                        if pitcher != inning_start_pitcher:
+                            pitcher_stats_dict[inning_start_pitcher][3] += 1
+                    else:
+                        pitcher_stats[3] += 1
+
+                if event.runner_scored and event.run_earned:
+                    if pitcher_change_flag and change_earned_run_count:
+                        change_earned_run_count -= 1
+                        if pitcher != inning_start_pitcher:
+                            pitcher_stats_dict[inning_start_pitcher][4] += 1
+                    else:
+                        pitcher_stats[4] += 1
+            else:
+                last_balk_description = None
+                last_wild_pitch_description = None
+                last_error_description = None
+
+                if isinstance(event, Pitch):
+                    after_pitch = True
+                    pitcher_stats[13] += 1
+                    inning_pitches += 1
+                    if (event.pitch_description != 'Ball' and
+                            event.pitch_description != 'Ball In Dirt' and
+                            event.pitch_description != 'Hit By Pitch'):
+                        pitcher_stats[12] += 1
+                        inning_strikes += 1
+
+    if appearance_list:
+        inning_stats = InningStatsTuple(
+            inning_strikes,
+            inning_pitches,
+            inning_walks,
+            inning_strikeouts,
+            get_num_runners(base_state_list[-1].after),
+            inning_errors,
+            inning_hits,
+            inning_runs
+        )
+    else:
+        inning_stats = None
+
+    half_inning_box_score = HalfInningBoxScore(
+        inning_stats,
+        batter_stats_dict,
+        pitcher_stats_dict,
+        team_stats_list,
+        leading_runner_advance_description,
+        after_pitch
+    )
+
+    return half_inning_box_score
+
+def sum_stats_dict(half_inning_box_score_list, dict_name, num_stats):
+    stats_dict = {}
+    for half_inning_box_score in half_inning_box_score_list:
+        half_stats_dict = getattr(half_inning_box_score, dict_name)
+        for player, stats_list in half_stats_dict.items():
+            if player not in stats_dict:
+                stats_dict[player] = [0] * num_stats
+
+            total_stats_list = stats_dict[player]
+            for stat_index, value in enumerate(stats_list):
+                total_stats_list[stat_index] += value
+
+    return stats_dict
+
+def get_batter_box_score_dict(team, half_inning_box_score_list):
+    batter_stats_dict = sum_stats_dict(half_inning_box_score_list,
+                                       'batter_stats_dict',
+                                       NUM_BATTER_STATS)
+
+    box_score_dict = OrderedDict([])
+    for batting_order_list in team.batting_order_list_list:
+        for batter_appearance in batting_order_list:
+            batter = batter_appearance.player_obj
+            if batter not in box_score_dict:
+                box_score_dict[batter] = BatterBoxScore(
+                    *batter_stats_dict.get(batter, [0] * NUM_BATTER_STATS)
+                )
+
+    box_score_dict['TOTAL'] = get_box_score_total(box_score_dict)
+
+    return box_score_dict
+
+def get_pitcher_box_score(pitcher, team, stats_list):
+    (num_outs, batters_faced, hits, runs, earned_runs, strikeouts, walks,
+     intentional_walks, hit_by_pitch, balks, wild_pitches, home_runs, strikes,
+     pitches) = stats_list
+
+    innings_pitched = get_innings_pitched_from_outs(num_outs)
+    innings_pitched_num = get_innings_pitched_num(innings_pitched)
+
+    if innings_pitched == 0:
+        era = '&#8734;'
+    else:
+        era = round(9.0 * (float(earned_runs) / innings_pitched_num), 3)
+
+    if innings_pitched_num == 0:
+        whip = '&#8734;'
+    else:
+        whip = round(float(hits + walks) / float(innings_pitched_num), 3)
+
+    pitcher_box_score = PitcherBoxScore(
+        innings_pitched,
+        get_pitcher_win_loss_save(pitcher, team),
+        batters_faced,
+        hits,
+        runs,
+        earned_runs,
+        strikeouts,
+        walks,
+        intentional_walks,
+        hit_by_pitch,
+        balks,
+        wild_pitches,
+        home_runs,
+        strikes,
+        pitches,
+        era,
+        whip
+    )
+
+    return pitcher_box_score
+
+def get_pitcher_box_score_dict(team, half_inning_box_score_list):
+    pitcher_stats_dict = sum_stats_dict(half_inning_box_score_list,
+                                        'pitcher_stats_dict',
+                                        NUM_PITCHER_STATS)
+
+    box_score_dict = OrderedDict([])
+    for pitcher_appearance in team.pitcher_list:
+        pitcher = pitcher_appearance.player_obj
+        box_score_dict[pitcher] = get_pitcher_box_score(
+            pitcher,
+            team,
+            pitcher_stats_dict.get(pitcher, [0] * NUM_PITCHER_STATS)
+        )
+
+    return box_score_dict
+
+def get_team_box_score(half_inning_box_score_list):
+    team_stats_list = [0] * NUM_TEAM_STATS
+    after_pitch = False
+
+    for half_inning_box_score in half_inning_box_score_list:
+        for stat_index, value in enumerate(
+                half_inning_box_score.team_stats_list):
+            team_stats_list[stat_index] += value
+
+        leading_description = (
+            half_inning_box_score.leading_runner_advance_description
+        )
+
+        if after_pitch and leading_description:
+            team_stats_list[8] += int('Wild Pitch' in leading_description)
+            team_stats_list[9] += int('Passed Ball' in leading_description)
+
+        if half_inning_box_score.ends_after_pitch is not None:
+            after_pitch = half_inning_box_score.ends_after_pitch
+
+    return TeamBoxScore(*team_stats_list)
+
+def get_half_inning_box_score_list(game, inning_half_str):
+    if inning_half_str == 'top':
+        half_inning_box_score_list = [inning.top_half_box_score
+                                      for inning in game.inning_list]
+    elif inning_half_str == 'bottom':
+        half_inning_box_score_list = [inning.bottom_half_box_score
+                                      for inning in game.inning_list
+                                      if inning.bottom_half_appearance_list]
+    else:
+        raise ValueError(
+            'Invalid inning half str: {}'.format(inning_half_str)
+        )
+
+    return half_inning_box_score_list
+
+def get_game_box_score(game):
+    top_box_score_list = get_half_inning_box_score_list(game, 'top')
+    bottom_box_score_list = get_half_inning_box_score_list(game, 'bottom')
+
+    game_box_score = GameBoxScore(
+        get_batter_box_score_dict(game.away_team, top_box_score_list),
+        get_batter_box_score_dict(game.home_team, bottom_box_score_list),
+        get_pitcher_box_score_dict(game.away_team, bottom_box_score_list),
+        get_pitcher_box_score_dict(game.home_team, top_box_score_list),
+        get_team_box_score(top_box_score_list),
+        get_team_box_score(bottom_box_score_list)
+    )
+
+    return game_box_score
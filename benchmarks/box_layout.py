@@ -0,0 +1,114 @@
+from argparse import ArgumentParser
+from tempfile import TemporaryDirectory
+
+from baseball.fetch_game import get_game_from_files
+from baseball.generate_svg import (BOX_HEIGHT,
+                                   BOX_WIDTH,
+                                   HEIGHT,
+                                   LEN_BATTING_LIST,
+                                   assemble_box_content_dict,
+                                   get_box_layout_generator)
+
+from benchmarks.fixture_games import get_best_seconds, write_long_game
+
+
+DEFAULT_INNING_COUNT = 20
+LAYOUT_REPEAT_COUNT = 100
+
+
+def get_half_inning_tuple_list(game):
+    half_inning_tuple_list = []
+    for inning_index, inning in enumerate(game.inning_list):
+        tuple_list = [(inning.top_half_appearance_list, 'top'),
+                      (inning.bottom_half_appearance_list, 'bottom')]
+
+        for plate_appearance_list, inning_half_str in tuple_list:
+            if plate_appearance_list:
+                half_inning_tuple_list.append(
+                    (inning_index + 1, inning_half_str, plate_appearance_list)
+                )
+
+    return half_inning_tuple_list
+
+def get_quadratic_box_layout_list(game):
+    id_tuple_list = []
+    summary_list = []
+    for inning_num, inning_half_str, plate_appearance_list in (
+            get_half_inning_tuple_list(game)
+    ):
+        for pa_index, plate_appearance in enumerate(plate_appearance_list):
+            id_tuple_list.append((inning_num, inning_half_str, pa_index + 1))
+            summary_list.append(plate_appearance.plate_appearance_summary)
+
+    layout_list = []
+    top_pa_index = 0
+    bottom_pa_index = 0
+    for id_tuple, summary in zip(id_tuple_list, summary_list):
+        inning_num, inning_half_str, inning_pa_num = id_tuple
+        top_offset = top_pa_index % LEN_BATTING_LIST
+        bottom_offset = bottom_pa_index % LEN_BATTING_LIST
+        this_x_pos = inning_num * BOX_WIDTH
+        if inning_half_str == 'bottom':
+            if summary != 'Runner Out':
+                bottom_pa_index += 1
+
+            this_y_pos = (HEIGHT // 2 +
+                          bottom_offset * BOX_HEIGHT +
+                          BOX_HEIGHT // 2)
+        else:
+            if summary != 'Runner Out':
+                top_pa_index += 1
+
+            this_y_pos = (top_offset * BOX_HEIGHT +
+                          BOX_HEIGHT // 2)
+
+        this_inning_tuple_list = [
+            x for x in id_tuple_list
+            if x[0] == inning_num and x[1] == inning_half_str
+        ]
+
+        layout_list.append((inning_pa_num,
+                            this_inning_tuple_list,
+                            this_x_pos,
+                            this_y_pos))
+
+    return layout_list
+
+def main():
+    parser = ArgumentParser(
+        description='Compare the quadratic per-box layout scan with the '
+                    'grouped box layout on a long synthetic game.'
+    )
+
+    parser.add_argument('--innings', type=int, default=DEFAULT_INNING_COUNT,
+                        help='number of innings in the synthetic game')
+
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as temp_dir:
+        game = get_game_from_files(*write_long_game(temp_dir, args.innings))
+
+    layout_list = list(get_box_layout_generator(game))
+    assert get_quadratic_box_layout_list(game) == layout_list
+
+    quadratic_seconds = get_best_seconds(
+        lambda: [get_quadratic_box_layout_list(game)
+                 for _ in range(LAYOUT_REPEAT_COUNT)]
+    ) / LAYOUT_REPEAT_COUNT
+
+    grouped_seconds = get_best_seconds(
+        lambda: [list(get_box_layout_generator(game))
+                 for _ in range(LAYOUT_REPEAT_COUNT)]
+    ) / LAYOUT_REPEAT_COUNT
+
+    print('innings:   {} ({} plate appearances)'.format(args.innings,
+                                                        len(layout_list)))
+    print('quadratic: {:.3f} ms layout'.format(quadratic_seconds * 1000))
+    print('grouped:   {:.3f} ms layout'.format(grouped_seconds * 1000))
+    print('boxes:     {:.3f} ms with rendering'.format(
+        get_best_seconds(lambda: assemble_box_content_dict(game)) * 1000
+    ))
+
+
+if __name__ == '__main__':
+    main()
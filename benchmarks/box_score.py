@@ -0,0 +1,108 @@
+from argparse import ArgumentParser
+from collections import OrderedDict
+
+from baseball.baseball import Inning
+from baseball.fetch_game import get_game_from_files
+from baseball.stats import (get_all_batter_stats,
+                            get_all_pitcher_stats,
+                            get_box_score_total,
+                            get_team_stats)
+
+from benchmarks.fixture_games import (get_best_seconds,
+                                      get_fixture_filename_list)
+
+
+DEFAULT_REPEAT_COUNT = 20
+
+
+def reset_innings(game_list):
+    for game in game_list:
+        game.inning_list = [Inning(inning.top_half_appearance_list,
+                                   inning.bottom_half_appearance_list)
+                            for inning in game.inning_list]
+
+        game.set_box_scores()
+
+def get_per_stat_box_score(game):
+    pitcher_box_score_dict_list = []
+    for team, inning_half_str in [(game.away_team, 'bottom'),
+                                  (game.home_team, 'top')]:
+        pitcher_box_score_dict = OrderedDict()
+        for pitcher_appearance in team.pitcher_list:
+            pitcher = pitcher_appearance.player_obj
+            pitcher_box_score_dict[pitcher] = get_all_pitcher_stats(
+                game, team, pitcher, inning_half_str
+            )
+
+        pitcher_box_score_dict_list.append(pitcher_box_score_dict)
+
+    batter_box_score_dict_list = []
+    for team, inning_half_str in [(game.away_team, 'top'),
+                                  (game.home_team, 'bottom')]:
+        batter_box_score_dict = OrderedDict()
+        for batting_order_list in team.batting_order_list_list:
+            for batter_appearance in batting_order_list:
+                batter = batter_appearance.player_obj
+                if batter not in batter_box_score_dict:
+                    batter_box_score_dict[batter] = get_all_batter_stats(
+                        game, batter, inning_half_str
+                    )
+
+        batter_box_score_dict['TOTAL'] = get_box_score_total(
+            batter_box_score_dict
+        )
+
+        batter_box_score_dict_list.append(batter_box_score_dict)
+
+    return (batter_box_score_dict_list[0],
+            batter_box_score_dict_list[1],
+            pitcher_box_score_dict_list[0],
+            pitcher_box_score_dict_list[1],
+            get_team_stats(game, 'top'),
+            get_team_stats(game, 'bottom'))
+
+def get_single_pass_box_score(game):
+    return (game.away_batter_box_score_dict,
+            game.home_batter_box_score_dict,
+            game.away_pitcher_box_score_dict,
+            game.home_pitcher_box_score_dict,
+            game.away_team_stats,
+            game.home_team_stats)
+
+def run_per_stat(game_list):
+    reset_innings(game_list)
+    return [get_per_stat_box_score(game) for game in game_list]
+
+def run_single_pass(game_list):
+    reset_innings(game_list)
+    return [get_single_pass_box_score(game) for game in game_list]
+
+def main():
+    parser = ArgumentParser(
+        description='Compare the per-stat box score functions with the '
+                    'single-pass box score engine.'
+    )
+
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT_COUNT,
+                        help='number of copies of the fixture games')
+
+    args = parser.parse_args()
+
+    game_list = [get_game_from_files(*filename_tuple[1:])
+                 for filename_tuple
+                 in get_fixture_filename_list(args.repeat)]
+
+    assert run_per_stat(game_list) == run_single_pass(game_list)
+
+    print('games:       {}'.format(len(game_list)))
+    print('per-stat:    {:.3f} s'.format(
+        get_best_seconds(lambda: run_per_stat(game_list))
+    ))
+
+    print('single pass: {:.3f} s'.format(
+        get_best_seconds(lambda: run_single_pass(game_list))
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+from os import makedirs
+from os.path import abspath, dirname, join
+from shutil import copyfile
+from time import perf_counter
+from xml.etree.ElementTree import fromstring, tostring
+
+from baseball.fetch_game import get_filename_list
+
+
+FIXTURE_DIR = join(dirname(dirname(abspath(__file__))), 'tests', 'fixtures',
+                   'gameday')
+
+FIXTURE_START_DATE_STR = '2017-11-01'
+FIXTURE_END_DATE_STR = '2017-11-02'
+LONG_GAME_DIR_PATH = join('2017', 'month_11', 'day_01',
+                          'gid_2017_11_01_houmlb_lanmlb_1')
+
+LONG_GAME_FILLER_INNING_COUNT = 5
+LONG_GAME_FINAL_INNING_COUNT = 4
+
+
+def get_fixture_filename_list(repeat_count=1):
+    return get_filename_list(FIXTURE_START_DATE_STR, FIXTURE_END_DATE_STR,
+                             FIXTURE_DIR) * repeat_count
+
+def write_long_game(output_dir, inning_count):
+    game_dir = join(FIXTURE_DIR, LONG_GAME_DIR_PATH)
+    with open(join(game_dir, 'inning', 'inning_all.xml'),
+              'rb') as filehandle:
+        game_xml = fromstring(filehandle.read())
+
+    inning_xml_list = list(game_xml)
+    final_inning_xml_list = inning_xml_list[-LONG_GAME_FINAL_INNING_COUNT:]
+    filler_count = inning_count - len(final_inning_xml_list)
+    long_inning_xml_list = [
+        inning_xml_list[i % LONG_GAME_FILLER_INNING_COUNT]
+        for i in range(filler_count)
+    ] + final_inning_xml_list
+
+    for inning_xml in list(game_xml):
+        game_xml.remove(inning_xml)
+
+    for inning_num, inning_xml in enumerate(long_inning_xml_list, 1):
+        inning_xml = fromstring(tostring(inning_xml))
+        inning_xml.set('num', str(inning_num))
+        inning_xml.set('next', 'N' if inning_num == inning_count else 'Y')
+        game_xml.append(inning_xml)
+
+    makedirs(join(output_dir, 'inning'), exist_ok=True)
+    filename_tuple = (join(output_dir, 'boxscore.xml'),
+                      join(output_dir, 'players.xml'),
+                      join(output_dir, 'inning', 'inning_all.xml'))
+
+    copyfile(join(game_dir, 'boxscore.xml'), filename_tuple[0])
+    copyfile(join(game_dir, 'players.xml'), filename_tuple[1])
+    with open(filename_tuple[2], 'wb') as filehandle:
+        filehandle.write(tostring(game_xml, encoding='utf-8'))
+
+    return filename_tuple
+
+def get_best_seconds(function, repeat_count=5):
+    best_seconds = None
+    for _ in range(repeat_count):
+        start_time = perf_counter()
+        function()
+        seconds = perf_counter() - start_time
+        if best_seconds is None or seconds < best_seconds:
+            best_seconds = seconds
+
+    return best_seconds
@@ -0,0 +1,62 @@
+from argparse import ArgumentParser
+from tempfile import TemporaryDirectory
+from tracemalloc import get_traced_memory, reset_peak, start, stop
+
+from baseball.fetch_game import (get_game_from_files,
+                                 get_game_from_files_iterparse)
+
+from benchmarks.fixture_games import get_best_seconds, write_long_game
+
+
+DEFAULT_INNING_COUNT = 20
+
+
+def get_peak_bytes(function, filename_tuple):
+    start()
+    reset_peak()
+    base_bytes, _ = get_traced_memory()
+    function(*filename_tuple)
+    _, peak_bytes = get_traced_memory()
+    stop()
+
+    return peak_bytes - base_bytes
+
+def main():
+    parser = ArgumentParser(
+        description='Compare peak memory and time of the tree-based and '
+                    'streaming XML parsers on a long synthetic game.'
+    )
+
+    parser.add_argument('--innings', type=int, default=DEFAULT_INNING_COUNT,
+                        help='number of innings in the synthetic game')
+
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as temp_dir:
+        filename_tuple = write_long_game(temp_dir, args.innings)
+        tree_peak_bytes = get_peak_bytes(get_game_from_files,
+                                         filename_tuple)
+
+        stream_peak_bytes = get_peak_bytes(get_game_from_files_iterparse,
+                                           filename_tuple)
+
+        tree_seconds = get_best_seconds(
+            lambda: get_game_from_files(*filename_tuple)
+        )
+
+        stream_seconds = get_best_seconds(
+            lambda: get_game_from_files_iterparse(*filename_tuple)
+        )
+
+    print('innings:   {}'.format(args.innings))
+    print('tree:      {:.2f} MB peak, {:.3f} s'.format(
+        tree_peak_bytes / 1024 ** 2, tree_seconds
+    ))
+
+    print('iterparse: {:.2f} MB peak, {:.3f} s'.format(
+        stream_peak_bytes / 1024 ** 2, stream_seconds
+    ))
+
+
+if __name__ == '__main__':
+    main()
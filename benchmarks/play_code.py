@@ -0,0 +1,84 @@
+from argparse import ArgumentParser
+from re import sub
+
+from baseball.baseball import (PLAY_CODE_ORDERED_DICT,
+                               get_play_code,
+                               strip_suffixes,
+                               strip_this_suffix)
+from baseball.fetch_game import get_game_from_files
+
+from benchmarks.fixture_games import (get_best_seconds,
+                                      get_fixture_filename_list)
+
+
+DEFAULT_REPEAT_COUNT = 20
+
+
+def get_reference_play_code(description_str):
+    code = None
+    for keyword, this_code in PLAY_CODE_ORDERED_DICT.items():
+        if keyword in description_str:
+            code = this_code
+
+    return code
+
+def get_reference_stripped_str(input_str):
+    input_str = strip_this_suffix(r' Jr\.\s+[A-Z]', r' Jr\.', input_str)
+    input_str = strip_this_suffix(r' Sr\.\s+[A-Z]', r' Sr\.', input_str)
+    input_str = sub(r' II', '', input_str)
+    input_str = sub(r' III', '', input_str)
+    input_str = sub(r' IV', '', input_str)
+    input_str = sub(r' St\. ', ' St ', input_str)
+
+    return input_str
+
+def get_description_list(repeat_count):
+    description_list = []
+    for filename_tuple in get_fixture_filename_list():
+        game = get_game_from_files(*filename_tuple[1:])
+        for inning in game.inning_list:
+            for plate_appearance in (inning.top_half_appearance_list +
+                                     inning.bottom_half_appearance_list):
+                description_list.append(
+                    plate_appearance.plate_appearance_description
+                )
+
+    return description_list * repeat_count
+
+def run_reference(description_list):
+    return [get_reference_play_code(get_reference_stripped_str(description))
+            for description in description_list]
+
+def run_compiled(description_list):
+    return [get_play_code(strip_suffixes(description))
+            for description in description_list]
+
+def main():
+    parser = ArgumentParser(
+        description='Compare the last-match-wins play-code loop and repeated '
+                    'suffix search with the precompiled versions.'
+    )
+
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT_COUNT,
+                        help='number of copies of the fixture descriptions')
+
+    args = parser.parse_args()
+
+    description_list = get_description_list(args.repeat)
+    assert run_reference(description_list) == run_compiled(description_list)
+
+    description_count = len(description_list)
+    print('descriptions: {}'.format(description_count))
+    print('reference:    {:.2f} us per description'.format(
+        get_best_seconds(lambda: run_reference(description_list)) * 1e6 /
+        description_count
+    ))
+
+    print('compiled:     {:.2f} us per description'.format(
+        get_best_seconds(lambda: run_compiled(description_list)) * 1e6 /
+        description_count
+    ))
+
+
+if __name__ == '__main__':
+    main()
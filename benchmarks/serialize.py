@@ -0,0 +1,71 @@
+from argparse import ArgumentParser
+from os.path import getsize
+from pickle import HIGHEST_PROTOCOL, dumps, loads
+
+from baseball.fetch_game import get_game_from_files
+from baseball.serialize_game import get_game_bytes, get_game_from_bytes
+
+from benchmarks.fixture_games import (get_best_seconds,
+                                      get_fixture_filename_list)
+
+
+DEFAULT_REPEAT_COUNT = 20
+
+
+def main():
+    parser = ArgumentParser(
+        description='Compare loading games from XML, from the saved game '
+                    'format and from a pickle of the object graph.'
+    )
+
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT_COUNT,
+                        help='number of copies of the fixture games')
+
+    args = parser.parse_args()
+
+    filename_tuple_list = [filename_tuple[1:] for filename_tuple
+                           in get_fixture_filename_list(args.repeat)]
+
+    game_list = [get_game_from_files(*filename_tuple)
+                 for filename_tuple in filename_tuple_list]
+
+    game_bytes_list = [get_game_bytes(game) for game in game_list]
+    pickle_bytes_list = [dumps(game, HIGHEST_PROTOCOL) for game in game_list]
+
+    for game, game_bytes in zip(game_list, game_bytes_list):
+        assert game._asdict() == get_game_from_bytes(game_bytes)._asdict()
+
+    xml_seconds = get_best_seconds(
+        lambda: [get_game_from_files(*filename_tuple)
+                 for filename_tuple in filename_tuple_list]
+    )
+
+    game_bytes_seconds = get_best_seconds(
+        lambda: [get_game_from_bytes(game_bytes)
+                 for game_bytes in game_bytes_list]
+    )
+
+    pickle_seconds = get_best_seconds(
+        lambda: [loads(pickle_bytes) for pickle_bytes in pickle_bytes_list]
+    )
+
+    xml_bytes = sum(getsize(filename)
+                    for filename_tuple in filename_tuple_list
+                    for filename in filename_tuple)
+
+    print('games:       {}'.format(len(game_list)))
+    print('xml:         {:.3f} s, {:.2f} MB'.format(
+        xml_seconds, xml_bytes / 1024 ** 2
+    ))
+
+    print('saved game:  {:.3f} s, {:.2f} MB'.format(
+        game_bytes_seconds, sum(map(len, game_bytes_list)) / 1024 ** 2
+    ))
+
+    print('pickle:      {:.3f} s, {:.2f} MB'.format(
+        pickle_seconds, sum(map(len, pickle_bytes_list)) / 1024 ** 2
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+from argparse import ArgumentParser
+from functools import cached_property
+from gc import collect
+from sys import modules
+from tracemalloc import get_traced_memory, start, stop
+
+from baseball.baseball import (Inning,
+                               PlateAppearance,
+                               PlayerAppearance,
+                               SlotCachedProperty)
+from baseball.baseball_events import (Pickoff,
+                                      Pitch,
+                                      RunnerAdvance,
+                                      Substitution,
+                                      Switch)
+from baseball.fetch_game import get_game_from_files
+
+from benchmarks.fixture_games import get_fixture_filename_list
+
+
+DEFAULT_REPEAT_COUNT = 20
+SLOTTED_CLASS_LIST = [Inning, PlateAppearance, PlayerAppearance, Pickoff,
+                      Pitch, RunnerAdvance, Substitution, Switch]
+
+
+def get_unslotted_class(slotted_class):
+    class_dict = {}
+    for name, value in slotted_class.__dict__.items():
+        if name == '__slots__' or name in slotted_class.__slots__:
+            continue
+
+        if isinstance(value, SlotCachedProperty):
+            value = cached_property(value.function)
+
+        class_dict[name] = value
+
+    return type(slotted_class.__name__, slotted_class.__bases__, class_dict)
+
+def use_unslotted_classes():
+    unslotted_class_dict = {slotted_class: get_unslotted_class(slotted_class)
+                            for slotted_class in SLOTTED_CLASS_LIST}
+
+    for module_name, module in list(modules.items()):
+        if module_name.split('.')[0] != 'baseball':
+            continue
+
+        for name, value in list(vars(module).items()):
+            if isinstance(value, type) and value in unslotted_class_dict:
+                setattr(module, name, unslotted_class_dict[value])
+
+def load_game_list(filename_tuple_list):
+    game_list = [get_game_from_files(*filename_tuple)
+                 for filename_tuple in filename_tuple_list]
+
+    for game in game_list:
+        game._asdict()
+
+    return game_list
+
+def get_retained_bytes(filename_tuple_list):
+    load_game_list(filename_tuple_list[:1])
+    collect()
+    start()
+    base_bytes, _ = get_traced_memory()
+    game_list = load_game_list(filename_tuple_list)
+    collect()
+    retained_bytes, _ = get_traced_memory()
+    stop()
+
+    return game_list, retained_bytes - base_bytes
+
+def main():
+    parser = ArgumentParser(
+        description='Compare the memory held by loaded games with the '
+                    'slotted model classes and with dict-backed copies of '
+                    'the same classes.'
+    )
+
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT_COUNT,
+                        help='number of copies of the fixture games')
+
+    args = parser.parse_args()
+
+    filename_tuple_list = [filename_tuple[1:] for filename_tuple
+                           in get_fixture_filename_list(args.repeat)]
+
+    slotted_game_list, slotted_bytes = get_retained_bytes(
+        filename_tuple_list
+    )
+
+    pitch_count = sum(
+        isinstance(event, Pitch)
+        for game in slotted_game_list
+        for inning in game.inning_list
+        for plate_appearance in (inning.top_half_appearance_list +
+                                 inning.bottom_half_appearance_list)
+        for event in plate_appearance.event_list
+    )
+
+    slotted_repr_str = repr(slotted_game_list[0])
+    del slotted_game_list
+
+    use_unslotted_classes()
+    unslotted_game_list, unslotted_bytes = get_retained_bytes(
+        filename_tuple_list
+    )
+
+    assert hasattr(unslotted_game_list[0].inning_list[0], '__dict__')
+    assert repr(unslotted_game_list[0]) == slotted_repr_str
+
+    game_count = len(filename_tuple_list)
+    print('games:     {} ({} pitches)'.format(game_count, pitch_count))
+    print('__dict__:  {:.2f} MB, {:.0f} KB per game'.format(
+        unslotted_bytes / 1024 ** 2, unslotted_bytes / 1024 / game_count
+    ))
+
+    print('__slots__: {:.2f} MB, {:.0f} KB per game'.format(
+        slotted_bytes / 1024 ** 2, slotted_bytes / 1024 / game_count
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -10,4 +10,5 @@ setup(name='baseball',
       license='MIT',
       packages=['baseball'],
       zip_safe=False,
-      install_requires=['python-dateutil', 'pytz', 'requests'])
+      install_requires=['python-dateutil', 'pytz', 'requests'],
+      extras_require={'pitch_table': ['numpy']})
@@ -0,0 +1,30 @@
+from os.path import abspath, dirname, join
+from shutil import copytree
+
+import pytest
+
+from baseball.game_cache import GAME_CACHE_VARIABLE_LIST
+from baseball.gameday_server import GamedayServer
+from baseball.http_cache import HTTP_CACHE_VARIABLE_LIST
+
+
+FIXTURE_DIR = join(dirname(abspath(__file__)), 'fixtures', 'gameday')
+
+
+@pytest.fixture(autouse=True)
+def no_cache_settings(monkeypatch):
+    for variable in GAME_CACHE_VARIABLE_LIST + HTTP_CACHE_VARIABLE_LIST:
+        monkeypatch.delenv(variable, raising=False)
+
+@pytest.fixture
+def gameday_dir(tmp_path):
+    return copytree(FIXTURE_DIR, str(tmp_path / 'gameday'))
+
+@pytest.fixture
+def gameday_server(gameday_dir):
+    with GamedayServer(gameday_dir) as server:
+        yield server
+
+@pytest.fixture
+def game_spec_list():
+    return [('2017-11-01', 'HOU', 'LAD', 1), ('2017-11-02', 'HOU', 'LAD', 1)]
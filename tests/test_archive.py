@@ -0,0 +1,40 @@
+from os.path import basename, dirname
+from shutil import make_archive
+
+from baseball.fetch_game import (WorkerPool,
+                                 get_game_generator_from_file_range,
+                                 get_game_list_from_file_range)
+
+
+def get_repr_tuple_list(game_tuple_list):
+    return [(game_id, repr(game)) for game_id, game in game_tuple_list]
+
+def make_fixture_archive(gameday_dir, tmp_path):
+    return make_archive(str(tmp_path / 'gameday'), 'zip',
+                        root_dir=dirname(gameday_dir),
+                        base_dir=basename(gameday_dir))
+
+def test_archive_games_match_directory_games(gameday_dir, tmp_path):
+    archive_path = make_fixture_archive(gameday_dir, tmp_path)
+    directory_repr_tuple_list = get_repr_tuple_list(
+        get_game_generator_from_file_range('2017-11-01', '2017-11-02',
+                                           gameday_dir)
+    )
+
+    assert len(directory_repr_tuple_list) == 2
+    assert get_repr_tuple_list(
+        get_game_generator_from_file_range('2017-11-01', '2017-11-02',
+                                           archive_path)
+    ) == directory_repr_tuple_list
+
+    with WorkerPool(2) as worker_pool:
+        assert get_repr_tuple_list(
+            get_game_list_from_file_range('2017-11-01', '2017-11-02',
+                                          archive_path, worker_pool)
+        ) == directory_repr_tuple_list
+
+        assert get_repr_tuple_list(
+            get_game_generator_from_file_range('2017-11-01', '2017-11-02',
+                                               archive_path,
+                                               worker_pool=worker_pool)
+        ) == directory_repr_tuple_list
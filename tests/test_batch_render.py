@@ -0,0 +1,116 @@
+from json import loads
+from os import listdir, remove, utime
+from os.path import join
+
+from baseball.batch_render import write_svg_batch_from_file_range
+from baseball.fetch_game import WorkerPool
+
+
+BROKEN_GAME_ID = '2017-11-02-HOU-LAD-1'
+BROKEN_INNING_FILENAME = join('2017', 'month_11', 'day_02',
+                              'gid_2017_11_02_houmlb_lanmlb_1', 'inning',
+                              'inning_all.xml')
+
+BOXSCORE_FILENAME = join('2017', 'month_11', 'day_01',
+                         'gid_2017_11_01_houmlb_lanmlb_1', 'boxscore.xml')
+
+
+def replace_in_inning_file(gameday_dir, old_str, new_str):
+    inning_filename = join(gameday_dir, BROKEN_INNING_FILENAME)
+    with open(inning_filename, encoding='utf-8') as filehandle:
+        inning_raw_xml = filehandle.read()
+
+    with open(inning_filename, 'w', encoding='utf-8') as filehandle:
+        filehandle.write(inning_raw_xml.replace(old_str, new_str))
+
+def break_game_stats(gameday_dir):
+    replace_in_inning_file(gameday_dir,
+                           'des="Alex Bregman strikes out swinging."',
+                           'des="Alex Bregman blorps."')
+
+def fix_game_stats(gameday_dir):
+    replace_in_inning_file(gameday_dir,
+                           'des="Alex Bregman blorps."',
+                           'des="Alex Bregman strikes out swinging."')
+
+def read_error_record_list(error_log_path):
+    with open(error_log_path, encoding='utf-8') as filehandle:
+        return [loads(line) for line in filehandle]
+
+def render_fixture(gameday_dir, output_dir, **kwargs):
+    return write_svg_batch_from_file_range('2017-11-01', '2017-11-02',
+                                           gameday_dir, output_dir, **kwargs)
+
+def test_stats_failure_is_logged_as_stats(gameday_dir, tmp_path):
+    break_game_stats(gameday_dir)
+    output_dir = str(tmp_path / 'output')
+    render_summary = render_fixture(gameday_dir, output_dir)
+
+    assert render_summary.written_count == 1
+    assert render_summary.failed_count == 1
+    assert render_summary.stage_error_count_dict == {
+        'read': 0, 'parse': 0, 'stats': 1, 'render': 0, 'write': 0
+    }
+
+    assert render_summary.stage_count_dict['stats'] == 1
+    assert render_summary.stage_count_dict['render'] == 1
+
+    error_record_list = read_error_record_list(render_summary.error_log_path)
+    assert [(x['game_id'], x['stage'], x['exception_type'])
+            for x in error_record_list] == [(BROKEN_GAME_ID, 'stats',
+                                             'ValueError')]
+
+    assert sorted(listdir(output_dir)) == [
+        '2017-11-01-HOU-LAD-1.html',
+        '2017-11-01-HOU-LAD-1.svg',
+        'render_errors.jsonl',
+        'render_manifest.json'
+    ]
+
+def get_count_tuple_list(gameday_dir, output_dir, step_function_list):
+    count_tuple_list = []
+    with WorkerPool(2) as worker_pool:
+        for step_function in step_function_list:
+            step_function()
+            render_summary = render_fixture(gameday_dir, output_dir,
+                                            worker_pool=worker_pool)
+
+            assert render_summary.game_count == 2
+            count_tuple_list.append((render_summary.written_count,
+                                     render_summary.skipped_count,
+                                     render_summary.failed_count))
+
+    return count_tuple_list
+
+def test_unchanged_games_are_skipped(gameday_dir, tmp_path):
+    output_dir = str(tmp_path / 'output')
+
+    def touch_source():
+        utime(join(gameday_dir, BOXSCORE_FILENAME), (0, 0))
+
+    def remove_output():
+        remove(join(output_dir, '2017-11-02-HOU-LAD-1.html'))
+
+    assert get_count_tuple_list(
+        gameday_dir, output_dir,
+        [lambda: None, lambda: None, touch_source, remove_output]
+    ) == [(2, 0, 0), (0, 2, 0), (1, 1, 0), (1, 1, 0)]
+
+def test_failed_games_are_retried(gameday_dir, tmp_path):
+    output_dir = str(tmp_path / 'output')
+    assert get_count_tuple_list(
+        gameday_dir, output_dir,
+        [lambda: break_game_stats(gameday_dir), lambda: None,
+         lambda: fix_game_stats(gameday_dir), lambda: None]
+    ) == [(1, 0, 1), (0, 1, 1), (1, 1, 0), (0, 2, 0)]
+
+def test_force_renders_every_game(gameday_dir, tmp_path):
+    output_dir = str(tmp_path / 'output')
+    with WorkerPool(2) as worker_pool:
+        for _ in range(2):
+            render_summary = render_fixture(gameday_dir, output_dir,
+                                            worker_pool=worker_pool,
+                                            force=True)
+
+            assert render_summary.written_count == 2
+            assert render_summary.skipped_count == 0
@@ -0,0 +1,69 @@
+from asyncio import run
+from os.path import join
+
+from baseball.fetch_game import get_game_list_from_file_range
+from baseball.fetch_game_async import (GamedayFetcher,
+                                       get_game_list_from_urls)
+
+
+MISSING_GAME_SPEC = ('2017-11-03', 'HOU', 'LAD', 1)
+
+
+def test_games_match_local_files(gameday_dir, gameday_server, game_spec_list):
+    game_tuple_list = get_game_list_from_urls(
+        game_spec_list, url_pattern=gameday_server.url_pattern
+    )
+
+    local_game_tuple_list = get_game_list_from_file_range('2017-11-01',
+                                                          '2017-11-02',
+                                                          gameday_dir)
+
+    assert len(game_tuple_list) == 2
+    for (game_id, game), (local_game_id, local_game) in zip(
+            game_tuple_list, local_game_tuple_list):
+        assert game_id == local_game_id
+        assert repr(game) == repr(local_game)
+
+    assert gameday_server.request_count == 6
+
+def test_missing_game_is_none(gameday_server, game_spec_list):
+    game_tuple_list = get_game_list_from_urls(
+        game_spec_list + [MISSING_GAME_SPEC],
+        url_pattern=gameday_server.url_pattern
+    )
+
+    assert [game_id for game_id, _ in game_tuple_list] == [
+        '2017-11-01-HOU-LAD-1',
+        '2017-11-02-HOU-LAD-1',
+        '2017-11-03-HOU-LAD-1'
+    ]
+
+    assert game_tuple_list[0][1] is not None
+    assert game_tuple_list[1][1] is not None
+    assert game_tuple_list[2][1] is None
+
+def test_failed_game_keeps_rest_of_batch(gameday_dir, gameday_server,
+                                         game_spec_list):
+    inning_filename = join(gameday_dir, '2017', 'month_11', 'day_02',
+                           'gid_2017_11_02_houmlb_lanmlb_1', 'inning',
+                           'inning_all.xml')
+
+    with open(inning_filename, 'w') as filehandle:
+        filehandle.write('<game><inning')
+
+    game_tuple_list = get_game_list_from_urls(
+        game_spec_list, url_pattern=gameday_server.url_pattern
+    )
+
+    assert game_tuple_list[0][0] == '2017-11-01-HOU-LAD-1'
+    assert game_tuple_list[0][1] is not None
+    assert isinstance(game_tuple_list[1], Exception)
+
+def test_fetcher_runs_in_more_than_one_event_loop(gameday_server,
+                                                  game_spec_list):
+    with GamedayFetcher(1, gameday_server.url_pattern) as fetcher:
+        first_xml_list = run(fetcher.fetch_game_xml_list(game_spec_list))
+        second_xml_list = run(fetcher.fetch_game_xml_list(game_spec_list))
+
+    assert first_xml_list == second_xml_list
+    assert all(all(game_xml_tuple) for game_xml_tuple in first_xml_list)
@@ -0,0 +1,142 @@
+from os import listdir, stat, utime
+from os.path import join
+
+from baseball import fetch_game, game_cache
+from baseball.fetch_game import (WorkerPool,
+                                 get_game_from_files,
+                                 get_game_list_from_file_range)
+from baseball.game_cache import (GAME_CACHE_SUFFIX,
+                                 disable_game_cache,
+                                 enable_game_cache,
+                                 get_cached_game,
+                                 get_game_cache_key)
+
+
+GAME_DIR_PATH = join('2017', 'month_11', 'day_01',
+                     'gid_2017_11_01_houmlb_lanmlb_1')
+
+
+def get_filename_list(gameday_dir):
+    game_dir = join(gameday_dir, GAME_DIR_PATH)
+
+    return [join(game_dir, 'boxscore.xml'),
+            join(game_dir, 'players.xml'),
+            join(game_dir, 'inning', 'inning_all.xml')]
+
+def count_parses(monkeypatch):
+    parse_list = []
+    parse_game_from_files = fetch_game.parse_game_from_files
+
+    def counting_parse_game_from_files(*args):
+        parse_list.append(args[:3])
+        return parse_game_from_files(*args)
+
+    monkeypatch.setattr(fetch_game, 'parse_game_from_files',
+                        counting_parse_game_from_files)
+
+    return parse_list
+
+def get_cache_filename_list(cache_dir):
+    return [x for x in listdir(cache_dir) if x.endswith(GAME_CACHE_SUFFIX)]
+
+def get_cache_inode_dict(cache_dir):
+    return {x: stat(join(cache_dir, x)).st_ino
+            for x in get_cache_filename_list(cache_dir)}
+
+def test_second_load_is_a_hit(gameday_dir, tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / 'game_cache')
+    enable_game_cache(cache_dir)
+    parse_list = count_parses(monkeypatch)
+    filename_list = get_filename_list(gameday_dir)
+
+    first_game = get_game_from_files(*filename_list)
+    assert len(parse_list) == 1
+    assert len(get_cache_filename_list(cache_dir)) == 1
+
+    second_game = get_game_from_files(*filename_list)
+    assert len(parse_list) == 1
+    assert repr(second_game) == repr(first_game)
+
+def test_changed_file_is_a_miss(gameday_dir, tmp_path, monkeypatch):
+    enable_game_cache(str(tmp_path / 'game_cache'))
+    parse_list = count_parses(monkeypatch)
+    filename_list = get_filename_list(gameday_dir)
+    get_game_from_files(*filename_list)
+
+    inning_stat = stat(filename_list[2])
+    utime(filename_list[2], ns=(inning_stat.st_atime_ns,
+                                inning_stat.st_mtime_ns + 10 ** 9))
+
+    get_game_from_files(*filename_list)
+    assert len(parse_list) == 2
+
+    boxscore_stat = stat(filename_list[0])
+    with open(filename_list[0], 'a', encoding='utf-8') as filehandle:
+        filehandle.write('\n')
+
+    utime(filename_list[0], ns=(boxscore_stat.st_atime_ns,
+                                boxscore_stat.st_mtime_ns))
+
+    get_game_from_files(*filename_list)
+    get_game_from_files(*filename_list)
+    assert len(parse_list) == 3
+
+def test_parser_version_is_part_of_the_key(gameday_dir, tmp_path,
+                                           monkeypatch):
+    enable_game_cache(str(tmp_path / 'game_cache'))
+    parse_list = count_parses(monkeypatch)
+    filename_list = get_filename_list(gameday_dir)
+    cache_key = get_game_cache_key(filename_list)
+    get_game_from_files(*filename_list)
+
+    monkeypatch.setattr(game_cache, 'get_parser_version', lambda: 'changed')
+    assert get_game_cache_key(filename_list) != cache_key
+
+    get_game_from_files(*filename_list)
+    assert len(parse_list) == 2
+
+def test_corrupt_entry_is_deleted(gameday_dir, tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / 'game_cache')
+    enable_game_cache(cache_dir)
+    parse_list = count_parses(monkeypatch)
+    filename_list = get_filename_list(gameday_dir)
+    first_game = get_game_from_files(*filename_list)
+
+    cache_key = get_game_cache_key(filename_list)
+    cache_filename = join(cache_dir, cache_key + GAME_CACHE_SUFFIX)
+    with open(cache_filename, 'r+b') as filehandle:
+        filehandle.truncate(20)
+
+    assert get_cached_game(cache_dir, cache_key) is None
+    assert not get_cache_filename_list(cache_dir)
+
+    with open(cache_filename, 'wb') as filehandle:
+        filehandle.write(b'not a game')
+
+    assert repr(get_game_from_files(*filename_list)) == repr(first_game)
+    assert len(parse_list) == 2
+    assert repr(get_cached_game(cache_dir, cache_key)) == repr(first_game)
+
+def test_worker_processes_share_the_cache(gameday_dir, tmp_path):
+    cache_dir = str(tmp_path / 'game_cache')
+    with WorkerPool(2) as worker_pool:
+        enable_game_cache(cache_dir)
+        try:
+            first_game_tuple_list = get_game_list_from_file_range(
+                '2017-11-01', '2017-11-02', gameday_dir, worker_pool
+            )
+
+            cache_inode_dict = get_cache_inode_dict(cache_dir)
+            assert len(cache_inode_dict) == 2
+
+            second_game_tuple_list = get_game_list_from_file_range(
+                '2017-11-01', '2017-11-02', gameday_dir, worker_pool
+            )
+        finally:
+            disable_game_cache()
+
+    assert get_cache_inode_dict(cache_dir) == cache_inode_dict
+    assert ([(game_id, repr(game))
+             for game_id, game in second_game_tuple_list] ==
+            [(game_id, repr(game))
+             for game_id, game in first_game_tuple_list])
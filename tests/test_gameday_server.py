@@ -0,0 +1,122 @@
+from http.client import HTTPConnection
+from os import makedirs, stat, utime
+from os.path import dirname, join
+from urllib.parse import urlsplit
+
+import pytest
+
+from baseball.fetch_game import (BOXSCORE_SUFFIX,
+                                 NOT_FOUND_TEXT,
+                                 get_game_id_and_url_base)
+from baseball.gameday_server import GamedayServer
+
+
+GAME_DIR_PATH = join('2017', 'month_11', 'day_01',
+                     'gid_2017_11_01_houmlb_lanmlb_1')
+
+REQUEST_COUNT = 40
+
+
+def get_boxscore_path(gameday_server, date_str='2017-11-01'):
+    _, url_base = get_game_id_and_url_base(date_str, 'HOU', 'LAD', 1,
+                                           gameday_server.url_pattern)
+
+    return urlsplit(url_base + BOXSCORE_SUFFIX).path
+
+def get_response(gameday_server, path, header_dict=None):
+    host, port = gameday_server.server_address[:2]
+    connection = HTTPConnection(host, port)
+    try:
+        connection.request('GET', path, headers=header_dict or {})
+        response = connection.getresponse()
+        body = response.read()
+    finally:
+        connection.close()
+
+    return response.status, dict(response.getheaders()), body
+
+def test_missing_files_are_not_found(gameday_server):
+    for path in [get_boxscore_path(gameday_server, '2017-11-03'),
+                 '/index.html',
+                 '/components/game/mlb/year_2017/month_11/day_01/']:
+        status, _, body = get_response(gameday_server, path)
+        assert status == 404
+        assert body.decode('utf-8') == NOT_FOUND_TEXT
+
+def test_entity_tag_revalidation(gameday_dir, gameday_server):
+    boxscore_filename = join(gameday_dir, GAME_DIR_PATH, 'boxscore.xml')
+    boxscore_path = get_boxscore_path(gameday_server)
+    status, header_dict, body = get_response(gameday_server, boxscore_path)
+    with open(boxscore_filename, 'rb') as filehandle:
+        assert body == filehandle.read()
+
+    assert status == 200
+    assert header_dict['Last-Modified']
+    entity_tag = header_dict['ETag']
+
+    status, header_dict, body = get_response(gameday_server, boxscore_path,
+                                             {'If-None-Match': entity_tag})
+
+    assert (status, header_dict['ETag'], body) == (304, entity_tag, b'')
+
+    boxscore_stat = stat(boxscore_filename)
+    utime(boxscore_filename, ns=(boxscore_stat.st_atime_ns,
+                                 boxscore_stat.st_mtime_ns + 10 ** 9))
+
+    status, header_dict, body = get_response(gameday_server, boxscore_path,
+                                             {'If-None-Match': entity_tag})
+
+    assert status == 200
+    assert header_dict['ETag'] != entity_tag
+    assert body
+
+def get_status_list(gameday_dir, **kwargs):
+    with GamedayServer(gameday_dir, **kwargs) as gameday_server:
+        boxscore_path = get_boxscore_path(gameday_server)
+        status_list = [get_response(gameday_server, boxscore_path)[0]
+                       for _ in range(REQUEST_COUNT)]
+
+        assert gameday_server.request_count == REQUEST_COUNT
+        assert gameday_server.error_count == status_list.count(
+            kwargs.get('error_status', 500)
+        )
+
+    return status_list
+
+def test_injected_errors_follow_the_seed(gameday_dir):
+    status_list = get_status_list(gameday_dir, error_rate=0.5, seed=12)
+    assert set(status_list) == {200, 500}
+    assert get_status_list(gameday_dir, error_rate=0.5,
+                           seed=12) == status_list
+
+    assert get_status_list(gameday_dir, error_rate=1.0, error_status=503,
+                           seed=12) == [503] * REQUEST_COUNT
+
+    assert get_status_list(gameday_dir) == [200] * REQUEST_COUNT
+
+def test_bad_settings_are_rejected(gameday_dir):
+    for kwargs in [{'error_rate': 1.5}, {'latency': -1},
+                   {'latency_jitter': -1}]:
+        with pytest.raises(ValueError):
+            GamedayServer(gameday_dir, **kwargs)
+
+def test_paths_outside_the_mirror_are_not_served(gameday_dir,
+                                                 gameday_server):
+    secret_dir = join(dirname(gameday_dir), 'secret')
+    makedirs(secret_dir)
+    with open(join(secret_dir, 'boxscore.xml'), 'w') as filehandle:
+        filehandle.write('<secret/>')
+
+    boxscore_path = get_boxscore_path(gameday_server)
+    game_dir_path = boxscore_path[:-len(BOXSCORE_SUFFIX)]
+    for path in [
+            game_dir_path + '../../../../secret/boxscore.xml',
+            game_dir_path + '%2e%2e/%2e%2e/%2e%2e/%2e%2e/secret/boxscore.xml',
+            '/components/game/mlb/year_2017/../../secret/boxscore.xml',
+            '/components/game/mlb/year_2017/month_11/day_01/gid_x/../'
+            '../../../secret/boxscore.xml',
+            '/../secret/boxscore.xml'
+    ]:
+        status, _, body = get_response(gameday_server, path)
+        assert status == 404, path
+        assert body.decode('utf-8') == NOT_FOUND_TEXT
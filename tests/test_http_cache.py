@@ -0,0 +1,138 @@
+from os import listdir, stat, utime
+from os.path import getsize, join
+from re import sub
+
+from baseball import cache_dir as cache_dir_module
+from baseball.cache_dir import EVICT_TO_FRACTION, store_cache_file
+from baseball.fetch_game import get_game_xml_from_url
+from baseball.fetch_game_async import get_game_xml_list_from_urls
+from baseball.http_cache import HTTP_CACHE_SUFFIX, enable_http_cache
+
+
+STORE_COUNT = 300
+ENTRY_BYTES = 1000
+MAX_CACHE_BYTES = 100000
+
+GAME_DIR_PATH = join('2017', 'month_11', 'day_01',
+                     'gid_2017_11_01_houmlb_lanmlb_1')
+
+
+def set_boxscore_status(gameday_dir, status_ind):
+    boxscore_filename = join(gameday_dir, GAME_DIR_PATH, 'boxscore.xml')
+    with open(boxscore_filename, encoding='utf-8') as filehandle:
+        boxscore_raw_xml = filehandle.read()
+
+    with open(boxscore_filename, 'w', encoding='utf-8') as filehandle:
+        filehandle.write(sub(r'status_ind="\w*"',
+                             'status_ind="{}"'.format(status_ind),
+                             boxscore_raw_xml))
+
+def get_game_xml(gameday_server):
+    return get_game_xml_from_url('2017-11-01', 'HOU', 'LAD', 1,
+                                 gameday_server.url_pattern)
+
+def test_final_game_is_served_from_cache(gameday_server, game_spec_list,
+                                         tmp_path):
+    enable_http_cache(str(tmp_path / 'http_cache'))
+    first_game_xml = get_game_xml(gameday_server)
+    assert gameday_server.request_count == 3
+
+    assert get_game_xml(gameday_server) == first_game_xml
+    assert gameday_server.request_count == 3
+
+    game_xml_list = get_game_xml_list_from_urls(game_spec_list,
+                                                url_pattern=(
+                                                    gameday_server.url_pattern
+                                                ))
+
+    assert game_xml_list[0] == first_game_xml
+    assert gameday_server.request_count == 6
+
+def test_unfinished_game_is_revalidated(gameday_dir, gameday_server,
+                                        tmp_path):
+    set_boxscore_status(gameday_dir, 'I')
+    enable_http_cache(str(tmp_path / 'http_cache'))
+    first_game_xml = get_game_xml(gameday_server)
+    assert gameday_server.request_count == 3
+
+    inning_filename = join(gameday_dir, GAME_DIR_PATH, 'inning',
+                           'inning_all.xml')
+
+    inning_stat = stat(inning_filename)
+    with open(inning_filename, 'r+', encoding='utf-8') as filehandle:
+        inning_raw_xml = filehandle.read()
+        filehandle.seek(0)
+        filehandle.write(inning_raw_xml.replace('Springer', 'Sprinter'))
+
+    utime(inning_filename, ns=(inning_stat.st_atime_ns,
+                               inning_stat.st_mtime_ns))
+
+    assert get_game_xml(gameday_server) == first_game_xml
+    assert gameday_server.request_count == 6
+
+    set_boxscore_status(gameday_dir, 'F')
+    final_game_xml = get_game_xml(gameday_server)
+    assert gameday_server.request_count == 9
+    assert 'status_ind="F"' in final_game_xml[1]
+    assert final_game_xml[2:] == first_game_xml[2:]
+
+    assert get_game_xml(gameday_server) == final_game_xml
+    assert gameday_server.request_count == 9
+
+def test_cache_stays_under_its_limit(gameday_server, tmp_path):
+    cache_dir = str(tmp_path / 'http_cache')
+    enable_http_cache(cache_dir, 1)
+    get_game_xml(gameday_server)
+
+    assert not [x for x in listdir(cache_dir)
+                if x.endswith(HTTP_CACHE_SUFFIX)]
+
+    enable_http_cache(cache_dir, 100000)
+    get_game_xml(gameday_server)
+    cache_size = sum(getsize(join(cache_dir, x)) for x in listdir(cache_dir))
+
+    assert 0 < cache_size <= 100000
+
+def test_stale_temp_files_are_removed(tmp_path):
+    cache_dir = str(tmp_path)
+    stale_temp_filename = join(cache_dir, 'a' + HTTP_CACHE_SUFFIX + '.1.2.tmp')
+    fresh_temp_filename = join(cache_dir, 'b' + HTTP_CACHE_SUFFIX + '.1.2.tmp')
+    for temp_filename in [stale_temp_filename, fresh_temp_filename]:
+        with open(temp_filename, 'wb') as filehandle:
+            filehandle.write(b'partial')
+
+    utime(stale_temp_filename, (0, 0))
+    store_cache_file(cache_dir, join(cache_dir, 'c' + HTTP_CACHE_SUFFIX),
+                     b'entry', 100, HTTP_CACHE_SUFFIX)
+
+    assert sorted(listdir(cache_dir)) == ['b' + HTTP_CACHE_SUFFIX + '.1.2.tmp',
+                                          'c' + HTTP_CACHE_SUFFIX]
+
+def test_full_cache_evicts_to_low_water_mark(tmp_path, monkeypatch):
+    cache_dir = str(tmp_path)
+    evict_list = []
+    evict_cache_dir = cache_dir_module.evict_cache_dir
+
+    def counting_evict_cache_dir(*args):
+        total_bytes = evict_cache_dir(*args)
+        evict_list.append(total_bytes)
+        return total_bytes
+
+    monkeypatch.setattr(cache_dir_module, 'evict_cache_dir',
+                        counting_evict_cache_dir)
+
+    for i in range(STORE_COUNT):
+        store_cache_file(cache_dir,
+                         join(cache_dir, str(i) + HTTP_CACHE_SUFFIX),
+                         b'x' * ENTRY_BYTES, MAX_CACHE_BYTES,
+                         HTTP_CACHE_SUFFIX)
+
+        assert sum(getsize(join(cache_dir, x))
+                   for x in listdir(cache_dir)) <= MAX_CACHE_BYTES
+
+    assert len(evict_list) <= 1 + (
+        STORE_COUNT * ENTRY_BYTES //
+        int(MAX_CACHE_BYTES * (1 - EVICT_TO_FRACTION))
+    )
+
+    assert max(evict_list[1:]) <= MAX_CACHE_BYTES * EVICT_TO_FRACTION
@@ -0,0 +1,61 @@
+from os.path import join
+from xml.etree.ElementTree import fromstring, tostring
+
+from baseball.baseball import PlayerRegistry
+from baseball.fetch_game import (get_filename_list,
+                                 get_game_from_files,
+                                 get_game_from_files_iterparse)
+
+
+def double_innings(inning_filename):
+    with open(inning_filename, 'rb') as filehandle:
+        game_xml = fromstring(filehandle.read())
+
+    inning_xml_list = list(game_xml)
+    for inning_xml in inning_xml_list:
+        inning_xml = fromstring(tostring(inning_xml))
+        inning_xml.set('num', str(len(game_xml) + 1))
+        game_xml.append(inning_xml)
+
+    for inning_xml in game_xml:
+        inning_xml.set('next', 'Y')
+
+    game_xml[-1].set('next', 'N')
+    with open(inning_filename, 'wb') as filehandle:
+        filehandle.write(tostring(game_xml, encoding='utf-8'))
+
+def get_fixture_filename_list(gameday_dir):
+    return [filename_tuple[1:] for filename_tuple
+            in get_filename_list('2017-11-01', '2017-11-02', gameday_dir)]
+
+def assert_same_games(filename_tuple_list):
+    assert filename_tuple_list
+    for filename_tuple in filename_tuple_list:
+        tree_game = get_game_from_files(*filename_tuple)
+        stream_game = get_game_from_files_iterparse(*filename_tuple)
+
+        assert repr(stream_game) == repr(tree_game)
+        assert stream_game._asdict() == tree_game._asdict()
+        assert stream_game.get_svg_str() == tree_game.get_svg_str()
+
+        player_registry = PlayerRegistry()
+        assert repr(get_game_from_files_iterparse(
+            *filename_tuple, player_registry=player_registry
+        )) == repr(tree_game)
+
+def test_iterparse_matches_tree_parse(gameday_dir):
+    assert_same_games(get_fixture_filename_list(gameday_dir))
+
+def test_iterparse_matches_tree_parse_on_long_games(gameday_dir):
+    filename_tuple_list = get_fixture_filename_list(gameday_dir)
+    for _, _, inning_filename in filename_tuple_list:
+        double_innings(inning_filename)
+
+    assert len(get_game_from_files(*filename_tuple_list[0]).inning_list) > 9
+    assert_same_games(filename_tuple_list)
+
+def test_missing_file_is_none(gameday_dir):
+    boxscore_file, player_file, _ = get_fixture_filename_list(gameday_dir)[0]
+    assert get_game_from_files_iterparse(
+        boxscore_file, player_file, join(gameday_dir, 'missing.xml')
+    ) is None
@@ -0,0 +1,103 @@
+from os.path import join
+from xml.etree.ElementTree import Element, fromstring, tostring
+
+from baseball.fetch_game import get_game_from_xml_strings
+from baseball.live_game import get_live_game_from_url
+
+
+GAME_DIR_PATH = join('2017', 'month_11', 'day_01',
+                     'gid_2017_11_01_houmlb_lanmlb_1')
+
+
+def read_game_file(gameday_dir, *path_list):
+    with open(join(gameday_dir, GAME_DIR_PATH, *path_list),
+              encoding='utf-8') as filehandle:
+        return filehandle.read()
+
+def write_game_file(gameday_dir, text, *path_list):
+    with open(join(gameday_dir, GAME_DIR_PATH, *path_list), 'w',
+              encoding='utf-8') as filehandle:
+        filehandle.write(text)
+
+def get_inning_xml_prefix_list(inning_raw_xml):
+    game_xml = fromstring(inning_raw_xml)
+    inning_xml_list = list(game_xml)
+    prefix_list = []
+    for inning_index, inning_xml in enumerate(inning_xml_list):
+        for half_index, half_inning_xml in enumerate(inning_xml):
+            for event_count in range(1, len(half_inning_xml) + 1):
+                prefix_xml = Element(game_xml.tag, game_xml.attrib)
+                prefix_xml.extend(inning_xml_list[:inning_index])
+
+                partial_inning_xml = Element(inning_xml.tag,
+                                             inning_xml.attrib)
+
+                partial_inning_xml.extend(list(inning_xml)[:half_index])
+                partial_half_xml = Element(half_inning_xml.tag,
+                                           half_inning_xml.attrib)
+
+                partial_half_xml.extend(list(half_inning_xml)[:event_count])
+                partial_inning_xml.append(partial_half_xml)
+                prefix_xml.append(partial_inning_xml)
+                prefix_list.append(tostring(prefix_xml, encoding='unicode'))
+
+    return prefix_list
+
+def test_replay_matches_full_parse(gameday_dir, gameday_server):
+    boxscore_raw_xml = read_game_file(gameday_dir, 'boxscore.xml')
+    players_raw_xml = read_game_file(gameday_dir, 'players.xml')
+    inning_raw_xml = read_game_file(gameday_dir, 'inning', 'inning_all.xml')
+
+    live_game = None
+    first_inning = None
+    for inning_prefix_raw_xml in get_inning_xml_prefix_list(inning_raw_xml):
+        write_game_file(gameday_dir, inning_prefix_raw_xml, 'inning',
+                        'inning_all.xml')
+
+        _, live_game = get_live_game_from_url('2017-11-01', 'HOU', 'LAD', 1,
+                                              live_game,
+                                              gameday_server.url_pattern)
+
+        full_game = get_game_from_xml_strings(boxscore_raw_xml,
+                                              players_raw_xml,
+                                              inning_prefix_raw_xml)
+
+        assert repr(live_game.game) == repr(full_game)
+        if first_inning is None and len(live_game.game.inning_list) > 1:
+            first_inning = live_game.game.inning_list[0]
+
+    write_game_file(gameday_dir, inning_raw_xml, 'inning', 'inning_all.xml')
+    _, live_game = get_live_game_from_url('2017-11-01', 'HOU', 'LAD', 1,
+                                          live_game,
+                                          gameday_server.url_pattern)
+
+    full_game = get_game_from_xml_strings(boxscore_raw_xml, players_raw_xml,
+                                          inning_raw_xml)
+
+    assert repr(live_game.game) == repr(full_game)
+    assert live_game.get_svg_str() == full_game.get_svg_str()
+    assert live_game.game.inning_list[0] is first_inning
+
+def test_changed_half_inning_is_reparsed(gameday_dir, gameday_server):
+    boxscore_raw_xml = read_game_file(gameday_dir, 'boxscore.xml')
+    players_raw_xml = read_game_file(gameday_dir, 'players.xml')
+    inning_raw_xml = read_game_file(gameday_dir, 'inning', 'inning_all.xml')
+    corrected_raw_xml = inning_raw_xml.replace('strikes out swinging',
+                                               'called out on strikes', 1)
+
+    _, live_game = get_live_game_from_url('2017-11-01', 'HOU', 'LAD', 1,
+                                          None, gameday_server.url_pattern)
+
+    write_game_file(gameday_dir, corrected_raw_xml, 'inning',
+                    'inning_all.xml')
+
+    _, live_game = get_live_game_from_url('2017-11-01', 'HOU', 'LAD', 1,
+                                          live_game,
+                                          gameday_server.url_pattern)
+
+    full_game = get_game_from_xml_strings(boxscore_raw_xml, players_raw_xml,
+                                          corrected_raw_xml)
+
+    assert corrected_raw_xml != inning_raw_xml
+    assert repr(live_game.game) == repr(full_game)
+    assert live_game.get_svg_str() == full_game.get_svg_str()
@@ -0,0 +1,114 @@
+from os import makedirs, utime
+from os.path import join
+from shutil import copytree
+
+from baseball import fetch_game
+from baseball.fetch_game import (get_filename_list,
+                                 get_game_list_from_file_range,
+                                 load_manifest,
+                                 update_manifest)
+
+
+GAME_DIR_PATH = join('2017', 'month_11', 'day_01',
+                     'gid_2017_11_01_houmlb_lanmlb_1')
+
+NEW_GAME_DIR_PATH = join('2017', 'month_11', 'day_03',
+                         'gid_2017_11_03_houmlb_lanmlb_1')
+
+OTHER_TEAM_GAME_DIR_PATH = join('2017', 'month_11', 'day_01',
+                                'gid_2017_11_01_nyamlb_bosmlb_1')
+
+
+def get_game_id_list(gameday_dir, **kwargs):
+    return [filename_tuple[0] for filename_tuple
+            in get_filename_list('2017-11-01', '2017-11-03', gameday_dir,
+                                 **kwargs)]
+
+def count_day_listings(monkeypatch):
+    day_list = []
+    get_day_manifest_entry = fetch_game.get_day_manifest_entry
+
+    def counting_get_day_manifest_entry(input_path, year, month, day):
+        day_list.append((year, month, day))
+        return get_day_manifest_entry(input_path, year, month, day)
+
+    monkeypatch.setattr(fetch_game, 'get_day_manifest_entry',
+                        counting_get_day_manifest_entry)
+
+    return day_list
+
+def test_refresh_only_relists_changed_days(gameday_dir, monkeypatch):
+    update_manifest(gameday_dir)
+    day_list = count_day_listings(monkeypatch)
+    copytree(join(gameday_dir, GAME_DIR_PATH),
+             join(gameday_dir, NEW_GAME_DIR_PATH))
+
+    assert get_game_id_list(gameday_dir) == ['2017-11-01-HOU-LAD-1',
+                                             '2017-11-02-HOU-LAD-1',
+                                             '2017-11-03-HOU-LAD-1']
+
+    assert day_list == [('2017', '11', '03')]
+    assert '2017-11-03' in load_manifest(gameday_dir)['day_dict']
+
+    assert len(get_game_id_list(gameday_dir)) == 3
+    assert day_list == [('2017', '11', '03')]
+
+def test_empty_game_folder_is_listed_once_filled(gameday_dir):
+    new_game_dir = join(gameday_dir, NEW_GAME_DIR_PATH)
+    makedirs(new_game_dir)
+    utime(new_game_dir, (0, 0))
+    update_manifest(gameday_dir)
+
+    assert get_filename_list('2017-11-03', '2017-11-03', gameday_dir) == []
+
+    copytree(join(gameday_dir, GAME_DIR_PATH), new_game_dir,
+             dirs_exist_ok=True)
+
+    assert [x[0] for x in get_filename_list('2017-11-03', '2017-11-03',
+                                            gameday_dir)] == [
+        '2017-11-03-HOU-LAD-1'
+    ]
+
+    game_tuple_list = get_game_list_from_file_range('2017-11-03',
+                                                    '2017-11-03',
+                                                    gameday_dir)
+
+    assert len(game_tuple_list) == 1
+    assert game_tuple_list[0][1] is not None
+
+def test_explicit_update_lists_filled_game_folder(gameday_dir):
+    new_game_dir = join(gameday_dir, NEW_GAME_DIR_PATH)
+    makedirs(new_game_dir)
+    utime(new_game_dir, (0, 0))
+    update_manifest(gameday_dir)
+    copytree(join(gameday_dir, GAME_DIR_PATH), new_game_dir,
+             dirs_exist_ok=True)
+
+    day_entry = update_manifest(gameday_dir)['day_dict']['2017-11-03']
+    assert list(day_entry['game_dict']) == ['2017-11-03-HOU-LAD-1']
+    assert not day_entry['empty_dict']
+
+def test_team_filter(gameday_dir):
+    copytree(join(gameday_dir, GAME_DIR_PATH),
+             join(gameday_dir, OTHER_TEAM_GAME_DIR_PATH))
+
+    for _ in range(2):
+        assert get_game_id_list(gameday_dir, team='HOU') == [
+            '2017-11-01-HOU-LAD-1', '2017-11-02-HOU-LAD-1'
+        ]
+
+        assert get_game_id_list(gameday_dir, team='BOS') == [
+            '2017-11-01-NYY-BOS-1'
+        ]
+
+        assert get_game_id_list(gameday_dir, team='SEA') == []
+        update_manifest(gameday_dir)
+
+    game_tuple_list = get_game_list_from_file_range('2017-11-01',
+                                                    '2017-11-03',
+                                                    gameday_dir,
+                                                    team='NYY')
+
+    assert [game_id for game_id, _ in game_tuple_list] == [
+        '2017-11-01-NYY-BOS-1'
+    ]
@@ -0,0 +1,88 @@
+from time import sleep
+
+import pytest
+
+from baseball.fetch_game import WorkerPool, get_parallel_game_generator
+
+
+GAME_COUNT = 12
+FAILING_GAME_ID = 'failing-game'
+
+
+class CountingWorkerPool(object):
+    def __init__(self, worker_pool):
+        self.worker_pool = worker_pool
+        self.num_processes = worker_pool.num_processes
+        self.submitted_count = 0
+
+    def apply_async(self, *args, **kwargs):
+        self.submitted_count += 1
+        return self.worker_pool.apply_async(*args, **kwargs)
+
+
+def load_fake_game(filename_tuple):
+    game_id, delay_seconds = filename_tuple
+    sleep(delay_seconds)
+    if game_id == FAILING_GAME_ID:
+        raise ValueError('Cannot load {}'.format(game_id))
+
+    return game_id, 'game for ' + game_id
+
+def get_filename_list(game_count=GAME_COUNT):
+    return [('game-{}'.format(i), (game_count - i) * 0.01)
+            for i in range(game_count)]
+
+def get_game_id_list(filename_list):
+    return [game_id for game_id, _ in filename_list]
+
+def test_ordered_games_come_back_in_input_order():
+    filename_list = get_filename_list()
+    with WorkerPool(4) as worker_pool:
+        game_tuple_list = list(get_parallel_game_generator(
+            filename_list, load_fake_game, worker_pool=worker_pool
+        ))
+
+    assert get_game_id_list(game_tuple_list) == get_game_id_list(
+        filename_list
+    )
+
+    assert all(game == 'game for ' + game_id
+               for game_id, game in game_tuple_list)
+
+def test_unordered_games_are_all_returned():
+    filename_list = get_filename_list()
+    with WorkerPool(4) as worker_pool:
+        game_tuple_list = list(get_parallel_game_generator(
+            filename_list, load_fake_game, chunksize=2, ordered=False,
+            worker_pool=worker_pool
+        ))
+
+    game_id_list = get_game_id_list(game_tuple_list)
+    assert len(game_id_list) == GAME_COUNT
+    assert sorted(game_id_list) == sorted(get_game_id_list(filename_list))
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_window_bounds_chunks_in_flight(ordered):
+    window = 3
+    filename_list = get_filename_list()
+    with WorkerPool(2) as worker_pool:
+        counting_worker_pool = CountingWorkerPool(worker_pool)
+        for game_index, _ in enumerate(get_parallel_game_generator(
+                filename_list, load_fake_game, window=window,
+                ordered=ordered, worker_pool=counting_worker_pool
+        )):
+            assert counting_worker_pool.submitted_count <= (game_index +
+                                                            window)
+
+    assert counting_worker_pool.submitted_count == GAME_COUNT
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_worker_exception_reaches_caller(ordered):
+    filename_list = get_filename_list()
+    filename_list.insert(GAME_COUNT // 2, (FAILING_GAME_ID, 0))
+    with WorkerPool(2) as worker_pool:
+        with pytest.raises(ValueError, match=FAILING_GAME_ID):
+            list(get_parallel_game_generator(filename_list,
+                                             load_fake_game,
+                                             ordered=ordered,
+                                             worker_pool=worker_pool))
@@ -0,0 +1,94 @@
+import pytest
+
+numpy = pytest.importorskip('numpy')
+
+from baseball.baseball_events import Pitch
+from baseball.fetch_game import get_game_list_from_file_range
+from baseball.pitch_table import (MISSING_CATEGORY_CODE,
+                                  PITCH_TABLE_COLUMN_LIST,
+                                  PitchTable,
+                                  get_game_pitch_generator,
+                                  get_pitch_table,
+                                  get_pitch_table_from_file_range)
+
+
+@pytest.fixture
+def game_tuple_list(gameday_dir):
+    return get_game_list_from_file_range('2017-11-01', '2017-11-02',
+                                         gameday_dir)
+
+@pytest.fixture
+def pitch_list(game_tuple_list):
+    return [pitch
+            for _, game in game_tuple_list
+            for _, _, _, _, pitch in get_game_pitch_generator(game)]
+
+def test_one_row_per_pitch(gameday_dir, game_tuple_list):
+    pitch_table = get_pitch_table_from_file_range('2017-11-01', '2017-11-02',
+                                                  gameday_dir)
+
+    pitch_count = sum(
+        isinstance(event, Pitch)
+        for _, game in game_tuple_list
+        for inning in game.inning_list
+        for plate_appearance in (inning.top_half_appearance_list +
+                                 inning.bottom_half_appearance_list)
+        for event in plate_appearance.event_list
+    )
+
+    assert pitch_count > 0
+    assert len(pitch_table) == pitch_count
+    assert all(len(pitch_table[column_name]) == pitch_count
+               for column_name, _ in PITCH_TABLE_COLUMN_LIST)
+
+def test_category_codes_round_trip(game_tuple_list, pitch_list):
+    pitch_table = get_pitch_table(game_tuple_list)
+
+    assert list(pitch_table.get_value_array('pitch_description')) == [
+        pitch.pitch_description for pitch in pitch_list
+    ]
+
+    assert list(pitch_table.get_value_array('pitch_type')) == [
+        pitch.pitch_type for pitch in pitch_list
+    ]
+
+    assert list(pitch_table['pitch_description_code']) == [
+        pitch_table.get_code('pitch_description', pitch.pitch_description)
+        for pitch in pitch_list
+    ]
+
+    assert list(numpy.unique(pitch_table.get_value_array('game_id'))) == [
+        game_id for game_id, _ in game_tuple_list
+    ]
+
+    assert (pitch_table.get_code('pitch_type', 'not a pitch type') ==
+            MISSING_CATEGORY_CODE)
+
+def test_save_and_memory_mapped_load(game_tuple_list, tmp_path):
+    pitch_table = get_pitch_table(game_tuple_list)
+    table_dir = str(tmp_path / 'pitch_table')
+    pitch_table.save(table_dir)
+
+    for mmap in [True, False]:
+        loaded_pitch_table = PitchTable.load(table_dir, mmap)
+        assert len(loaded_pitch_table) == len(pitch_table)
+        assert loaded_pitch_table.category_dict == pitch_table.category_dict
+        for column_name, dtype in PITCH_TABLE_COLUMN_LIST:
+            column_array = loaded_pitch_table[column_name]
+            assert isinstance(column_array, numpy.memmap) == mmap
+            assert column_array.dtype == numpy.dtype(dtype)
+            numpy.testing.assert_array_equal(column_array,
+                                             pitch_table[column_name])
+
+def test_filter(game_tuple_list, pitch_list):
+    pitch_table = get_pitch_table(game_tuple_list)
+    mask = pitch_table['half'] == 1
+    bottom_pitch_table = pitch_table.filter(mask)
+
+    assert 0 < len(bottom_pitch_table) < len(pitch_table)
+    assert len(bottom_pitch_table) == mask.sum()
+    assert (bottom_pitch_table['half'] == 1).all()
+    assert list(bottom_pitch_table.get_value_array('pitch_description')) == [
+        pitch.pitch_description
+        for pitch, is_bottom in zip(pitch_list, mask) if is_bottom
+    ]
@@ -0,0 +1,89 @@
+from json import load
+from os.path import abspath, dirname, join
+from random import Random
+from re import sub
+
+from baseball.baseball import (PLAY_CODE_ORDERED_DICT,
+                               get_play_code,
+                               strip_suffixes,
+                               strip_this_suffix)
+from baseball.fetch_game import get_game_list_from_file_range
+
+
+SCORECARD_SUMMARY_FILENAME = join(dirname(abspath(__file__)), 'fixtures',
+                                  'scorecard_summaries.json')
+
+RANDOM_CASE_COUNT = 20000
+SUFFIX_PIECE_LIST = [' Jr.', ' Sr.', ' II', ' III', ' IV', ' St. ', ' ',
+                     '.', 'A', 'b', ' Jr. ', ' Sr. ', 'Jr.', ' Z']
+
+
+def get_reference_play_code(description_str):
+    code = None
+    for keyword, this_code in PLAY_CODE_ORDERED_DICT.items():
+        if keyword in description_str:
+            code = this_code
+
+    return code
+
+def get_reference_stripped_str(input_str):
+    input_str = strip_this_suffix(r' Jr\.\s+[A-Z]', r' Jr\.', input_str)
+    input_str = strip_this_suffix(r' Sr\.\s+[A-Z]', r' Sr\.', input_str)
+    input_str = sub(r' II', '', input_str)
+    input_str = sub(r' III', '', input_str)
+    input_str = sub(r' IV', '', input_str)
+    input_str = sub(r' St\. ', ' St ', input_str)
+
+    return input_str
+
+def get_fixture_plate_appearance_list(gameday_dir):
+    plate_appearance_list = []
+    for _, game in get_game_list_from_file_range('2017-11-01', '2017-11-02',
+                                                 gameday_dir):
+        for inning in game.inning_list:
+            plate_appearance_list += inning.top_half_appearance_list
+            plate_appearance_list += inning.bottom_half_appearance_list
+
+    return plate_appearance_list
+
+def get_fixture_description_list(gameday_dir):
+    return [plate_appearance.plate_appearance_description
+            for plate_appearance
+            in get_fixture_plate_appearance_list(gameday_dir)]
+
+def get_random_str(random, piece_list, max_piece_count):
+    return ''.join(random.choice(piece_list)
+                   for _ in range(random.randint(0, max_piece_count)))
+
+def test_scorecard_summaries_match_recorded_corpus(gameday_dir):
+    with open(SCORECARD_SUMMARY_FILENAME) as filehandle:
+        expected_list = load(filehandle)
+
+    assert [[plate_appearance.scorecard_summary,
+             plate_appearance.hit_location]
+            for plate_appearance
+            in get_fixture_plate_appearance_list(gameday_dir)] == expected_list
+
+def test_play_code_matches_last_match_wins(gameday_dir):
+    random = Random(12)
+    keyword_list = list(PLAY_CODE_ORDERED_DICT) + [' ', 'x', 'Single']
+    description_list = get_fixture_description_list(gameday_dir)
+    description_list += [get_random_str(random, keyword_list, 4)
+                         for _ in range(RANDOM_CASE_COUNT)]
+
+    for description in description_list:
+        assert (get_play_code(description) ==
+                get_reference_play_code(description)), description
+
+def test_strip_suffixes_matches_repeated_search(gameday_dir):
+    random = Random(12)
+    input_list = get_fixture_description_list(gameday_dir)
+    input_list += ['Ronald Acuna Jr. Jr. Jr. A', 'Jr. Sr. Jr. Sr. Z',
+                   'Vladimir Guerrero Jr.  Jr. B', 'A St. Jr. Sr. II III IV']
+
+    input_list += [get_random_str(random, SUFFIX_PIECE_LIST, 8)
+                   for _ in range(RANDOM_CASE_COUNT)]
+
+    for input_str in input_list:
+        assert (strip_suffixes(input_str) ==
+                get_reference_stripped_str(input_str)), input_str
@@ -0,0 +1,91 @@
+from os.path import join
+
+from baseball.baseball import PlayerRegistry
+from baseball.fetch_game import (get_game_from_files,
+                                 get_game_generator_from_file_range)
+from baseball.live_game import get_live_game_from_url
+
+
+FIRST_GAME_DIR_PATH = join('2017', 'month_11', 'day_01',
+                           'gid_2017_11_01_houmlb_lanmlb_1')
+
+SECOND_GAME_DIR_PATH = join('2017', 'month_11', 'day_02',
+                            'gid_2017_11_02_houmlb_lanmlb_1')
+
+TAYLOR_MLB_ID = 621035
+
+
+def renumber_taylor(gameday_dir):
+    for filename, old_str, new_str in [
+            ('players.xml', 'last="Taylor" num="3"', 'last="Taylor" num="33"'),
+            ('boxscore.xml', 'obp="0.354"', 'obp="0.360"')
+    ]:
+        filename = join(gameday_dir, SECOND_GAME_DIR_PATH, filename)
+        with open(filename, encoding='utf-8') as filehandle:
+            raw_xml = filehandle.read()
+
+        assert old_str in raw_xml
+        with open(filename, 'w', encoding='utf-8') as filehandle:
+            filehandle.write(raw_xml.replace(old_str, new_str))
+
+def get_player(team, mlb_id):
+    return next(player for player in team.player_id_dict.values()
+                if player.mlb_id == mlb_id)
+
+def test_games_share_players_but_not_stats(gameday_dir):
+    renumber_taylor(gameday_dir)
+    player_registry = PlayerRegistry()
+    game_tuple_list = list(get_game_generator_from_file_range(
+        '2017-11-01', '2017-11-02', gameday_dir,
+        player_registry=player_registry
+    ))
+
+    (_, first_game), (_, second_game) = game_tuple_list
+    first_player = get_player(first_game.home_team, TAYLOR_MLB_ID)
+    second_player = get_player(second_game.home_team, TAYLOR_MLB_ID)
+    assert first_player is second_player
+
+    first_player_stats = first_game.home_team.get_player_stats(first_player)
+    second_player_stats = second_game.home_team.get_player_stats(
+        second_player
+    )
+
+    assert (first_player_stats.number, first_player_stats.obp) == (3, 0.354)
+    assert (second_player_stats.number, second_player_stats.obp) == (33,
+                                                                     0.360)
+
+    first_batter_appearance = (
+        second_game.home_team.batting_order_list_list[0][0]
+    )
+
+    assert first_batter_appearance.player_obj is second_player
+    assert first_batter_appearance.player_stats is second_player_stats
+
+    plain_game_list = [
+        get_game_from_files(*[join(gameday_dir, game_dir_path, x)
+                              for x in ['boxscore.xml', 'players.xml',
+                                        join('inning', 'inning_all.xml')]])
+        for game_dir_path in [FIRST_GAME_DIR_PATH, SECOND_GAME_DIR_PATH]
+    ]
+
+    assert [repr(game) for game in plain_game_list] == [
+        repr(first_game), repr(second_game)
+    ]
+
+def test_live_game_uses_the_registry(gameday_dir, gameday_server):
+    player_registry = PlayerRegistry()
+    (_, game), = get_game_generator_from_file_range(
+        '2017-11-01', '2017-11-01', gameday_dir,
+        player_registry=player_registry
+    )
+
+    registry_size = len(player_registry)
+    _, live_game = get_live_game_from_url('2017-11-01', 'HOU', 'LAD', 1,
+                                          url_pattern=(
+                                              gameday_server.url_pattern
+                                          ),
+                                          player_registry=player_registry)
+
+    assert len(player_registry) == registry_size
+    assert (get_player(live_game.game.home_team, TAYLOR_MLB_ID) is
+            get_player(game.home_team, TAYLOR_MLB_ID))
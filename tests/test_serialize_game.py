@@ -0,0 +1,14 @@
+from baseball.fetch_game import get_filename_list, get_game_from_files
+from baseball.serialize_game import get_game_bytes, get_game_from_bytes
+
+
+def test_saved_game_round_trips(gameday_dir):
+    filename_list = get_filename_list('2017-11-01', '2017-11-02', gameday_dir)
+    assert filename_list
+
+    for filename_tuple in filename_list:
+        game = get_game_from_files(*filename_tuple[1:])
+        loaded_game = get_game_from_bytes(get_game_bytes(game))
+
+        assert loaded_game._asdict() == game._asdict()
+        assert repr(loaded_game) == repr(game)
@@ -0,0 +1,59 @@
+from gzip import decompress
+from os import listdir
+from os.path import join
+
+from baseball.fetch_game import get_game_from_files, write_game_svg_and_html
+
+
+GAME_ID = '2017-11-01-HOU-LAD-1'
+GAME_DIR_PATH = join('2017', 'month_11', 'day_01',
+                     'gid_2017_11_01_houmlb_lanmlb_1')
+
+
+def read_bytes(output_dir, filename):
+    with open(join(output_dir, filename), 'rb') as filehandle:
+        return filehandle.read()
+
+def write_game(gameday_dir, tmp_path, svg_format):
+    game_dir = join(gameday_dir, GAME_DIR_PATH)
+    game = get_game_from_files(join(game_dir, 'boxscore.xml'),
+                               join(game_dir, 'players.xml'),
+                               join(game_dir, 'inning', 'inning_all.xml'))
+
+    output_dir = tmp_path / svg_format
+    output_dir.mkdir()
+    write_game_svg_and_html(GAME_ID, game, str(output_dir), svg_format)
+
+    return str(output_dir), game
+
+def test_compressed_svg_matches_plain_svg(gameday_dir, tmp_path):
+    svg_output_dir, game = write_game(gameday_dir, tmp_path, 'svg')
+    svg_bytes = read_bytes(svg_output_dir, GAME_ID + '.svg')
+    html_bytes = read_bytes(svg_output_dir, GAME_ID + '.html')
+    assert svg_bytes == game.get_svg_str().encode('utf-8')
+    assert 'data="{}.svg"'.format(GAME_ID).encode() in html_bytes
+
+    svgz_output_dir, _ = write_game(gameday_dir, tmp_path, 'svgz')
+    assert sorted(listdir(svgz_output_dir)) == [GAME_ID + '.html',
+                                                GAME_ID + '.svgz']
+
+    assert decompress(read_bytes(svgz_output_dir,
+                                 GAME_ID + '.svgz')) == svg_bytes
+
+    assert read_bytes(svgz_output_dir, GAME_ID + '.html') == (
+        html_bytes.replace(b'.svg"', b'.svgz"')
+    )
+
+    gz_output_dir, _ = write_game(gameday_dir, tmp_path, 'svg.gz')
+    assert sorted(listdir(gz_output_dir)) == [GAME_ID + '.html',
+                                              GAME_ID + '.html.gz',
+                                              GAME_ID + '.svg',
+                                              GAME_ID + '.svg.gz']
+
+    assert read_bytes(gz_output_dir, GAME_ID + '.svg') == svg_bytes
+    assert decompress(read_bytes(gz_output_dir,
+                                 GAME_ID + '.svg.gz')) == svg_bytes
+
+    assert read_bytes(gz_output_dir, GAME_ID + '.html') == html_bytes
+    assert decompress(read_bytes(gz_output_dir,
+                                 GAME_ID + '.html.gz')) == html_bytes
@@ -0,0 +1,68 @@
+from multiprocessing import active_children
+from os import getpid, listdir
+
+from baseball.fetch_game import (WorkerPool,
+                                 get_game_generator_from_file_range,
+                                 get_game_list_from_file_range,
+                                 write_svg_from_file_range)
+from baseball.game_cache import disable_game_cache, enable_game_cache
+
+
+CALL_COUNT = 3
+
+
+def get_worker_pid(_):
+    return getpid()
+
+def get_active_child_pid_list():
+    return [process.pid for process in active_children()]
+
+def test_calls_without_a_pool_leave_no_processes(gameday_dir, tmp_path):
+    assert not active_children()
+    for _ in range(CALL_COUNT):
+        game_tuple_list = get_game_list_from_file_range('2017-11-01',
+                                                        '2017-11-02',
+                                                        gameday_dir)
+
+        write_svg_from_file_range('2017-11-01', '2017-11-02', gameday_dir,
+                                  str(tmp_path))
+
+        game_tuple_list += list(
+            get_game_generator_from_file_range('2017-11-01', '2017-11-02',
+                                               gameday_dir, num_processes=2)
+        )
+
+        assert len(game_tuple_list) == 4
+        assert not active_children()
+
+def test_shared_pool_keeps_its_workers(gameday_dir, tmp_path):
+    with WorkerPool(2) as worker_pool:
+        worker_pid_set = set(get_active_child_pid_list())
+        assert len(worker_pid_set) == 2
+        for _ in range(CALL_COUNT):
+            get_game_list_from_file_range('2017-11-01', '2017-11-02',
+                                          gameday_dir, worker_pool)
+
+            write_svg_from_file_range('2017-11-01', '2017-11-02',
+                                      gameday_dir, str(tmp_path),
+                                      worker_pool=worker_pool)
+
+            assert set(get_active_child_pid_list()) == worker_pid_set
+            assert set(worker_pool.map(get_worker_pid, range(8))) <= (
+                worker_pid_set
+            )
+
+    assert not active_children()
+
+def test_pool_sees_cache_settings_made_after_it_started(gameday_dir,
+                                                        tmp_path):
+    cache_dir = str(tmp_path / 'game_cache')
+    with WorkerPool(2) as worker_pool:
+        enable_game_cache(cache_dir)
+        try:
+            get_game_list_from_file_range('2017-11-01', '2017-11-02',
+                                          gameday_dir, worker_pool)
+        finally:
+            disable_game_cache()
+
+    assert len(listdir(cache_dir)) == 2